@@ -48,6 +48,7 @@ class TemporalConfig:
     # Compiled patterns for efficiency
     _compiled_patterns = None
     _combined_pattern = None
+    _keyword_scanner = None
     
     @classmethod
     def get_compiled_patterns(cls) -> List[re.Pattern]:
@@ -68,6 +69,20 @@ class TemporalConfig:
             cls._combined_pattern = re.compile(combined, re.IGNORECASE)
         return cls._combined_pattern
     
+    @classmethod
+    def get_keyword_scanner(cls) -> re.Pattern:
+        """
+        Get a single-pass scanner for all keyword patterns (cached).
+        
+        The alternation sits inside a zero-width lookahead, so finditer tries
+        every start position and group(1) reports matches that overlap, e.g.
+        both "right now" and "now".
+        """
+        if cls._keyword_scanner is None:
+            alternation = '|'.join(f'(?:{p})' for p in cls.TEMPORAL_KEYWORDS)
+            cls._keyword_scanner = re.compile(f'(?=({alternation}))', re.IGNORECASE)
+        return cls._keyword_scanner
+    
     @classmethod
     def get_current_year(cls) -> int:
         """Get current year for temporal detection."""
@@ -183,7 +198,17 @@ class Settings(BaseSettings):
     tavily_api_key: str = Field(default="", env="TAVILY_API_KEY")
     serper_api_key: str = Field(default="", env="SERPER_API_KEY")
     search_result_cache_ttl_hours: int = Field(default=24, env="SEARCH_RESULT_CACHE_TTL_HOURS")
+    # Expired results are still served (and refreshed in the background) for this long
+    search_swr_window_hours: int = Field(default=1, env="SEARCH_SWR_WINDOW_HOURS")
+    # "memory" (per worker) or "redis" (shared; needs REDIS_URL)
+    search_cache_backend: str = Field(default="memory", env="SEARCH_CACHE_BACKEND")
+    # Treat queries with the same words in any order as one cache entry
+    search_cache_order_insensitive: bool = Field(default=False, env="SEARCH_CACHE_ORDER_INSENSITIVE")
+    redis_url: str = Field(default="", env="REDIS_URL")
     search_max_results: int = Field(default=5, env="SEARCH_MAX_RESULTS")
+    # How long the preferred provider gets before the next one is raced against
+    # it; above typical Tavily "advanced" latency so healthy calls aren't doubled
+    search_hedge_delay_seconds: float = Field(default=3.0, env="SEARCH_HEDGE_DELAY_SECONDS")
     
     # Perplexity API Configuration
     perplexity_api_key: str = Field(default="", env="PERPLEXITY_API_KEY")
@@ -198,6 +223,9 @@ class Settings(BaseSettings):
     time_travel_max_snapshots: int = Field(default=5, env="TIME_TRAVEL_MAX_SNAPSHOTS")
     time_travel_sensitivity_threshold: float = Field(default=0.7, env="TIME_TRAVEL_SENSITIVITY_THRESHOLD")
     time_travel_include_future: bool = Field(default=False, env="TIME_TRAVEL_INCLUDE_FUTURE")
+    # Start the streamed narrative before the last snapshots finish
+    time_travel_speculative_narrative: bool = Field(default=True, env="TIME_TRAVEL_SPECULATIVE_NARRATIVE")
+    time_travel_narrative_model: str = Field(default="gpt-4o-mini", env="TIME_TRAVEL_NARRATIVE_MODEL")
     
     class Config:
         env_file = ".env"
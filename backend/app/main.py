@@ -8,14 +8,19 @@ from datetime import datetime
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from .config import get_settings
 from .routes import ensemble_router, health_router
 from .routes.router import router as router_router
 from .routes.monitoring import router as monitoring_router
 from .routes.streaming import router as streaming_router
+from .services.perplexity_service import perplexity_service
+from .services.search_service import search_service
+from .services.time_travel_service import time_travel_service
+from .services._http import HTTP2_AVAILABLE, aclose_shared_http_client
 from .utils.logging import get_logger, setup_logging
+from .utils.serialization import HAS_ORJSON
 
 # Setup logging
 setup_logging()
@@ -35,11 +40,16 @@ async def lifespan(app: FastAPI):
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Cache enabled: {settings.cache_enabled}")
     logger.info(f"API key configured: {settings.validate_api_key()}")
+    logger.info(f"OpenAI HTTP/2: {'enabled' if HTTP2_AVAILABLE else 'unavailable (h2 not installed)'}")
     
     yield
     
     # Shutdown
     logger.info("Shutting down LLM Ensemble API")
+    await perplexity_service.aclose()
+    await search_service.aclose()
+    await time_travel_service.aclose()
+    await aclose_shared_http_client()
 
 
 # Create FastAPI application
@@ -53,6 +63,8 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson is optional; ORJSONResponse needs it at render time
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
 )
 
 # Configure CORS
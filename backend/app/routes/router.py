@@ -137,7 +137,8 @@ async def get_routing_stats() -> RoutingStats:
             total_savings=stats["total_savings"],
             average_savings_percentage=stats["average_savings_percentage"],
             model_usage_distribution=stats["model_usage_distribution"],
-            fallback_count=stats["fallback_count"]
+            fallback_count=stats["fallback_count"],
+            answer_cache_hits=stats["answer_cache_hits"]
         )
     except Exception as e:
         logger.error(f"Error getting routing stats: {e}")
@@ -165,6 +166,24 @@ async def clear_classification_cache():
         )
 
 
+@router.post(
+    "/clear-answer-cache",
+    summary="Clear Answer Cache",
+    description="Clears the cached answers for non time-sensitive queries."
+)
+async def clear_answer_cache():
+    """Clear the answer cache."""
+    try:
+        router_service.clear_answer_cache()
+        return {"message": "Answer cache cleared", "timestamp": datetime.utcnow()}
+    except Exception as e:
+        logger.error(f"Error clearing cache: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
 # ==================== Time-Travel Answers Endpoint ====================
 
 @router.post(
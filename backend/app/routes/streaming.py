@@ -7,6 +7,7 @@ of time-travel results.
 
 import asyncio
 import json
+import time
 from datetime import datetime
 from typing import AsyncGenerator
 
@@ -32,24 +33,90 @@ class StreamingTimeTravelRequest(BaseModel):
     force_time_travel: bool = Field(default=False)
 
 
+# How long a non-critical event waits for others to share its write
+SSE_BATCH_WINDOW_S = 0.005
+
+# Idle time after which a heartbeat is written so proxies keep the stream open
+HEARTBEAT_INTERVAL_S = 10.0
+
+# Events buffered between the service and the HTTP writer
+SSE_WRITE_QUEUE_SIZE = 256
+
+# Events written out as soon as they are produced, never held for batching
+FLUSH_EVENT_TYPES = frozenset({
+    StreamEventType.START,
+    StreamEventType.COMPLETE,
+    StreamEventType.ERROR,
+})
+
+
 async def event_generator(
     question: str,
     force: bool = False
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Generate SSE events from the streaming time-travel service.
     
-    Yields SSE-formatted strings that can be consumed by EventSource.
+    The service runs in a producer task that feeds a queue; this generator
+    is the single writer. Events that arrive within SSE_BATCH_WINDOW_S of
+    each other are joined into one chunk so bursts (answer deltas, insights)
+    go out as one write instead of many tiny ones. If nothing is produced
+    for HEARTBEAT_INTERVAL_S, a heartbeat is written instead.
+    
+    Yields encoded SSE frames that can be consumed by EventSource.
     """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_WRITE_QUEUE_SIZE)
+    
+    async def produce():
+        try:
+            async for event in streaming_time_travel_service.stream_time_travel(
+                question=question,
+                force=force
+            ):
+                await queue.put(event)
+        except Exception as e:
+            logger.error(f"Stream error: {e}")
+            await queue.put(StreamEvent(
+                type=StreamEventType.ERROR,
+                data={"error": str(e), "recoverable": False}
+            ))
+        # Not in a finally: once cancelled the writer is gone, and waiting
+        # for room in a full queue would never return
+        await queue.put(None)
+    
+    producer = asyncio.create_task(produce())
+    started = time.monotonic()
+    
     try:
-        async for event in streaming_time_travel_service.stream_time_travel(
-            question=question,
-            force=force
-        ):
-            yield event.to_sse()
+        finished = False
+        while not finished:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL_S)
+            except asyncio.TimeoutError:
+                yield StreamEvent(
+                    type=StreamEventType.HEARTBEAT,
+                    data={"elapsed_ms": round((time.monotonic() - started) * 1000)}
+                ).to_sse_bytes()
+                continue
+            if event is None:
+                break
             
-            # Small delay to prevent overwhelming the client
-            await asyncio.sleep(0.01)
+            batch = [event]
+            if event.type not in FLUSH_EVENT_TYPES:
+                await asyncio.sleep(SSE_BATCH_WINDOW_S)
+                while True:
+                    try:
+                        event = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if event is None:
+                        finished = True
+                        break
+                    batch.append(event)
+                    if event.type in FLUSH_EVENT_TYPES:
+                        break
+            
+            yield b"".join(e.to_sse_bytes() for e in batch)
             
     except asyncio.CancelledError:
         # Client disconnected
@@ -57,14 +124,10 @@ async def event_generator(
         yield StreamEvent(
             type=StreamEventType.ERROR,
             data={"error": "Stream cancelled", "recoverable": False}
-        ).to_sse()
-        
-    except Exception as e:
-        logger.error(f"Stream error: {e}")
-        yield StreamEvent(
-            type=StreamEventType.ERROR,
-            data={"error": str(e), "recoverable": False}
-        ).to_sse()
+        ).to_sse_bytes()
+    
+    finally:
+        producer.cancel()
 
 
 @router.post(
@@ -81,11 +144,13 @@ async def event_generator(
     **Event Types:**
     - `start` - Stream started, initial metadata
     - `classification` - Question complexity classified
+    - `snapshot_delta` - Answer text for a time point as it is generated (many events)
     - `snapshot` - A single time-point answer (multiple events)
     - `narrative` - Evolution narrative generated
-    - `insight` - Individual insights (multiple events)
+    - `insight` - All insights from the narrative (one event)
     - `timing` - Final timing breakdown
-    - `complete` - Stream complete with full data
+    - `complete` - Stream complete with totals (clients keep the snapshots,
+      narrative and insights from the earlier events)
     - `error` - Error occurred (may be recoverable)
     - `heartbeat` - Keep-alive during long operations
     
@@ -165,13 +230,13 @@ async def test_stream():
                 type=StreamEventType.HEARTBEAT,
                 data={"message": f"Test event {i + 1}/5", "index": i + 1}
             )
-            yield event.to_sse()
+            yield event.to_sse_bytes()
             await asyncio.sleep(1)
         
         yield StreamEvent(
             type=StreamEventType.COMPLETE,
             data={"message": "Test complete", "success": True}
-        ).to_sse()
+        ).to_sse_bytes()
     
     return StreamingResponse(
         test_generator(),
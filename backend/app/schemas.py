@@ -278,6 +278,9 @@ class RouteAndAnswerResponse(BaseModel):
     timestamp: datetime
     fallback_used: bool = False
     fallback_reason: Optional[str] = None
+    # True when the caller fixed models and synthesis, so the query was not
+    # classified and classification only carries the request's own settings
+    classification_skipped: bool = False
     # Temporal/Search fields
     temporal_detection: Optional[TemporalDetectionResult] = None
     was_search_used: bool = False
@@ -306,6 +309,7 @@ class RoutingStats(BaseModel):
     average_savings_percentage: float
     model_usage_distribution: Dict[str, int]
     fallback_count: int
+    answer_cache_hits: int = 0
 
 
 # ==================== Time-Travel Answer Schemas ====================
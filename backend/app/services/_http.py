@@ -0,0 +1,40 @@
+"""
+Shared HTTP connection pool for OpenAI clients.
+
+Services that talk to the OpenAI API pass this client to AsyncOpenAI so they
+reuse one set of keep-alive connections instead of each holding their own.
+"""
+
+import importlib.util
+from typing import Optional
+
+import httpx
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get the shared pool, creating it on first use or after it was closed."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=30,
+                keepalive_expiry=300,
+            ),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+    return _shared_client
+
+
+async def aclose_shared_http_client():
+    """Close the shared pool (called on application shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
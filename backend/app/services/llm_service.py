@@ -4,6 +4,7 @@ Handles parallel API calls, retries, and error handling.
 """
 
 import asyncio
+import statistics
 import time
 from datetime import datetime
 from typing import List, Optional, Dict, Any
@@ -219,17 +220,7 @@ class LLMService:
         for i, response in enumerate(responses):
             if isinstance(response, Exception):
                 # Convert exception to error response
-                results.append(ModelResponse(
-                    model_name=models[i],
-                    response_text="",
-                    tokens_used=TokenUsage(),
-                    cost_estimate=0.0,
-                    response_time_seconds=0.0,
-                    timestamp=datetime.utcnow(),
-                    cache_status=CacheStatus.MISS,
-                    error=str(response),
-                    success=False,
-                ))
+                results.append(self._error_response(models[i], str(response)))
             else:
                 results.append(response)
         
@@ -238,6 +229,98 @@ class LLMService:
         
         return results
     
+    async def call_models_with_tail_cutoff(
+        self,
+        models: List[str],
+        question: str,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        use_cache: bool = True,
+        min_responses: int = 2,
+        tail_factor: float = 0.3,
+        min_tail_seconds: float = 1.0,
+    ) -> List[ModelResponse]:
+        """
+        Call multiple models in parallel without always waiting for the slowest.
+        
+        Responses are collected as they complete. Once min_responses have
+        succeeded, the stragglers get a grace period of tail_factor times the
+        median successful response time (at least min_tail_seconds); any still
+        running after that are cancelled and reported as failed.
+        
+        Args:
+            models: List of model IDs to call
+            question: The question to ask all models
+            max_tokens: Maximum tokens per response
+            temperature: Temperature for generation
+            use_cache: Whether to use caching
+            min_responses: Successful responses needed before the tail deadline starts
+            tail_factor: Grace period as a fraction of the median response time
+            min_tail_seconds: Lower bound on the grace period
+            
+        Returns:
+            List of ModelResponse objects, in the same order as models
+        """
+        logger.info(f"Calling {len(models)} models in parallel with tail cutoff: {models}")
+        
+        task_models = {
+            asyncio.create_task(
+                self.call_model(model, question, max_tokens, temperature, use_cache)
+            ): model
+            for model in models
+        }
+        by_model: Dict[str, ModelResponse] = {}
+        pending = set(task_models)
+        deadline: Optional[float] = None
+        
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break  # Tail deadline passed
+                for task in done:
+                    model = task_models[task]
+                    if task.exception() is not None:
+                        by_model[model] = self._error_response(model, str(task.exception()))
+                    else:
+                        by_model[model] = task.result()
+                
+                successful = [r for r in by_model.values() if r.success]
+                if deadline is None and pending and len(successful) >= min_responses:
+                    median = statistics.median(r.response_time_seconds for r in successful)
+                    deadline = time.perf_counter() + max(min_tail_seconds, tail_factor * median)
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        for task in pending:
+            model = task_models[task]
+            logger.info(f"Cancelled straggler {model} after tail deadline")
+            by_model[model] = self._error_response(model, "Cancelled: exceeded tail deadline")
+        
+        results = [by_model[model] for model in models]
+        successful_count = sum(1 for r in results if r.success)
+        logger.info(f"Parallel calls complete: {successful_count}/{len(models)} successful")
+        return results
+    
+    @staticmethod
+    def _error_response(model: str, error: str) -> ModelResponse:
+        """Build a failed ModelResponse for a model that produced no answer."""
+        return ModelResponse(
+            model_name=model,
+            response_text="",
+            tokens_used=TokenUsage(),
+            cost_estimate=0.0,
+            response_time_seconds=0.0,
+            timestamp=datetime.utcnow(),
+            cache_status=CacheStatus.MISS,
+            error=error,
+            success=False,
+        )
+    
     def get_available_models(self) -> List[Dict[str, Any]]:
         """Get list of available models."""
         return ModelConfig.get_available_models()
@@ -92,11 +92,24 @@ class PerplexityService:
         """Initialize the Perplexity service."""
         self.settings = get_settings()
         self._api_key = getattr(self.settings, 'perplexity_api_key', None)
+        self._client: Optional[httpx.AsyncClient] = None
     
     def is_configured(self) -> bool:
         """Check if Perplexity API is configured."""
         return bool(self._api_key)
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30.0)
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def search(
         self,
         query: str,
@@ -155,14 +168,13 @@ class PerplexityService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.PERPLEXITY_API_URL,
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                result = response.json()
+            response = await self._get_client().post(
+                self.PERPLEXITY_API_URL,
+                headers=headers,
+                json=payload,
+            )
+            response.raise_for_status()
+            result = response.json()
             
             elapsed_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
             
@@ -7,11 +7,13 @@ Uses Perplexity API for real-time web search + reasoning on temporal queries.
 """
 
 import asyncio
-import json
 import re
 import time
 import hashlib
-from datetime import datetime, timedelta
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, List, Any, Tuple
 from openai import AsyncOpenAI
 
@@ -23,7 +25,9 @@ from ..schemas import (
     RouteAndAnswerResponse
 )
 from ..utils.logging import get_logger
-from ..utils.cache import cache_manager
+from ..utils.cache import cache_manager, TTLCache
+from ..utils.serialization import json_loads, JSONDecodeError
+from ..utils.singleflight import SingleFlight
 from .llm_service import llm_service
 from .synthesis_service import synthesis_service
 from .search_service import search_service
@@ -32,19 +36,111 @@ from .perplexity_service import perplexity_service
 logger = get_logger(__name__)
 
 
-# Classification cache with 24-hour TTL
-_classification_cache: Dict[str, Tuple[QueryClassification, datetime]] = {}
+# Classification caches. Temporal queries get a short TTL because the right
+# routing for "latest"/"this year" questions drifts; evergreen ones keep 24h.
 CLASSIFICATION_CACHE_TTL = timedelta(hours=24)
+TEMPORAL_CLASSIFICATION_CACHE_TTL = timedelta(hours=1)
+_classification_cache = TTLCache(maxsize=16384, ttl=CLASSIFICATION_CACHE_TTL.total_seconds())
+_temporal_classification_cache = TTLCache(
+    maxsize=4096, ttl=TEMPORAL_CLASSIFICATION_CACHE_TTL.total_seconds()
+)
+
+ClassificationCacheKey = Tuple[str, str, Tuple[int, ...]]
+
+# Exact-match answer cache for route_and_answer, keyed on question + routing params
+ANSWER_CACHE_TTL = timedelta(hours=24)
+_answer_cache = TTLCache(maxsize=10_000, ttl=ANSWER_CACHE_TTL.total_seconds())
+
+# Routing stats counter for each complexity level
+_COMPLEXITY_STAT_KEYS: Dict[ComplexityLevel, str] = {
+    ComplexityLevel.SIMPLE: "simple_queries",
+    ComplexityLevel.MODERATE: "moderate_queries",
+    ComplexityLevel.COMPLEX: "complex_queries",
+}
+
 
+@dataclass(slots=True)
+class _PhaseTimes:
+    """Per-stage route_and_answer durations in perf_counter_ns nanoseconds."""
+    temporal_detection: int = 0
+    classification: int = 0
+    search: int = 0
+    model_execution: int = 0
+    synthesis: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ModelProfile:
+    """Static pricing and latency profile for a routable model."""
+    input_cost: float   # USD per 1K input tokens
+    output_cost: float  # USD per 1K output tokens
+    latency_s: float    # Typical response time, used for routing estimates
+
+
+MODEL_PROFILES: Dict[str, ModelProfile] = {
+    "gpt-4o-mini": ModelProfile(input_cost=0.00015, output_cost=0.0006, latency_s=1.5),
+    "gpt-4o": ModelProfile(input_cost=0.0025, output_cost=0.0075, latency_s=3.0),
+    "gpt-4-turbo": ModelProfile(input_cost=0.01, output_cost=0.03, latency_s=5.0),
+    "gpt-5.2": ModelProfile(input_cost=0.02, output_cost=0.06, latency_s=4.0),
+}
 
-# Cost per 1K tokens (input/output)
+# Cost per 1K tokens (input/output), kept for callers that read the dict form
 MODEL_COSTS = {
-    "gpt-4o-mini": {"input": 0.00015, "output": 0.0006},
-    "gpt-4o": {"input": 0.0025, "output": 0.0075},
-    "gpt-4-turbo": {"input": 0.01, "output": 0.03},
-    "gpt-5.2": {"input": 0.02, "output": 0.06},
+    name: {"input": p.input_cost, "output": p.output_cost}
+    for name, p in MODEL_PROFILES.items()
 }
 
+# Parallel per-model columns; _MODEL_IDX maps a model name to its row
+_MODEL_IDX: Dict[str, int] = {name: i for i, name in enumerate(MODEL_PROFILES)}
+_INPUT_COSTS: List[float] = [p.input_cost for p in MODEL_PROFILES.values()]
+_OUTPUT_COSTS: List[float] = [p.output_cost for p in MODEL_PROFILES.values()]
+_LATENCIES: List[float] = [p.latency_s for p in MODEL_PROFILES.values()]
+DEFAULT_MODEL_LATENCY_S = 3.0
+DEFAULT_SYNTHESIS_LATENCY_S = 4.0
+
+# Models used when routing is bypassed; the savings baseline
+FULL_ENSEMBLE_MODELS = ("gpt-4-turbo", "gpt-4o", "gpt-4o-mini")
+
+# Preferred source of the final answer when there is no synthesis
+RESPONSE_PRIORITY = ("gpt-4-turbo", "gpt-4o", "gpt-4o-mini")
+
+# Grace period for the last ensemble model, as a fraction of the median
+# response time of the others, before synthesis proceeds without it
+STRAGGLER_TAIL_FACTOR = 0.3
+
+# Token budget assumed when estimating a route before execution
+AVG_INPUT_TOKENS = 500
+AVG_OUTPUT_TOKENS = 1000
+SYNTHESIS_PROMPT_TOKENS = 500
+SYNTHESIS_OUTPUT_TOKENS = 800
+
+# Cost of one average model call, indexed like the columns above
+_AVG_CALL_COST: List[float] = [
+    (AVG_INPUT_TOKENS * inp + AVG_OUTPUT_TOKENS * out) / 1000
+    for inp, out in zip(_INPUT_COSTS, _OUTPUT_COSTS)
+]
+
+# Whole-word markers that a query explicitly wants current information
+_CURRENT_DATA_SET = frozenset({
+    "latest", "current", "today", "now", "2024", "2025", "2026", "2027", "breaking", "trending",
+})
+_WORD_RE = re.compile(r"\w+")
+_YEAR_RE = re.compile(r'\b(20[2-3]\d)\b')  # 2020-2039
+
+# Parsed once; the cutoff is static configuration
+_KNOWLEDGE_CUTOFF_YEAR = int(TemporalConfig.MODEL_KNOWLEDGE_CUTOFF.split("-")[0])
+
+
+@lru_cache(maxsize=1)
+def _year_for_hour(hour_bucket: int) -> int:
+    """Calendar year, recomputed at most once per hour bucket."""
+    return datetime.now().year
+
+
+def _current_year() -> int:
+    """Current calendar year without a datetime call on every query."""
+    return _year_for_hour(int(time.time() // 3600))
+
 
 def detect_temporal_query(question: str) -> TemporalDetectionResult:
     """
@@ -61,34 +157,28 @@ def detect_temporal_query(question: str) -> TemporalDetectionResult:
         TemporalDetectionResult with detection details
     """
     question_lower = question.lower()
-    matched_keywords: List[str] = []
+    # Insertion-ordered set: deduplicates as it scans and keeps match order
+    seen_keywords: Dict[str, None] = {}
     detected_years: List[int] = []
     
-    # Layer 1: Keyword scanning using individual patterns
-    for pattern in TemporalConfig.get_compiled_patterns():
-        matches = pattern.findall(question_lower)
-        if matches:
-            # Flatten if matches are tuples and filter empty strings
-            for match in matches:
-                if isinstance(match, tuple):
-                    matched_keywords.extend([m for m in match if m])
-                elif match:
-                    matched_keywords.append(match)
+    # Layer 1: Keyword scanning in a single pass over the question
+    for m in TemporalConfig.get_keyword_scanner().finditer(question_lower):
+        keyword = m.group(1).strip()
+        if keyword:
+            seen_keywords[keyword] = None
     
-    # Deduplicate and clean keywords
-    matched_keywords = list(set(kw.strip() for kw in matched_keywords if kw.strip()))
+    matched_keywords = list(seen_keywords)
     
     # Layer 2: Year detection
-    year_pattern = re.compile(r'\b(20[2-3]\d)\b')  # 2020-2039
-    year_matches = year_pattern.findall(question)
+    year_matches = _YEAR_RE.findall(question)
     detected_years = [int(y) for y in year_matches]
     
     # Determine if temporal
-    current_year = datetime.now().year
-    knowledge_cutoff_year = int(TemporalConfig.MODEL_KNOWLEDGE_CUTOFF.split("-")[0])
+    current_year = _current_year()
+    knowledge_cutoff_year = _KNOWLEDGE_CUTOFF_YEAR
     
     is_temporal = bool(matched_keywords) or any(y > knowledge_cutoff_year for y in detected_years)
-    requires_current_data = any(kw in question_lower for kw in ["latest", "current", "today", "now", "2024", "2025", "2026", "2027", "breaking", "trending"])
+    requires_current_data = not _CURRENT_DATA_SET.isdisjoint(_WORD_RE.findall(question_lower))
     
     # Layer 3: Determine scope
     if not is_temporal:
@@ -131,8 +221,46 @@ def detect_temporal_query(question: str) -> TemporalDetectionResult:
     )
 
 
+@lru_cache(maxsize=10_000)
+def _detect_temporal_for_hour(question: str, hour_bucket: int) -> TemporalDetectionResult:
+    """Memoized detection; the hour bucket keeps year-relative scopes fresh."""
+    return detect_temporal_query(question)
+
+
+def detect_temporal_query_cached(question: str) -> TemporalDetectionResult:
+    """
+    Memoized detect_temporal_query for repeated questions.
+    
+    Results depend on the current year, so entries are keyed per hour.
+    Each caller gets its own deep copy, so mutating its keyword or year
+    lists cannot leak into the cached entry.
+    """
+    return _detect_temporal_for_hour(question, int(time.time() // 3600)).model_copy(deep=True)
+
+
+# Temporal detections at or above this confidence that also need current data are
+# classified by rules alone; the LLM verdict would be overridden by them anyway.
+TEMPORAL_SHORTCUT_CONFIDENCE = 0.9
+
+# Keyword buckets for rule-based domain classification, checked in order
+_DOMAIN_KEYWORDS: List[Tuple[QueryDomain, frozenset]] = [
+    (QueryDomain.CODING, frozenset({
+        "code", "coding", "python", "javascript", "typescript", "java", "rust", "api",
+        "framework", "library", "programming", "bug", "debug", "github", "react",
+    })),
+    (QueryDomain.RESEARCH, frozenset({
+        "research", "study", "studies", "paper", "papers", "breakthrough", "breakthroughs",
+        "discovery", "discoveries", "scientists",
+    })),
+    (QueryDomain.TECHNICAL, frozenset({
+        "ai", "llm", "gpt", "tech", "technology", "software", "hardware", "chip", "chips",
+        "gpu", "science", "engineering", "model", "models",
+    })),
+]
+
+
 # Classification prompt with comprehensive examples
-CLASSIFICATION_PROMPT = """You are an expert query classifier for an AI assistant system. Your task is to analyze incoming queries and classify them to route them to the optimal AI models.
+_CLASSIFICATION_INSTRUCTIONS = """You are an expert query classifier for an AI assistant system. Your task is to analyze incoming queries and classify them to route them to the optimal AI models.
 
 IMPORTANT MODEL KNOWLEDGE CUTOFF: All models have knowledge only up to October 2023. Any query asking about events, data, or information after this date REQUIRES web search.
 
@@ -173,72 +301,75 @@ Note: For temporal queries requiring search, recommend at least 2 models to cros
 
 ## EXAMPLES
 
-Query: "What is the capital of France?"
-Classification: {{"complexity": "simple", "intent": "factual", "domain": "general", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Simple factual lookup with a single definitive answer.", "confidence": 0.98}}
-
-Query: "Write a haiku about autumn leaves"
-Classification: {{"complexity": "simple", "intent": "creative", "domain": "creative", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Simple creative task with clear constraints.", "confidence": 0.95}}
-
-Query: "What are the latest AI breakthroughs in 2026?"
-Classification: {{"complexity": "complex", "intent": "factual", "domain": "research", "requires_search": true, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "TEMPORAL QUERY: Asks about 2026 which is after model knowledge cutoff (Oct 2023). Requires web search for current information. Using all models to synthesize and validate search results.", "confidence": 0.95}}
-
-Query: "What's trending in tech right now?"
-Classification: {{"complexity": "moderate", "intent": "factual", "domain": "technical", "requires_search": true, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "TEMPORAL QUERY: 'trending' and 'right now' indicate need for current data beyond knowledge cutoff. Requires search.", "confidence": 0.92}}
-
-Query: "Explain how photosynthesis works"
-Classification: {{"complexity": "moderate", "intent": "analytical", "domain": "technical", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Requires explanation of a multi-step biological process.", "confidence": 0.92}}
-
-Query: "Compare React vs Vue for a new web project"
-Classification: {{"complexity": "moderate", "intent": "comparative", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Comparative analysis requiring knowledge of both frameworks.", "confidence": 0.90}}
-
-Query: "How do I make pasta carbonara?"
-Classification: {{"complexity": "simple", "intent": "procedural", "domain": "general", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Straightforward recipe/procedure request.", "confidence": 0.96}}
-
-Query: "Debug this Python code that's throwing a TypeError"
-Classification: {{"complexity": "moderate", "intent": "procedural", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Debugging requires analysis but is typically methodical.", "confidence": 0.88}}
-
-Query: "Design a microservices architecture for an e-commerce platform"
-Classification: {{"complexity": "complex", "intent": "analytical", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Complex architectural design requiring deep expertise and multiple considerations.", "confidence": 0.94}}
-
-Query: "What's the weather in New York today?"
-Classification: {{"complexity": "moderate", "intent": "factual", "domain": "general", "requires_search": true, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "TEMPORAL QUERY: 'today' requires real-time weather data. Must use search.", "confidence": 0.97}}
-
-Query: "What are the current stock prices for NVIDIA?"
-Classification: {{"complexity": "moderate", "intent": "factual", "domain": "general", "requires_search": true, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "TEMPORAL QUERY: 'current' stock prices change constantly and require real-time data.", "confidence": 0.96}}
-
-Query: "Analyze the themes in Shakespeare's Hamlet"
-Classification: {{"complexity": "complex", "intent": "analytical", "domain": "research", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Deep literary analysis requiring nuanced interpretation.", "confidence": 0.91}}
-
-Query: "Write a 2000-word short story about a time traveler"
-Classification: {{"complexity": "complex", "intent": "creative", "domain": "creative", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Extended creative writing requiring sustained narrative quality.", "confidence": 0.93}}
-
-Query: "What is 25 * 4?"
-Classification: {{"complexity": "simple", "intent": "factual", "domain": "general", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Simple arithmetic calculation.", "confidence": 0.99}}
-
-Query: "Explain the ethical implications of AI in healthcare"
-Classification: {{"complexity": "complex", "intent": "analytical", "domain": "research", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Complex topic requiring multi-perspective ethical analysis.", "confidence": 0.92}}
-
-Query: "Convert this JSON to TypeScript interfaces"
-Classification: {{"complexity": "moderate", "intent": "procedural", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Structured transformation task with clear input/output.", "confidence": 0.94}}
+"""
 
-Query: "What are the best practices for REST API design?"
-Classification: {{"complexity": "moderate", "intent": "factual", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Well-established knowledge but requires comprehensive coverage.", "confidence": 0.91}}
+# Few-shot examples. Those with requires_search=true teach temporal handling and
+# are only sent when the query itself shows temporal signals.
+_CLASSIFICATION_EXAMPLES = [
+    """Query: "What is the capital of France?"
+Classification: {{"complexity": "simple", "intent": "factual", "domain": "general", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Simple factual lookup with a single definitive answer.", "confidence": 0.98}}""",
+    """Query: "Write a haiku about autumn leaves"
+Classification: {{"complexity": "simple", "intent": "creative", "domain": "creative", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Simple creative task with clear constraints.", "confidence": 0.95}}""",
+    """Query: "What are the latest AI breakthroughs in 2026?"
+Classification: {{"complexity": "complex", "intent": "factual", "domain": "research", "requires_search": true, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "TEMPORAL QUERY: Asks about 2026 which is after model knowledge cutoff (Oct 2023). Requires web search for current information. Using all models to synthesize and validate search results.", "confidence": 0.95}}""",
+    """Query: "What's trending in tech right now?"
+Classification: {{"complexity": "moderate", "intent": "factual", "domain": "technical", "requires_search": true, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "TEMPORAL QUERY: 'trending' and 'right now' indicate need for current data beyond knowledge cutoff. Requires search.", "confidence": 0.92}}""",
+    """Query: "Explain how photosynthesis works"
+Classification: {{"complexity": "moderate", "intent": "analytical", "domain": "technical", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Requires explanation of a multi-step biological process.", "confidence": 0.92}}""",
+    """Query: "Compare React vs Vue for a new web project"
+Classification: {{"complexity": "moderate", "intent": "comparative", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Comparative analysis requiring knowledge of both frameworks.", "confidence": 0.90}}""",
+    """Query: "How do I make pasta carbonara?"
+Classification: {{"complexity": "simple", "intent": "procedural", "domain": "general", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Straightforward recipe/procedure request.", "confidence": 0.96}}""",
+    """Query: "Debug this Python code that's throwing a TypeError"
+Classification: {{"complexity": "moderate", "intent": "procedural", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Debugging requires analysis but is typically methodical.", "confidence": 0.88}}""",
+    """Query: "Design a microservices architecture for an e-commerce platform"
+Classification: {{"complexity": "complex", "intent": "analytical", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Complex architectural design requiring deep expertise and multiple considerations.", "confidence": 0.94}}""",
+    """Query: "What's the weather in New York today?"
+Classification: {{"complexity": "moderate", "intent": "factual", "domain": "general", "requires_search": true, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "TEMPORAL QUERY: 'today' requires real-time weather data. Must use search.", "confidence": 0.97}}""",
+    """Query: "What are the current stock prices for NVIDIA?"
+Classification: {{"complexity": "moderate", "intent": "factual", "domain": "general", "requires_search": true, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "TEMPORAL QUERY: 'current' stock prices change constantly and require real-time data.", "confidence": 0.96}}""",
+    """Query: "Analyze the themes in Shakespeare's Hamlet"
+Classification: {{"complexity": "complex", "intent": "analytical", "domain": "research", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Deep literary analysis requiring nuanced interpretation.", "confidence": 0.91}}""",
+    """Query: "Write a 2000-word short story about a time traveler"
+Classification: {{"complexity": "complex", "intent": "creative", "domain": "creative", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Extended creative writing requiring sustained narrative quality.", "confidence": 0.93}}""",
+    """Query: "What is 25 * 4?"
+Classification: {{"complexity": "simple", "intent": "factual", "domain": "general", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Simple arithmetic calculation.", "confidence": 0.99}}""",
+    """Query: "Explain the ethical implications of AI in healthcare"
+Classification: {{"complexity": "complex", "intent": "analytical", "domain": "research", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Complex topic requiring multi-perspective ethical analysis.", "confidence": 0.92}}""",
+    """Query: "Convert this JSON to TypeScript interfaces"
+Classification: {{"complexity": "moderate", "intent": "procedural", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Structured transformation task with clear input/output.", "confidence": 0.94}}""",
+    """Query: "What are the best practices for REST API design?"
+Classification: {{"complexity": "moderate", "intent": "factual", "domain": "coding", "requires_search": false, "recommended_models": ["gpt-4o-mini", "gpt-4o"], "reasoning": "Well-established knowledge but requires comprehensive coverage.", "confidence": 0.91}}""",
+    """Query: "Help me understand quantum entanglement"
+Classification: {{"complexity": "complex", "intent": "analytical", "domain": "technical", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Complex physics concept requiring detailed explanation.", "confidence": 0.90}}""",
+    """Query: "Translate 'Hello' to Spanish"
+Classification: {{"complexity": "simple", "intent": "factual", "domain": "general", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Simple translation of a single word.", "confidence": 0.99}}""",
+    """Query: "What happened at CES 2025?"
+Classification: {{"complexity": "complex", "intent": "factual", "domain": "technical", "requires_search": true, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "TEMPORAL QUERY: CES 2025 is after knowledge cutoff (Oct 2023). Requires web search to get accurate information about this future event.", "confidence": 0.95}}""",
+]
 
-Query: "Help me understand quantum entanglement"
-Classification: {{"complexity": "complex", "intent": "analytical", "domain": "technical", "requires_search": false, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "Complex physics concept requiring detailed explanation.", "confidence": 0.90}}
+_CLASSIFICATION_RESPONSE_FORMAT = """Respond with ONLY a valid JSON object in this exact format:
+{{"complexity": "simple|moderate|complex", "intent": "factual|creative|analytical|procedural|comparative", "domain": "coding|technical|general|creative|research", "requires_search": true|false, "recommended_models": ["model1", "model2"], "reasoning": "explanation", "confidence": 0.0-1.0}}"""
 
-Query: "Translate 'Hello' to Spanish"
-Classification: {{"complexity": "simple", "intent": "factual", "domain": "general", "requires_search": false, "recommended_models": ["gpt-4o-mini"], "reasoning": "Simple translation of a single word.", "confidence": 0.99}}
+# Only the query varies per call; keeping it out of the system message leaves a
+# byte-identical prefix that OpenAI prompt caching can reuse.
+_CLASSIFICATION_USER_TEMPLATE = 'Now classify this query:\n\nQuery: "{question}"'
 
-Query: "What happened at CES 2025?"
-Classification: {{"complexity": "complex", "intent": "factual", "domain": "technical", "requires_search": true, "recommended_models": ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"], "reasoning": "TEMPORAL QUERY: CES 2025 is after knowledge cutoff (Oct 2023). Requires web search to get accurate information about this future event.", "confidence": 0.95}}
 
-Now classify this query:
+def _build_classification_system_prompt(include_temporal_examples: bool) -> str:
+    """Assemble the static classifier system prompt, optionally without temporal examples."""
+    examples = [
+        ex for ex in _CLASSIFICATION_EXAMPLES
+        if include_temporal_examples or '"requires_search": true' not in ex
+    ]
+    template = (_CLASSIFICATION_INSTRUCTIONS + "\n\n".join(examples) + "\n\n"
+                + _CLASSIFICATION_RESPONSE_FORMAT)
+    # Collapse the {{ }} escapes; the system prompt is never formatted per query
+    return template.format()
 
-Query: "{question}"
 
-Respond with ONLY a valid JSON object in this exact format:
-{{"complexity": "simple|moderate|complex", "intent": "factual|creative|analytical|procedural|comparative", "domain": "coding|technical|general|creative|research", "requires_search": true|false, "recommended_models": ["model1", "model2"], "reasoning": "explanation", "confidence": 0.0-1.0}}"""
+CLASSIFICATION_SYSTEM_PROMPT = _build_classification_system_prompt(include_temporal_examples=True)
+CLASSIFICATION_SYSTEM_PROMPT_EVERGREEN = _build_classification_system_prompt(include_temporal_examples=False)
 
 
 class RouterService:
@@ -250,6 +381,8 @@ class RouterService:
         self.client: Optional[AsyncOpenAI] = None
         self.classifier_model = "gpt-4o-mini"  # Fast and cheap for classification
         self._initialize_client()
+        self.reload_config()
+        self._inflight = SingleFlight()
         
         # Routing statistics
         self.stats = {
@@ -259,8 +392,9 @@ class RouterService:
             "complex_queries": 0,
             "total_cost": 0.0,
             "total_savings": 0.0,
-            "model_usage": {},
+            "model_usage": Counter(),
             "fallback_count": 0,
+            "answer_cache_hits": 0,
         }
     
     def _initialize_client(self):
@@ -275,28 +409,55 @@ class RouterService:
         else:
             logger.warning("Router service: API key not configured")
     
-    def _get_cache_key(self, question: str) -> str:
-        """Generate cache key for classification."""
-        return hashlib.sha256(question.lower().strip().encode()).hexdigest()
+    def _get_cache_key(
+        self,
+        question: str,
+        temporal_hint: Optional[TemporalDetectionResult] = None
+    ) -> ClassificationCacheKey:
+        """
+        Generate cache key for classification.
+        
+        The temporal scope and mentioned years are part of the key so that
+        temporal variants of the same wording never share an entry.
+        """
+        digest = hashlib.blake2b(question.lower().strip().encode(), digest_size=16).hexdigest()
+        if temporal_hint is None:
+            return digest, "none", ()
+        return (
+            digest,
+            temporal_hint.temporal_scope.value,
+            tuple(sorted(temporal_hint.detected_years)),
+        )
+    
+    @staticmethod
+    def _cache_for(temporal_hint: Optional[TemporalDetectionResult]) -> TTLCache:
+        """Pick the short-lived cache for temporal queries, the long-lived one otherwise."""
+        if temporal_hint is not None and temporal_hint.is_temporal:
+            return _temporal_classification_cache
+        return _classification_cache
     
-    def _get_cached_classification(self, question: str) -> Optional[QueryClassification]:
+    def _get_cached_classification(
+        self,
+        question: str,
+        temporal_hint: Optional[TemporalDetectionResult] = None
+    ) -> Optional[QueryClassification]:
         """Get cached classification if available and not expired."""
-        cache_key = self._get_cache_key(question)
-        if cache_key in _classification_cache:
-            classification, timestamp = _classification_cache[cache_key]
-            if datetime.utcnow() - timestamp < CLASSIFICATION_CACHE_TTL:
-                logger.info(f"Classification cache hit for question hash: {cache_key[:8]}")
-                return classification
-            else:
-                # Expired, remove from cache
-                del _classification_cache[cache_key]
-        return None
+        cache_key = self._get_cache_key(question, temporal_hint)
+        classification = self._cache_for(temporal_hint).get(cache_key)
+        if classification is not None:
+            logger.info(f"Classification cache hit for question hash: {cache_key[0][:8]}")
+        return classification
     
-    def _cache_classification(self, question: str, classification: QueryClassification):
+    def _cache_classification(
+        self,
+        question: str,
+        classification: QueryClassification,
+        temporal_hint: Optional[TemporalDetectionResult] = None
+    ):
         """Cache classification result."""
-        cache_key = self._get_cache_key(question)
-        _classification_cache[cache_key] = (classification, datetime.utcnow())
-        logger.info(f"Cached classification for question hash: {cache_key[:8]}")
+        cache_key = self._get_cache_key(question, temporal_hint)
+        self._cache_for(temporal_hint).set(cache_key, classification)
+        logger.info(f"Cached classification for question hash: {cache_key[0][:8]}")
     
     async def classify_query(
         self,
@@ -314,10 +475,15 @@ class RouterService:
         Returns:
             Tuple of (QueryClassification, cost, token_usage)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        # Temporal detection is cheap; run it up front so the cache key is
+        # temporal-aware and evergreen queries can send a shorter system prompt.
+        if temporal_hint is None:
+            temporal_hint = detect_temporal_query_cached(question)
         
         # Check cache first
-        cached = self._get_cached_classification(question)
+        cached = self._get_cached_classification(question, temporal_hint)
         if cached:
             return cached, 0.0, TokenUsage()
         
@@ -325,10 +491,22 @@ class RouterService:
             logger.error("OpenAI client not initialized - API key may be missing")
             raise ValueError("OpenAI client not initialized. Check API key configuration.")
         
+        system_prompt = (
+            CLASSIFICATION_SYSTEM_PROMPT if temporal_hint.is_temporal
+            else CLASSIFICATION_SYSTEM_PROMPT_EVERGREEN
+        )
+        
+        # Strong temporal signals: skip the LLM call entirely
+        if temporal_hint.requires_current_data and temporal_hint.confidence >= TEMPORAL_SHORTCUT_CONFIDENCE:
+            classification = self._temporal_rule_classification(question, temporal_hint)
+            logger.info(f"Query classified by temporal rules: complexity={classification.complexity.value}, "
+                        f"domain={classification.domain.value}")
+            return classification, 0.0, TokenUsage()
+        
         try:
-            prompt = CLASSIFICATION_PROMPT.format(question=question)
+            prompt = _CLASSIFICATION_USER_TEMPLATE.format(question=question)
             logger.info(f"Classifying query with model: {self.classifier_model}")
-            logger.debug(f"Classification prompt length: {len(prompt)} chars")
+            logger.debug(f"Classification prompt length: {len(system_prompt) + len(prompt)} chars")
             
             response = await asyncio.wait_for(
                 self.client.chat.completions.create(
@@ -336,7 +514,7 @@ class RouterService:
                     messages=[
                         {
                             "role": "system",
-                            "content": "You are a query classifier. Respond only with valid JSON."
+                            "content": system_prompt
                         },
                         {
                             "role": "user",
@@ -352,7 +530,7 @@ class RouterService:
             
             # Parse response
             response_text = response.choices[0].message.content or "{}"
-            classification_data = json.loads(response_text)
+            classification_data = json_loads(response_text)
             
             # Build classification object
             classification = QueryClassification(
@@ -396,15 +574,15 @@ class RouterService:
             cost = self._calculate_cost(self.classifier_model, token_usage)
             
             # Cache the classification
-            self._cache_classification(question, classification)
+            self._cache_classification(question, classification, temporal_hint)
             
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.info(f"Query classified in {elapsed:.2f}s: complexity={classification.complexity.value}, "
                        f"intent={classification.intent.value}, domain={classification.domain.value}")
             
             return classification, cost, token_usage
             
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             logger.error(f"Failed to parse classification response: {e}")
             # Return default moderate classification
             return self._default_classification(), 0.0, TokenUsage()
@@ -417,6 +595,44 @@ class RouterService:
             logger.error(f"Full traceback: {traceback.format_exc()}")
             return self._default_classification(), 0.0, TokenUsage()
     
+    def _temporal_rule_classification(
+        self,
+        question: str,
+        temporal_hint: TemporalDetectionResult
+    ) -> QueryClassification:
+        """
+        Build a classification from heuristics for clearly temporal queries.
+        
+        Complexity is at least MODERATE (temporal queries are never simple) and
+        becomes COMPLEX for long or multi-part questions. Domain comes from
+        keyword buckets, defaulting to GENERAL.
+        """
+        words = re.findall(r"[a-z0-9+#]+", question.lower())
+        word_set = set(words)
+        
+        if len(words) > 20 or question.count("?") > 1:
+            complexity = ComplexityLevel.COMPLEX
+            recommended_models = ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
+        else:
+            complexity = ComplexityLevel.MODERATE
+            recommended_models = ["gpt-4o-mini", "gpt-4o"]
+        
+        domain = next(
+            (d for d, keywords in _DOMAIN_KEYWORDS if word_set & keywords),
+            QueryDomain.GENERAL
+        )
+        
+        return QueryClassification(
+            complexity=complexity,
+            intent=QueryIntent.FACTUAL,
+            domain=domain,
+            requires_search=True,
+            recommended_models=recommended_models,
+            reasoning=f"Rule-based temporal classification [TEMPORAL OVERRIDE: {temporal_hint.reasoning}]",
+            confidence=temporal_hint.confidence,
+            temporal_scope=temporal_hint.temporal_scope
+        )
+    
     def _default_classification(self) -> QueryClassification:
         """Return default classification for fallback scenarios."""
         return QueryClassification(
@@ -429,13 +645,35 @@ class RouterService:
             confidence=0.5
         )
     
+    def _override_classification(
+        self,
+        override_models: List[str],
+        temporal_detection: TemporalDetectionResult
+    ) -> QueryClassification:
+        """
+        Classification for requests that fully specify their route.
+        
+        Only the models, search need and temporal scope come from the request;
+        the rest are schema defaults, and the response sets classification_skipped.
+        """
+        return QueryClassification(
+            complexity=ComplexityLevel.MODERATE,
+            intent=QueryIntent.FACTUAL,
+            domain=QueryDomain.GENERAL,
+            requires_search=temporal_detection.requires_current_data,
+            temporal_scope=temporal_detection.temporal_scope,
+            recommended_models=list(override_models),
+            reasoning="Classification skipped: models and synthesis were specified by the caller",
+            confidence=0.5
+        )
+    
     def _calculate_cost(self, model: str, token_usage: TokenUsage) -> float:
         """Calculate cost for a model call."""
-        if model not in MODEL_COSTS:
+        idx = _MODEL_IDX.get(model)
+        if idx is None:
             return 0.0
-        costs = MODEL_COSTS[model]
-        return (token_usage.prompt_tokens * costs["input"] / 1000) + \
-               (token_usage.completion_tokens * costs["output"] / 1000)
+        return (token_usage.prompt_tokens * _INPUT_COSTS[idx] / 1000) + \
+               (token_usage.completion_tokens * _OUTPUT_COSTS[idx] / 1000)
     
     def determine_execution_path(
         self,
@@ -510,16 +748,12 @@ class RouterService:
         # Estimate cost
         estimated_cost = self._estimate_cost(models, use_synthesis)
         
-        # Estimate time (rough estimates based on typical response times)
-        time_estimates = {
-            "gpt-4o-mini": 1.5,
-            "gpt-4o": 3.0,
-            "gpt-4-turbo": 5.0,
-            "gpt-5.2": 4.0,
-        }
+        # Estimate time from typical response times in MODEL_PROFILES
         # Models run in parallel, so time is max of individual times
-        model_time = max(time_estimates.get(m, 3.0) for m in models)
-        synthesis_time = time_estimates.get(synthesis_model, 4.0) if use_synthesis else 0
+        model_time = max(self._model_latency(m, DEFAULT_MODEL_LATENCY_S) for m in models)
+        synthesis_time = (
+            self._model_latency(synthesis_model, DEFAULT_SYNTHESIS_LATENCY_S) if use_synthesis else 0
+        )
         estimated_time = model_time + synthesis_time
         
         return RoutingDecision(
@@ -533,28 +767,80 @@ class RouterService:
             add_web_search_recommendation=add_search_recommendation
         )
     
+    @staticmethod
+    def _model_latency(model: Optional[str], default: float) -> float:
+        """Typical response time for a model, or default if it is unknown."""
+        idx = _MODEL_IDX.get(model)
+        return default if idx is None else _LATENCIES[idx]
+
     def _estimate_cost(self, models: List[str], use_synthesis: bool) -> float:
         """Estimate cost for a query execution."""
-        # Assume average tokens: 500 input, 1000 output per model
-        avg_input = 500
-        avg_output = 1000
-        
-        total_cost = 0.0
-        for model in models:
-            if model in MODEL_COSTS:
-                costs = MODEL_COSTS[model]
-                total_cost += (avg_input * costs["input"] / 1000) + (avg_output * costs["output"] / 1000)
-        
+        return self._estimate_cost_batch([models], use_synthesis)[0]
+
+    def _estimate_cost_batch(
+        self,
+        routes: List[List[str]],
+        use_synthesis: bool = False
+    ) -> List[float]:
+        """
+        Estimate costs for several candidate routes in one pass.
+
+        Assumes average tokens per model call (AVG_INPUT_TOKENS in,
+        AVG_OUTPUT_TOKENS out); synthesis input grows with the number of
+        responses being merged. Unknown models contribute nothing.
+
+        Args:
+            routes: Candidate model lists to score
+            use_synthesis: Whether each route ends with a synthesis call
+
+        Returns:
+            Estimated cost per route, in the same order as routes
+        """
+        # Synthesis cost is linear in route length: fixed + per_response * len(route)
+        synth_fixed = synth_per_response = 0.0
         if use_synthesis:
-            # Synthesis has larger input (all responses) but moderate output
-            synth_input = avg_output * len(models) + 500  # All responses + prompt
-            synth_output = 800
-            synth_model = self.settings.synthesis_model
-            if synth_model in MODEL_COSTS:
-                costs = MODEL_COSTS[synth_model]
-                total_cost += (synth_input * costs["input"] / 1000) + (synth_output * costs["output"] / 1000)
+            synth_idx = _MODEL_IDX.get(self.settings.synthesis_model)
+            if synth_idx is not None:
+                synth_in, synth_out = _INPUT_COSTS[synth_idx], _OUTPUT_COSTS[synth_idx]
+                synth_fixed = (SYNTHESIS_PROMPT_TOKENS * synth_in + SYNTHESIS_OUTPUT_TOKENS * synth_out) / 1000
+                synth_per_response = AVG_OUTPUT_TOKENS * synth_in / 1000
+
+        estimates = []
+        for models in routes:
+            total_cost = sum(
+                _AVG_CALL_COST[_MODEL_IDX[m]] for m in models if m in _MODEL_IDX
+            )
+            if use_synthesis:
+                total_cost += synth_fixed + synth_per_response * len(models)
+            estimates.append(round(total_cost, 6))
+        return estimates
+    
+    def _compute_full_ensemble_cost(self) -> float:
+        """Estimated cost of answering with every ensemble model plus synthesis."""
+        full_ensemble_cost = sum(
+            _AVG_CALL_COST[_MODEL_IDX[m]] for m in FULL_ENSEMBLE_MODELS if m in _MODEL_IDX
+        )
+        synth_idx = _MODEL_IDX.get(self.settings.synthesis_model)
+        if synth_idx is not None:
+            synth_input = AVG_OUTPUT_TOKENS * len(FULL_ENSEMBLE_MODELS) + SYNTHESIS_PROMPT_TOKENS
+            full_ensemble_cost += (synth_input * _INPUT_COSTS[synth_idx] / 1000) + \
+                                  (SYNTHESIS_OUTPUT_TOKENS * _OUTPUT_COSTS[synth_idx] / 1000)
+        return full_ensemble_cost
+    
+    def reload_config(self):
+        """
+        Refresh state derived from configuration.
         
-        return round(total_cost, 6)
+        Search provider availability and the cost baseline are read once and
+        reused per request; call this after changing the related settings.
+        """
+        self._perplexity_configured = perplexity_service.is_configured()
+        self._search_configured = search_service.is_configured()
+        self.reset_baseline()
+    
+    def reset_baseline(self):
+        """Recompute the full-ensemble baseline, e.g. after the synthesis model changes."""
+        self._full_ensemble_baseline_cost = self._compute_full_ensemble_cost()
     
     def calculate_cost_breakdown(
         self,
@@ -564,29 +850,13 @@ class RouterService:
         search_cost: float = 0.0
     ) -> CostBreakdown:
         """Calculate detailed cost breakdown."""
-        model_costs = {}
-        for response in model_responses:
-            model_costs[response.model_name] = response.cost_estimate
+        model_costs = {r.model_name: r.cost_estimate for r in model_responses}
         
         synthesis_cost = synthesis_result.cost_estimate if synthesis_result else 0.0
         total_cost = sum(model_costs.values()) + synthesis_cost + classification_cost + search_cost
         
-        # Calculate what full ensemble would have cost
-        full_ensemble_models = ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
-        full_ensemble_cost = 0.0
-        avg_input, avg_output = 500, 1000
-        for model in full_ensemble_models:
-            if model in MODEL_COSTS:
-                costs = MODEL_COSTS[model]
-                full_ensemble_cost += (avg_input * costs["input"] / 1000) + (avg_output * costs["output"] / 1000)
-        
-        # Add synthesis cost for full ensemble
-        synth_model = self.settings.synthesis_model
-        if synth_model in MODEL_COSTS:
-            synth_input = avg_output * 3 + 500
-            synth_output = 800
-            costs = MODEL_COSTS[synth_model]
-            full_ensemble_cost += (synth_input * costs["input"] / 1000) + (synth_output * costs["output"] / 1000)
+        # What the full ensemble would have cost (precomputed baseline)
+        full_ensemble_cost = self._full_ensemble_baseline_cost
         
         savings = max(0, full_ensemble_cost - total_cost)
         savings_percentage = (savings / full_ensemble_cost * 100) if full_ensemble_cost > 0 else 0
@@ -626,39 +896,128 @@ class RouterService:
         Returns:
             RouteAndAnswerResponse with full details including temporal metadata
         """
-        start_time = time.time()
-        timestamp = datetime.utcnow()
-        execution_times: Dict[str, float] = {}
+        key = (
+            hashlib.blake2b(question.encode(), digest_size=16).digest(),
+            max_tokens,
+            round(temperature, 2),
+            tuple(override_models or ()),
+            force_synthesis,
+            enable_search,
+        )
+        
+        # Answers to questions that need current data go stale, so only
+        # the rest are served from (and written to) the answer cache.
+        cacheable = not detect_temporal_query_cached(question).requires_current_data
+        if cacheable:
+            cached = _answer_cache.get(key)
+            if cached is not None:
+                logger.info("Answer cache hit for question hash: %.8s", key[0].hex())
+                response = self._answer_from_cache(cached)
+                # A hit is still a query answered; no models were called for it
+                self._update_stats(
+                    None if response.classification_skipped else response.classification.complexity,
+                    response.cost_breakdown,
+                    [],
+                    cache_hit=True
+                )
+                return response
+        
+        # Identical concurrent requests share one execution
+        response = await self._inflight.do(key, lambda: self._route_and_answer(
+            question, max_tokens, temperature,
+            list(override_models) if override_models else None,
+            force_synthesis, enable_search
+        ))
+        if cacheable and not response.fallback_used and any(r.success for r in response.individual_responses):
+            _answer_cache.set(key, response)
+        return response
+    
+    def _answer_from_cache(self, cached: RouteAndAnswerResponse) -> RouteAndAnswerResponse:
+        """Deep copy of a cached answer, costed at zero for this request."""
+        baseline = round(self._full_ensemble_baseline_cost, 6)
+        # Deep, so callers cannot mutate the cached entry through nested objects
+        return cached.model_copy(deep=True, update={
+            "cost_breakdown": CostBreakdown(
+                model_costs={},
+                total_cost=0.0,
+                full_ensemble_cost=baseline,
+                savings=baseline,
+                savings_percentage=100.0 if baseline > 0 else 0.0,
+            ),
+            "timestamp": datetime.now(timezone.utc),
+        })
+    
+    async def _route_and_answer(
+        self,
+        question: str,
+        max_tokens: int,
+        temperature: float,
+        override_models: Optional[List[str]],
+        force_synthesis: Optional[bool],
+        enable_search: bool
+    ) -> RouteAndAnswerResponse:
+        """Uncoalesced body of route_and_answer."""
+        start_ns = time.perf_counter_ns()
+        timestamp = datetime.now(timezone.utc)
+        phase_ns = _PhaseTimes()
         fallback_used = False
         fallback_reason = None
+        classification_skipped = False
         routing_override_applied = False
         routing_override_reason = None
         ui_warning_message = None
         was_search_used = False
         search_results_data = None
         search_cost = 0.0
-        augmented_question = question  # Will be augmented with search context if needed
+        search_context: Optional[str] = None  # Set by whichever search provider succeeds
         
         # Step 0: Temporal Detection (fast, pre-classification)
-        temporal_start = time.time()
-        temporal_detection = detect_temporal_query(question)
-        execution_times["temporal_detection"] = (time.time() - temporal_start) * 1000
+        temporal_start = time.perf_counter_ns()
+        temporal_detection = detect_temporal_query_cached(question)
+        phase_ns.temporal_detection = time.perf_counter_ns() - temporal_start
         
         if temporal_detection.is_temporal:
-            logger.info(f"Temporal query detected: scope={temporal_detection.temporal_scope.value}, "
-                       f"keywords={temporal_detection.detected_keywords}, years={temporal_detection.detected_years}")
+            logger.info(
+                "Temporal query detected: scope=%s, keywords=%s, years=%s",
+                temporal_detection.temporal_scope.value,
+                temporal_detection.detected_keywords,
+                temporal_detection.detected_years,
+            )
+        
+        # Dispatch the Perplexity search now so it runs concurrently with
+        # classification; the search only needs the raw question.
+        needs_search = temporal_detection.requires_current_data and enable_search
+        search_start = time.perf_counter_ns()
+        perplexity_task: Optional[asyncio.Task] = None
+        if needs_search and self._perplexity_configured:
+            logger.info("Using Perplexity API for real-time search + reasoning")
+            perplexity_task = asyncio.create_task(perplexity_service.search(
+                query=question,
+                model=self.settings.perplexity_model,
+                recency_filter=self.settings.perplexity_recency_filter,
+            ))
         
-        # Step 1: Classify the query (with temporal hints)
-        classification_start = time.time()
+        # Step 1: Classify the query (with temporal hints). When the caller fixed
+        # both the models and synthesis, the classifier cannot change the route.
+        classification_start = time.perf_counter_ns()
         try:
-            classification, classification_cost, _ = await self.classify_query(question, temporal_detection)
+            if override_models and force_synthesis is not None:
+                classification = self._override_classification(override_models, temporal_detection)
+                classification_cost = 0.0
+                classification_skipped = True
+            else:
+                classification, classification_cost, _ = await self.classify_query(question, temporal_detection)
+        except asyncio.CancelledError:
+            if perplexity_task:
+                perplexity_task.cancel()
+            raise
         except Exception as e:
-            logger.error(f"Classification failed, using fallback: {e}")
+            logger.error("Classification failed, using fallback: %s", e)
             classification = self._default_classification()
             classification_cost = 0.0
             fallback_used = True
             fallback_reason = f"Classification failed: {str(e)}"
-        execution_times["classification"] = (time.time() - classification_start) * 1000
+        phase_ns.classification = time.perf_counter_ns() - classification_start
         
         # Check if temporal override was applied
         if temporal_detection.is_temporal and temporal_detection.requires_current_data:
@@ -666,23 +1025,15 @@ class RouterService:
             routing_override_reason = f"Temporal query detected: {temporal_detection.reasoning}"
         
         # Step 2: Web search for temporal queries using Perplexity (preferred) or fallback
-        search_time_ms = 0.0
         perplexity_used = False
         perplexity_answer = None
         perplexity_cost_data = None
         
-        if temporal_detection.requires_current_data and enable_search:
-            search_start = time.time()
-            
+        if needs_search:
             # Try Perplexity first (preferred - combines search + reasoning)
-            if perplexity_service.is_configured():
+            if perplexity_task:
                 try:
-                    logger.info("Using Perplexity API for real-time search + reasoning")
-                    perplexity_response = await perplexity_service.search(
-                        query=question,
-                        model=self.settings.perplexity_model,
-                        recency_filter=self.settings.perplexity_recency_filter,
-                    )
+                    perplexity_response = await perplexity_task
                     
                     if perplexity_response.success and perplexity_response.answer:
                         perplexity_used = True
@@ -708,11 +1059,12 @@ class RouterService:
                         
                         # Format context for other models if needed
                         search_context = perplexity_service.format_for_context(perplexity_response)
-                        augmented_question = f"{question}\n\n{search_context}"
                         
                         logger.info(
-                            f"Perplexity search completed: {perplexity_response.citations_count} citations, "
-                            f"cost=${search_cost:.4f}, {perplexity_response.response_time_ms:.0f}ms"
+                            "Perplexity search completed: %d citations, cost=$%.4f, %.0fms",
+                            perplexity_response.citations_count,
+                            search_cost,
+                            perplexity_response.response_time_ms,
                         )
                         
                         ui_warning_message = (
@@ -720,12 +1072,12 @@ class RouterService:
                             f"{perplexity_response.citations_count} sources cited."
                         )
                     else:
-                        logger.warning(f"Perplexity search returned no results: {perplexity_response.error_message}")
+                        logger.warning("Perplexity search returned no results: %s", perplexity_response.error_message)
                 except Exception as e:
-                    logger.warning(f"Perplexity search failed: {e}")
+                    logger.warning("Perplexity search failed: %s", e)
             
             # Fallback to Tavily/Serper if Perplexity not configured or failed
-            if not perplexity_used and search_service.is_configured():
+            if not perplexity_used and self._search_configured:
                 try:
                     search_response = await search_service.search(question, max_results=5)
                     if search_response and search_response.results:
@@ -745,16 +1097,19 @@ class RouterService:
                             "search_provider": search_response.search_provider
                         }
                         search_context = search_service.format_search_context(search_response)
-                        augmented_question = f"{question}\n\n{search_context}"
                         search_cost = 0.001
-                        logger.info(f"Fallback search completed: {len(search_response.results)} results from {search_response.search_provider}")
+                        logger.info(
+                            "Fallback search completed: %d results from %s",
+                            len(search_response.results),
+                            search_response.search_provider,
+                        )
                         
                         ui_warning_message = (
                             f"⚠️ This query asks about recent information. "
                             f"Web search was used to augment the response."
                         )
                 except Exception as e:
-                    logger.warning(f"Fallback web search failed (continuing without): {e}")
+                    logger.warning("Fallback web search failed (continuing without): %s", e)
             
             # No search available
             if not was_search_used:
@@ -763,8 +1118,11 @@ class RouterService:
                     f"knowledge cutoff (October 2023). Consider verifying with current sources."
                 )
             
-            search_time_ms = (time.time() - search_start) * 1000
-            execution_times["search"] = search_time_ms
+            # Measured from dispatch, so this overlaps classification_time_ms
+            phase_ns.search = time.perf_counter_ns() - search_start
+        
+        # Models see the question followed by the search context, if any
+        augmented_question = "\n\n".join((question, search_context)) if search_context else question
         
         # Step 3: Determine execution path (with temporal context)
         routing_decision = self.determine_execution_path(
@@ -772,56 +1130,107 @@ class RouterService:
         )
         
         # Step 4: Execute with selected models (using augmented question if search was used)
-        model_execution_start = time.time()
+        model_execution_start = time.perf_counter_ns()
         model_execution_times: Dict[str, float] = {}
+        model_responses: List[ModelResponse] = []
+        execution_failed = False
         
         try:
-            model_responses = await llm_service.call_models_parallel(
-                models=routing_decision.models_to_use,
-                question=augmented_question,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                use_cache=True
-            )
-            
-            # Track individual model times
-            for response in model_responses:
-                model_execution_times[response.model_name] = response.response_time_seconds * 1000
+            models_to_use = routing_decision.models_to_use
+            if routing_decision.use_synthesis and len(models_to_use) > 2:
+                # Synthesis still has enough input without the slowest model,
+                # so don't let one straggler hold up the whole ensemble.
+                model_responses = await llm_service.call_models_with_tail_cutoff(
+                    models=models_to_use,
+                    question=augmented_question,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    use_cache=True,
+                    min_responses=len(models_to_use) - 1,
+                    tail_factor=STRAGGLER_TAIL_FACTOR,
+                )
+            else:
+                model_responses = await llm_service.call_models_parallel(
+                    models=models_to_use,
+                    question=augmented_question,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    use_cache=True
+                )
                 
         except Exception as e:
-            logger.error(f"Model execution failed, falling back to full ensemble: {e}")
+            logger.error("Model execution failed, falling back to full ensemble: %s", e)
+            execution_failed = True
             fallback_used = True
             fallback_reason = f"Model execution failed: {str(e)}"
-            
-            # Fallback to full ensemble
+        
+        successful_responses = [r for r in model_responses if r.success]
+        responses_needed = 2 if routing_decision.use_synthesis else 1
+        replacement_models: List[str] = []
+        if execution_failed:
+            # The call itself raised: fall back to the full ensemble, keeping
+            # any answers already paid for
+            answered = {r.model_name for r in successful_responses}
+            replacement_models = [m for m in FULL_ENSEMBLE_MODELS if m not in answered]
+        elif not override_models and len(successful_responses) < responses_needed:
+            # Some routed models failed: swap in the cheapest untried ensemble
+            # models, never more than the route itself asked for. Caller-chosen
+            # models are kept as they are.
+            shortfall = len(routing_decision.models_to_use) - len(successful_responses)
+            replacement_models = sorted(
+                (m for m in FULL_ENSEMBLE_MODELS if m not in routing_decision.models_to_use),
+                key=lambda m: ModelConfig.get_cost(m, 1000, 1000),
+            )[:shortfall]
+            if replacement_models:
+                logger.warning(
+                    "Only %d of %d models answered, requesting %s",
+                    len(successful_responses), len(routing_decision.models_to_use),
+                    replacement_models
+                )
+                fallback_used = True
+                fallback_reason = (
+                    f"Only {len(successful_responses)} of "
+                    f"{len(routing_decision.models_to_use)} models answered"
+                )
+        
+        if replacement_models:
             try:
-                model_responses = await llm_service.call_models_parallel(
-                    models=["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"],
-                    question=question,
+                model_responses = successful_responses + await llm_service.call_models_parallel(
+                    models=replacement_models,
+                    question=augmented_question,
                     max_tokens=max_tokens,
                     temperature=temperature,
                     use_cache=True
                 )
-                routing_decision.models_to_use = ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
-                routing_decision.use_synthesis = True
-                routing_decision.routing_rationale = "Fallback to full ensemble due to routing failure"
-                
-                for response in model_responses:
-                    model_execution_times[response.model_name] = response.response_time_seconds * 1000
             except Exception as e2:
-                logger.error(f"Fallback also failed: {e2}")
+                logger.error("Fallback also failed: %s", e2)
                 raise
+            routing_decision.models_to_use = [r.model_name for r in model_responses]
+            routing_decision.routing_rationale = (
+                "Fallback to full ensemble due to routing failure" if execution_failed
+                else "Replaced failed models with other ensemble models"
+            )
+            successful_responses = [r for r in model_responses if r.success]
+            if execution_failed:
+                routing_decision.use_synthesis = True
         
-        execution_times["model_execution"] = (time.time() - model_execution_start) * 1000
+        # Synthesis needs at least two answers to combine
+        if len(successful_responses) < 2:
+            routing_decision.use_synthesis = False
+        
+        # Track individual model times
+        for response in model_responses:
+            model_execution_times[response.model_name] = response.response_time_seconds * 1000
+        
+        phase_ns.model_execution = time.perf_counter_ns() - model_execution_start
         
         # Step 5: Synthesize if needed
         synthesis_result = None
-        synthesis_time = 0.0
         
         successful_responses = [r for r in model_responses if r.success]
         
         if routing_decision.use_synthesis and len(successful_responses) > 1:
-            synthesis_start = time.time()
+            synthesis_start = time.perf_counter_ns()
             try:
                 synthesis_result = await synthesis_service.synthesize(
                     question=question,
@@ -829,26 +1238,17 @@ class RouterService:
                     synthesis_model=routing_decision.synthesis_model,
                     max_tokens=1500
                 )
-                synthesis_time = (time.time() - synthesis_start) * 1000
+                phase_ns.synthesis = time.perf_counter_ns() - synthesis_start
             except Exception as e:
-                logger.error(f"Synthesis failed: {e}")
+                logger.error("Synthesis failed: %s", e)
                 synthesis_result = None
         
-        execution_times["synthesis"] = synthesis_time
         
         # Determine final answer
         if synthesis_result:
             final_answer = synthesis_result.synthesized_answer
         elif successful_responses:
-            # Use the best response (prefer in order: gpt-4-turbo, gpt-4o, gpt-4o-mini)
-            priority_order = ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
-            best_response = successful_responses[0]
-            for model in priority_order:
-                for response in successful_responses:
-                    if response.model_name == model:
-                        best_response = response
-                        break
-            final_answer = best_response.response_text
+            final_answer = self._pick_best_response(successful_responses).response_text
         else:
             final_answer = "Unable to generate a response. Please try again."
         
@@ -858,29 +1258,37 @@ class RouterService:
         )
         
         # Build execution metrics
-        total_time = (time.time() - start_time) * 1000
+        total_time = (time.perf_counter_ns() - start_ns) / 1e6
         execution_metrics = ExecutionMetrics(
-            classification_time_ms=execution_times.get("classification", 0),
+            classification_time_ms=phase_ns.classification / 1e6,
             model_execution_time_ms=model_execution_times,
-            synthesis_time_ms=execution_times.get("synthesis", 0),
+            synthesis_time_ms=phase_ns.synthesis / 1e6,
             total_time_ms=total_time,
-            temporal_detection_time_ms=execution_times.get("temporal_detection", 0),
-            search_time_ms=search_time_ms
+            temporal_detection_time_ms=phase_ns.temporal_detection / 1e6,
+            search_time_ms=phase_ns.search / 1e6
         )
         
         # Update statistics
-        self._update_stats(classification.complexity, cost_breakdown, model_responses)
+        # Skipped classifications carry no complexity signal to tally
+        self._update_stats(
+            None if classification_skipped else classification.complexity,
+            cost_breakdown,
+            model_responses
+        )
         
         # Log routing decision
         logger.info(
-            f"Route complete: complexity={classification.complexity.value}, "
-            f"models={routing_decision.models_to_use}, "
-            f"synthesis={routing_decision.use_synthesis}, "
-            f"temporal={temporal_detection.is_temporal}, "
-            f"search_used={was_search_used}, "
-            f"cost=${cost_breakdown.total_cost:.4f}, "
-            f"savings=${cost_breakdown.savings:.4f} ({cost_breakdown.savings_percentage:.1f}%), "
-            f"time={total_time:.0f}ms"
+            "Route complete: complexity=%s, models=%s, synthesis=%s, temporal=%s, "
+            "search_used=%s, cost=$%.4f, savings=$%.4f (%.1f%%), time=%.0fms",
+            classification.complexity.value,
+            routing_decision.models_to_use,
+            routing_decision.use_synthesis,
+            temporal_detection.is_temporal,
+            was_search_used,
+            cost_breakdown.total_cost,
+            cost_breakdown.savings,
+            cost_breakdown.savings_percentage,
+            total_time,
         )
         
         return RouteAndAnswerResponse(
@@ -896,6 +1304,7 @@ class RouterService:
             timestamp=timestamp,
             fallback_used=fallback_used,
             fallback_reason=fallback_reason,
+            classification_skipped=classification_skipped,
             temporal_detection=temporal_detection,
             was_search_used=was_search_used,
             search_results=search_results_data,
@@ -904,30 +1313,35 @@ class RouterService:
             ui_warning_message=ui_warning_message
         )
     
+    @staticmethod
+    def _pick_best_response(responses: List[ModelResponse]) -> ModelResponse:
+        """Pick the highest-priority model's response, else the first one."""
+        if len(responses) == 1:
+            return responses[0]
+        by_name = {r.model_name: r for r in responses}
+        return next(
+            (by_name[m] for m in RESPONSE_PRIORITY if m in by_name),
+            responses[0]
+        )
+    
     def _update_stats(
         self,
-        complexity: ComplexityLevel,
+        complexity: Optional[ComplexityLevel],
         cost_breakdown: CostBreakdown,
-        responses: List[ModelResponse]
+        responses: List[ModelResponse],
+        cache_hit: bool = False
     ):
-        """Update routing statistics."""
+        """Update routing statistics (complexity is None when the query was not classified)."""
         self.stats["total_queries"] += 1
-        
-        if complexity == ComplexityLevel.SIMPLE:
-            self.stats["simple_queries"] += 1
-        elif complexity == ComplexityLevel.MODERATE:
-            self.stats["moderate_queries"] += 1
-        else:
-            self.stats["complex_queries"] += 1
-        
+        if complexity is not None:
+            self.stats[_COMPLEXITY_STAT_KEYS[complexity]] += 1
+        if cache_hit:
+            # Counted on their own: a free hit is not a routing saving
+            self.stats["answer_cache_hits"] += 1
+            return
         self.stats["total_cost"] += cost_breakdown.total_cost
         self.stats["total_savings"] += cost_breakdown.savings
-        
-        for response in responses:
-            model = response.model_name
-            if model not in self.stats["model_usage"]:
-                self.stats["model_usage"][model] = 0
-            self.stats["model_usage"][model] += 1
+        self.stats["model_usage"].update(r.model_name for r in responses)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get routing statistics."""
@@ -945,14 +1359,21 @@ class RouterService:
             "total_cost": round(self.stats["total_cost"], 4),
             "total_savings": round(self.stats["total_savings"], 4),
             "average_savings_percentage": round(avg_savings, 2),
-            "model_usage_distribution": self.stats["model_usage"],
+            "model_usage_distribution": dict(self.stats["model_usage"]),
             "fallback_count": self.stats["fallback_count"],
+            "answer_cache_hits": self.stats["answer_cache_hits"],
         }
     
     def clear_classification_cache(self):
         """Clear the classification cache."""
         _classification_cache.clear()
+        _temporal_classification_cache.clear()
         logger.info("Classification cache cleared")
+    
+    def clear_answer_cache(self):
+        """Clear the route_and_answer answer cache."""
+        _answer_cache.clear()
+        logger.info("Answer cache cleared")
 
 
 # Global router service instance
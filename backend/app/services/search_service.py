@@ -4,19 +4,26 @@ Supports Tavily API (primary) and Serper API (fallback).
 """
 
 import asyncio
-import hashlib
+import re
+import time
+import unicodedata
 import httpx
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
 from dataclasses import dataclass, field
 
 from ..config import get_settings, TemporalConfig
 from ..utils.logging import get_logger
+from ..utils.cache import TTLCache
+from ._http import HTTP2_AVAILABLE
+from ..utils.serialization import json_dumps_bytes, json_loads
+from ..utils.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Individual search result."""
     title: str
@@ -27,7 +34,7 @@ class SearchResult:
     score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResponse:
     """Response from web search."""
     success: bool
@@ -38,6 +45,10 @@ class SearchResponse:
     error_message: Optional[str] = None
     cached: bool = False
     cache_timestamp: Optional[datetime] = None
+    # Serialized results, built on the first to_dict() call
+    _results_data: Optional[List[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     @property
     def search_provider(self) -> str:
@@ -50,10 +61,15 @@ class SearchResponse:
         return len(self.results)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "success": self.success,
-            "results": [
+        """
+        Convert to dictionary for JSON serialization.
+        
+        The results list is built once and shared by later calls (results are
+        not modified after a response is created); the top-level fields are
+        read fresh each time since cache hits update them.
+        """
+        if self._results_data is None:
+            self._results_data = [
                 {
                     "title": r.title,
                     "url": r.url,
@@ -63,7 +79,10 @@ class SearchResponse:
                     "score": r.score,
                 }
                 for r in self.results
-            ],
+            ]
+        return {
+            "success": self.success,
+            "results": self._results_data,
             "query": self.query,
             "search_time_ms": self.search_time_ms,
             "provider": self.provider,
@@ -71,10 +90,243 @@ class SearchResponse:
             "cached": self.cached,
             "cache_timestamp": self.cache_timestamp.isoformat() if self.cache_timestamp else None,
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SearchResponse":
+        """Rebuild a response produced by to_dict()."""
+        timestamp = data.get("cache_timestamp")
+        return cls(
+            success=data["success"],
+            results=[SearchResult(**r) for r in data.get("results", [])],
+            query=data.get("query", ""),
+            search_time_ms=data.get("search_time_ms", 0.0),
+            provider=data.get("provider", ""),
+            error_message=data.get("error_message"),
+            cached=data.get("cached", False),
+            cache_timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+        )
+
+
+# In-process search result cache: normalized query -> (SearchResponse,
+# monotonic cached_at, wall-clock timestamp reported as cache_timestamp,
+# fresh TTL in seconds).
+# Bounded LRU; expiry is handled by the cache using per-entry TTLs.
+SEARCH_CACHE_MAX_SIZE = 1024
+_search_cache = TTLCache(maxsize=SEARCH_CACHE_MAX_SIZE)
+
+# A cache lookup: (response, age in seconds, time it was cached, fresh TTL in seconds)
+CachedSearch = Tuple[SearchResponse, float, datetime, float]
+
+
+class SearchCacheBackend(Protocol):
+    """Storage for cached search responses."""
+    
+    async def get(self, key: str) -> Optional[CachedSearch]:
+        """Get a live entry, or None on a miss."""
+        ...
+    
+    async def set(
+        self, key: str, response: SearchResponse, ttl_seconds: float, stale_seconds: float
+    ) -> None:
+        """Store a response, fresh for ttl_seconds and kept stale_seconds longer."""
+        ...
+    
+    async def clear(self) -> None:
+        """Remove every cached search."""
+        ...
+    
+    def size(self) -> Optional[int]:
+        """Number of cached searches, if cheaply known."""
+        ...
+
+
+class InMemorySearchCache:
+    """Per-process search cache backed by a bounded TTLCache."""
+    
+    def __init__(self, store: TTLCache = _search_cache):
+        self._store = store
+    
+    async def get(self, key: str) -> Optional[CachedSearch]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        response, cached_at, timestamp, ttl_seconds = entry
+        return response, time.monotonic() - cached_at, timestamp, ttl_seconds
+    
+    async def set(
+        self, key: str, response: SearchResponse, ttl_seconds: float, stale_seconds: float
+    ) -> None:
+        self._store.set(
+            key,
+            (response, time.monotonic(), datetime.utcnow(), ttl_seconds),
+            ttl=ttl_seconds + stale_seconds,
+        )
+    
+    async def clear(self) -> None:
+        self._store.clear()
+    
+    def size(self) -> Optional[int]:
+        return len(self._store)
+
+
+class RedisSearchCache:
+    """
+    Search cache shared by every worker through Redis.
+    
+    Entries are stored as JSON with SETEX so Redis handles expiry. Falls back
+    to the in-process cache if the redis package is missing or the server
+    cannot be reached.
+    """
+    
+    NAMESPACE = "search"
+    # Seconds to wait before reconnecting after Redis could not be reached
+    RETRY_INTERVAL_S = 30.0
+    
+    def __init__(self, redis_url: str, fallback: Optional[InMemorySearchCache] = None):
+        self.redis_url = redis_url
+        self._fallback = fallback or InMemorySearchCache()
+        self._redis_client = None
+        self._retry_at = 0.0
+    
+    async def _get_redis(self):
+        """Connect on first use; returns None while Redis is unavailable.
+        
+        A failed connection is retried after RETRY_INTERVAL_S, so a transient
+        outage does not pin the worker to the in-memory cache.
+        """
+        if self._redis_client is None and time.monotonic() >= self._retry_at:
+            # Push the next attempt out first so concurrent callers don't all connect
+            self._retry_at = time.monotonic() + self.RETRY_INTERVAL_S
+            try:
+                import redis.asyncio as redis
+                client = redis.from_url(
+                    self.redis_url, decode_responses=False, max_connections=10
+                )
+                await client.ping()
+                self._redis_client = client
+                logger.info("Search cache connected to Redis")
+            except ImportError:
+                self._retry_at = float("inf")
+                logger.warning("redis package not installed, using in-memory search cache")
+            except Exception as e:
+                logger.warning(
+                    "Failed to connect to Redis: %s, using in-memory search cache "
+                    "(retrying in %.0fs)", e, self.RETRY_INTERVAL_S
+                )
+        return self._redis_client
+    
+    async def get(self, key: str) -> Optional[CachedSearch]:
+        client = await self._get_redis()
+        if client is None:
+            return await self._fallback.get(key)
+        try:
+            data = await client.get(f"{self.NAMESPACE}:{key}")
+            if data is None:
+                return None
+            entry = json_loads(data)
+            cached_at = entry["cached_at"]
+            timestamp = datetime.fromtimestamp(cached_at, timezone.utc).replace(tzinfo=None)
+            return (
+                SearchResponse.from_dict(entry["response"]),
+                time.time() - cached_at,
+                timestamp,
+                entry["ttl"],
+            )
+        except Exception as e:
+            logger.error("Search cache get error: %s", e)
+            return None
+    
+    async def set(
+        self, key: str, response: SearchResponse, ttl_seconds: float, stale_seconds: float
+    ) -> None:
+        client = await self._get_redis()
+        if client is None:
+            await self._fallback.set(key, response, ttl_seconds, stale_seconds)
+            return
+        data = json_dumps_bytes({
+            "response": response.to_dict(),
+            "cached_at": time.time(),
+            "ttl": ttl_seconds,
+        })
+        try:
+            await client.setex(
+                f"{self.NAMESPACE}:{key}", max(1, int(ttl_seconds + stale_seconds)), data
+            )
+        except Exception as e:
+            logger.error("Search cache set error: %s", e)
+    
+    async def clear(self) -> None:
+        client = await self._get_redis()
+        if client is None:
+            await self._fallback.clear()
+            return
+        try:
+            # One DELETE per SCAN page instead of one round trip per key
+            cursor = 0
+            while True:
+                cursor, keys = await client.scan(
+                    cursor=cursor, match=f"{self.NAMESPACE}:*", count=100
+                )
+                if keys:
+                    await client.delete(*keys)
+                if cursor == 0:
+                    break
+        except Exception as e:
+            logger.error("Search cache clear error: %s", e)
+    
+    def size(self) -> Optional[int]:
+        return None if self._redis_client is not None else self._fallback.size()
+    
+    async def aclose(self):
+        """Close the Redis connection pool."""
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+            self._retry_at = 0.0
+
+
+def _create_cache_backend(settings) -> SearchCacheBackend:
+    """Pick the search cache backend configured by search_cache_backend."""
+    if settings.search_cache_backend == "redis" and settings.redis_url:
+        return RedisSearchCache(settings.redis_url)
+    return InMemorySearchCache()
+
+# Host of an http(s) URL without any "www." prefix, port, path or query
+_DOMAIN_RE = re.compile(r"^https?://(?:www\.)?([^/:?#]+)", re.IGNORECASE)
 
+# Query normalization for cache keys
+_WS_RE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = "?.!,;:"
 
-# Search result cache: query_hash -> (SearchResponse, timestamp)
-_search_cache: Dict[str, tuple[SearchResponse, datetime]] = {}
+# Volatility hints for adaptive TTLs (matched against normalized queries)
+_VOLATILE_QUERY_RE = re.compile(
+    r"\b(?:today|tonight|yesterday|now|latest|breaking|news|live|score|scores|"
+    r"price|prices|stock|stocks|weather|this\s+week)\b"
+)
+_REFERENCE_QUERY_RE = re.compile(
+    r"^(?:what\s+is|what\s+are|who\s+was|define|definition\s+of|history\s+of|how\s+does|how\s+do)\b"
+)
+
+# Cache fill ratios between which TTLs shrink, and the smallest TTL multiplier
+CACHE_PRESSURE_LOW = 0.7
+CACHE_PRESSURE_HIGH = 0.9
+MIN_PRESSURE_TTL_SCALE = 0.1
+
+# Longest snippet kept per result; Tavily "advanced" content can run to several KB
+SNIPPET_MAX_CHARS = 500
+
+
+@lru_cache(maxsize=1)
+def _context_frame(day: date) -> tuple[str, str]:
+    """Header and footer of the search context block, fixed for a given day."""
+    current_date = day.strftime("%B %d, %Y")
+    header = f"**Current Information from Web Search (as of {current_date}):**"
+    footer = (
+        "---\n"
+        f"*Note: The above information was retrieved from web search on {current_date}. "
+        f"LLM knowledge cutoff is {TemporalConfig.MODEL_KNOWLEDGE_CUTOFF_DISPLAY}.*\n"
+    )
+    return header, footer
 
 
 class SearchService:
@@ -85,41 +337,114 @@ class SearchService:
         self.settings = get_settings()
         self.tavily_base_url = "https://api.tavily.com"
         self.serper_base_url = "https://google.serper.dev"
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight = SingleFlight()
+        self._cache = _create_cache_backend(self.settings)
     
     def is_configured(self) -> bool:
         """Check if any search API is configured."""
         return bool(self.settings.tavily_api_key or self.settings.serper_api_key)
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=15.0,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0),
+                http2=HTTP2_AVAILABLE,
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client and any cache connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if isinstance(self._cache, RedisSearchCache):
+            await self._cache.aclose()
+    
     async def search(self, query: str, max_results: int = 5) -> SearchResponse:
         """Alias for search_web for API compatibility."""
         return await self.search_web(query, num_results=max_results)
         
     def _get_cache_key(self, query: str) -> str:
-        """Generate cache key for search query."""
-        normalized = query.lower().strip()
-        return hashlib.sha256(normalized.encode()).hexdigest()
-    
-    def _get_cached_result(self, query: str) -> Optional[SearchResponse]:
-        """Get cached search result if available and not expired."""
-        cache_key = self._get_cache_key(query)
-        if cache_key in _search_cache:
-            response, timestamp = _search_cache[cache_key]
-            ttl_hours = self.settings.search_result_cache_ttl_hours
-            if datetime.utcnow() - timestamp < timedelta(hours=ttl_hours):
-                logger.info(f"Search cache hit for query: {query[:50]}...")
-                response.cached = True
-                response.cache_timestamp = timestamp
-                return response
-            else:
-                # Expired
-                del _search_cache[cache_key]
-        return None
-    
-    def _cache_result(self, query: str, response: SearchResponse):
+        """
+        Generate cache key for search query (the normalized query itself).
+        
+        Unicode is NFKC-normalized and case-folded, whitespace collapsed and
+        trailing punctuation dropped, so trivially different phrasings share
+        an entry. With search_cache_order_insensitive the words are also
+        sorted.
+        """
+        normalized = unicodedata.normalize("NFKC", query).casefold()
+        normalized = _WS_RE.sub(" ", normalized).strip().rstrip(_TRAILING_PUNCTUATION).rstrip()
+        if self.settings.search_cache_order_insensitive:
+            normalized = " ".join(sorted(normalized.split(" ")))
+        return normalized
+    
+    async def _get_cached_result(self, query: str, num_results: Optional[int] = None) -> Optional[SearchResponse]:
+        """
+        Get cached search result if available and not expired.
+        
+        Entries past their TTL but within the stale-while-revalidate window
+        are still returned, and a background refresh is started for them.
+        """
+        entry = await self._cache.get(self._get_cache_key(query))
+        if entry is None:
+            return None
+        response, age, timestamp, ttl_seconds = entry
+        if age >= ttl_seconds:
+            logger.info("Serving stale search result, revalidating: %.50s...", query)
+            self._revalidate(query, num_results or self.settings.search_max_results)
+        else:
+            logger.info("Search cache hit for query: %.50s...", query)
+        response.cached = True
+        response.cache_timestamp = timestamp
+        return response
+    
+    def _classify_ttl(self, query: str) -> float:
+        """
+        Fresh TTL in seconds for a query, scaled by how quickly its answer changes.
+        
+        News-like queries get a tenth of the configured TTL; reference-style
+        questions with no temporal keywords keep their results three times longer.
+        """
+        base = self.settings.search_result_cache_ttl_hours * 3600
+        key = self._get_cache_key(query)
+        if _VOLATILE_QUERY_RE.search(key):
+            return base * 0.1
+        if _REFERENCE_QUERY_RE.match(key) and not TemporalConfig.get_compiled_pattern().search(key):
+            return base * 3.0
+        return base
+    
+    def _pressure_scale(self) -> float:
+        """TTL multiplier that shrinks as the in-process cache nears its bound."""
+        size = self._cache.size()
+        if size is None:
+            return 1.0
+        low = CACHE_PRESSURE_LOW * SEARCH_CACHE_MAX_SIZE
+        high = CACHE_PRESSURE_HIGH * SEARCH_CACHE_MAX_SIZE
+        pressure = min(1.0, max(0.0, (size - low) / (high - low)))
+        return max(1.0 - pressure, MIN_PRESSURE_TTL_SCALE)
+    
+    async def _cache_result(self, query: str, response: SearchResponse):
         """Cache search result."""
-        cache_key = self._get_cache_key(query)
-        _search_cache[cache_key] = (response, datetime.utcnow())
-        logger.info(f"Cached search result for query: {query[:50]}...")
+        await self._cache.set(
+            self._get_cache_key(query),
+            response,
+            self._classify_ttl(query) * self._pressure_scale(),
+            self.settings.search_swr_window_hours * 3600,
+        )
+        logger.info("Cached search result for query: %.50s...", query)
+    
+    def _revalidate(self, query: str, num_results: int):
+        """Refresh a cached query in the background (coalesced with live searches)."""
+        searches = self._provider_searches()
+        if searches:
+            self._inflight.start(
+                (self._get_cache_key(query), num_results),
+                lambda: self._search_and_cache(searches, query, num_results)
+            )
     
     async def search_web(
         self,
@@ -140,90 +465,148 @@ class SearchService:
             num_results = self.settings.search_max_results
         
         # Check cache first
-        cached = self._get_cached_result(query)
+        cached = await self._get_cached_result(query, num_results)
         if cached:
             return cached
         
-        start_time = datetime.utcnow()
-        
-        # Try primary provider
-        provider = self.settings.search_api_provider
+        searches = self._provider_searches()
+        if not searches:
+            logger.warning("No search API configured")
+            return SearchResponse(
+                success=False,
+                query=query,
+                error_message="No search API configured. Set TAVILY_API_KEY or SERPER_API_KEY.",
+                provider="none"
+            )
         
-        if provider == "tavily" and self.settings.tavily_api_key:
-            response = await self._search_tavily(query, num_results)
-        elif provider == "serper" and self.settings.serper_api_key:
-            response = await self._search_serper(query, num_results)
-        else:
-            # Try fallback
-            if self.settings.tavily_api_key:
-                response = await self._search_tavily(query, num_results)
-            elif self.settings.serper_api_key:
-                response = await self._search_serper(query, num_results)
-            else:
-                logger.warning("No search API configured")
-                return SearchResponse(
-                    success=False,
-                    query=query,
-                    error_message="No search API configured. Set TAVILY_API_KEY or SERPER_API_KEY.",
-                    provider="none"
-                )
+        # Concurrent misses for the same query share one provider call
+        return await self._inflight.do(
+            (self._get_cache_key(query), num_results),
+            lambda: self._search_and_cache(searches, query, num_results)
+        )
+    
+    async def _search_and_cache(
+        self,
+        searches: List[Callable[[str, int], Awaitable[SearchResponse]]],
+        query: str,
+        num_results: int
+    ) -> SearchResponse:
+        """Run the provider search and cache a successful response."""
+        start = time.perf_counter()
+        response = await self._search_hedged(searches, query, num_results)
         
         # Calculate search time
-        response.search_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+        response.search_time_ms = (time.perf_counter() - start) * 1000.0
         
         # Cache successful results
         if response.success:
-            self._cache_result(query, response)
+            await self._cache_result(query, response)
         
         return response
     
+    def _provider_searches(self) -> List[Callable[[str, int], Awaitable[SearchResponse]]]:
+        """Configured provider search methods, preferred provider first."""
+        searches = []
+        if self.settings.tavily_api_key:
+            searches.append(self._search_tavily)
+        if self.settings.serper_api_key:
+            searches.append(self._search_serper)
+        if self.settings.search_api_provider == "serper":
+            searches.reverse()
+        return searches
+    
+    async def _search_hedged(
+        self,
+        searches: List[Callable[[str, int], Awaitable[SearchResponse]]],
+        query: str,
+        num_results: int
+    ) -> SearchResponse:
+        """
+        Race the configured providers, returning the first successful response.
+        
+        The next provider is started only when the current ones have failed
+        or have not answered within search_hedge_delay_seconds, so a healthy primary
+        provider is not double-billed. Losing requests are cancelled.
+        
+        Args:
+            searches: Provider search methods in order of preference
+            query: The search query
+            num_results: Number of results to return
+            
+        Returns:
+            The first successful SearchResponse, else the last failure
+        """
+        backups = list(searches[1:])
+        hedge_delay = self.settings.search_hedge_delay_seconds
+        pending = {asyncio.create_task(searches[0](query, num_results))}
+        response = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=hedge_delay if backups else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    response = task.result()
+                    if response.success:
+                        return response
+                # Hedge on a slow or failed provider
+                if backups and (not done or not pending):
+                    pending.add(asyncio.create_task(backups.pop(0)(query, num_results)))
+        finally:
+            for task in pending:
+                task.cancel()
+        return response
+    
     async def _search_tavily(self, query: str, num_results: int) -> SearchResponse:
         """Search using Tavily API."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(
-                    f"{self.tavily_base_url}/search",
-                    json={
-                        "api_key": self.settings.tavily_api_key,
-                        "query": query,
-                        "search_depth": "advanced",
-                        "include_answer": False,
-                        "include_raw_content": False,
-                        "max_results": num_results,
-                    }
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"Tavily API error: {response.status_code} - {response.text}")
-                    return SearchResponse(
-                        success=False,
-                        query=query,
-                        error_message=f"Tavily API error: {response.status_code}",
-                        provider="tavily"
-                    )
-                
-                data = response.json()
-                results = []
-                
-                for item in data.get("results", []):
-                    results.append(SearchResult(
-                        title=item.get("title", ""),
-                        url=item.get("url", ""),
-                        snippet=item.get("content", "")[:500],
-                        source=self._extract_domain(item.get("url", "")),
-                        publish_date=item.get("published_date"),
-                        score=item.get("score", 0.0)
-                    ))
-                
-                logger.info(f"Tavily search returned {len(results)} results for: {query[:50]}...")
-                
+            response = await self._get_client().post(
+                f"{self.tavily_base_url}/search",
+                headers={"Content-Type": "application/json"},
+                content=json_dumps_bytes({
+                    "api_key": self.settings.tavily_api_key,
+                    "query": query,
+                    "search_depth": "advanced",
+                    "include_answer": False,
+                    "include_raw_content": False,
+                    "max_results": num_results,
+                })
+            )
+            
+            if response.status_code != 200:
+                logger.error("Tavily API error: %s - %s", response.status_code, response.text)
                 return SearchResponse(
-                    success=True,
-                    results=results,
+                    success=False,
                     query=query,
+                    error_message=f"Tavily API error: {response.status_code}",
                     provider="tavily"
                 )
-                
+            
+            data = json_loads(response.content)
+            results = []
+            
+            for item in data.get("results", []):
+                url = item.get("url") or ""
+                results.append(SearchResult(
+                    title=item.get("title", ""),
+                    url=url,
+                    snippet=(item.get("content") or "")[:SNIPPET_MAX_CHARS],
+                    source=self._extract_domain(url),
+                    publish_date=item.get("published_date"),
+                    score=item.get("score", 0.0)
+                ))
+            
+            logger.info("Tavily search returned %d results for: %.50s...", len(results), query)
+            
+            return SearchResponse(
+                success=True,
+                results=results,
+                query=query,
+                provider="tavily"
+            )
+            
         except httpx.TimeoutException:
             logger.error("Tavily API timeout")
             return SearchResponse(
@@ -233,7 +616,7 @@ class SearchService:
                 provider="tavily"
             )
         except Exception as e:
-            logger.error(f"Tavily search error: {e}")
+            logger.error("Tavily search error: %s", e)
             return SearchResponse(
                 success=False,
                 query=query,
@@ -244,50 +627,50 @@ class SearchService:
     async def _search_serper(self, query: str, num_results: int) -> SearchResponse:
         """Search using Serper API."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(
-                    f"{self.serper_base_url}/search",
-                    headers={
-                        "X-API-KEY": self.settings.serper_api_key,
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "q": query,
-                        "num": num_results
-                    }
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"Serper API error: {response.status_code} - {response.text}")
-                    return SearchResponse(
-                        success=False,
-                        query=query,
-                        error_message=f"Serper API error: {response.status_code}",
-                        provider="serper"
-                    )
-                
-                data = response.json()
-                results = []
-                
-                for item in data.get("organic", []):
-                    results.append(SearchResult(
-                        title=item.get("title", ""),
-                        url=item.get("link", ""),
-                        snippet=item.get("snippet", "")[:500],
-                        source=self._extract_domain(item.get("link", "")),
-                        publish_date=item.get("date"),
-                        score=item.get("position", 0) / 10.0  # Convert position to score
-                    ))
-                
-                logger.info(f"Serper search returned {len(results)} results for: {query[:50]}...")
-                
+            response = await self._get_client().post(
+                f"{self.serper_base_url}/search",
+                headers={
+                    "X-API-KEY": self.settings.serper_api_key,
+                    "Content-Type": "application/json"
+                },
+                content=json_dumps_bytes({
+                    "q": query,
+                    "num": num_results
+                })
+            )
+            
+            if response.status_code != 200:
+                logger.error("Serper API error: %s - %s", response.status_code, response.text)
                 return SearchResponse(
-                    success=True,
-                    results=results,
+                    success=False,
                     query=query,
+                    error_message=f"Serper API error: {response.status_code}",
                     provider="serper"
                 )
-                
+            
+            data = json_loads(response.content)
+            results = []
+            
+            for item in data.get("organic", []):
+                url = item.get("link") or ""
+                results.append(SearchResult(
+                    title=item.get("title", ""),
+                    url=url,
+                    snippet=(item.get("snippet") or "")[:SNIPPET_MAX_CHARS],
+                    source=self._extract_domain(url),
+                    publish_date=item.get("date"),
+                    score=item.get("position", 0) / 10.0  # Convert position to score
+                ))
+            
+            logger.info("Serper search returned %d results for: %.50s...", len(results), query)
+            
+            return SearchResponse(
+                success=True,
+                results=results,
+                query=query,
+                provider="serper"
+            )
+            
         except httpx.TimeoutException:
             logger.error("Serper API timeout")
             return SearchResponse(
@@ -297,7 +680,7 @@ class SearchService:
                 provider="serper"
             )
         except Exception as e:
-            logger.error(f"Serper search error: {e}")
+            logger.error("Serper search error: %s", e)
             return SearchResponse(
                 success=False,
                 query=query,
@@ -307,16 +690,8 @@ class SearchService:
     
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            # Remove www. prefix
-            if domain.startswith("www."):
-                domain = domain[4:]
-            return domain
-        except Exception:
-            return url
+        match = _DOMAIN_RE.match(url)
+        return match.group(1).lower() if match else url
     
     def format_search_context(
         self,
@@ -336,42 +711,33 @@ class SearchService:
         if not search_response.success or not search_response.results:
             return ""
         
-        current_date = datetime.now().strftime("%B %d, %Y")
-        
-        lines = [
-            f"**Current Information from Web Search (as of {current_date}):**",
-            "",
-        ]
+        header, footer = _context_frame(date.today())
         
+        lines = [header, ""]
         for i, result in enumerate(search_response.results[:max_results], 1):
             date_str = f" ({result.publish_date})" if result.publish_date else ""
-            lines.extend([
-                f"**Source {i}: {result.source}{date_str}**",
-                f"Title: {result.title}",
-                f"Content: {result.snippet}",
-                "",
-            ])
-        
-        lines.extend([
-            "---",
-            f"*Note: The above information was retrieved from web search on {current_date}. "
-            f"LLM knowledge cutoff is {TemporalConfig.MODEL_KNOWLEDGE_CUTOFF_DISPLAY}.*",
-            "",
-        ])
+            lines.append(
+                f"**Source {i}: {result.source}{date_str}**\n"
+                f"Title: {result.title}\n"
+                f"Content: {result.snippet}\n"
+            )
+        lines.append(footer)
         
         return "\n".join(lines)
     
-    def clear_cache(self):
+    async def clear_cache(self):
         """Clear the search result cache."""
-        global _search_cache
-        _search_cache.clear()
+        await self._cache.clear()
         logger.info("Search cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         return {
-            "cached_queries": len(_search_cache),
+            "backend": type(self._cache).__name__,
+            "cached_queries": self._cache.size(),
+            "max_size": SEARCH_CACHE_MAX_SIZE,
             "ttl_hours": self.settings.search_result_cache_ttl_hours,
+            "swr_window_hours": self.settings.search_swr_window_hours,
         }
 
 
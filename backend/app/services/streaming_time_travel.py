@@ -11,29 +11,81 @@ Key Benefits:
 """
 
 import asyncio
-import json
+import math
+import re
 import time
 import hashlib
 from datetime import datetime, timedelta
 from typing import AsyncGenerator, Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, field, asdict
 from enum import Enum
+from functools import lru_cache
 import logging
 
 from openai import AsyncOpenAI
-import httpx
 
 from ..config import get_settings, ModelConfig
+from ..utils.cache import TTLCache
 from ..utils.logging import get_logger
+from ..utils.serialization import JSONDecodeError, json_dumps_bytes, json_loads
+from ._http import get_shared_http_client
 
 logger = get_logger(__name__)
 
+# Pending snapshot deltas/results buffered between the API streams and the client
+SNAPSHOT_QUEUE_SIZE = 256
+
+# Completed snapshots keyed on (question hash, date, model). Answers as of a
+# past date do not change, so they live much longer than today's.
+SNAPSHOT_CACHE_MAX_SIZE = 1024
+SNAPSHOT_TTL_HISTORICAL_S = 7 * 24 * 3600
+SNAPSHOT_TTL_TODAY_S = 3600
+_snapshot_cache = TTLCache(maxsize=SNAPSHOT_CACHE_MAX_SIZE, ttl=SNAPSHOT_TTL_HISTORICAL_S)
+
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
+# Fraction of snapshots that must be done before the narrative is started early
+NARRATIVE_START_FRACTION = 0.75
+
+# Characters of each snapshot answer the narrative prompt includes
+NARRATIVE_ANSWER_CHARS = 500
+
+COMPLEXITY_PATTERNS = (
+    'best', 'top', 'leading', 'compare', 'analysis', 'explain',
+    'comprehensive', 'detailed', 'evolution', 'history'
+)
+AI_KEYWORDS = ('ai', 'gpt', 'llm', 'chatgpt', 'claude', 'model')
+
+# Complexity label by number of distinct complexity keywords (3 or more is complex)
+COMPLEXITY_BY_MATCHES = ("moderate", "moderate", "moderate", "complex")
+
+# Every complexity level uses the same snapshot model
+SNAPSHOT_MODEL = "gpt-4o"
+
+_COMPLEXITY_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, COMPLEXITY_PATTERNS)) + r")\b", re.IGNORECASE
+)
+_AI_RE = re.compile(r"\b(" + "|".join(map(re.escape, AI_KEYWORDS)) + r")\b", re.IGNORECASE)
+
+
+def _now_ms() -> float:
+    """Monotonic clock in milliseconds, for measuring durations."""
+    return time.perf_counter_ns() / 1e6
+
+
+@lru_cache(maxsize=1024)
+def _scan_question(question: str) -> Tuple[frozenset, bool]:
+    """Return the complexity keywords in a question and whether it is about AI."""
+    matches = frozenset(m.group(1).lower() for m in _COMPLEXITY_RE.finditer(question))
+    return matches, _AI_RE.search(question) is not None
+
 
 class StreamEventType(str, Enum):
     """Types of streaming events."""
     START = "start"
     CLASSIFICATION = "classification"
     SNAPSHOT = "snapshot"
+    SNAPSHOT_DELTA = "snapshot_delta"
     KEY_CHANGES = "key_changes"
     NARRATIVE = "narrative"
     INSIGHT = "insight"
@@ -43,33 +95,49 @@ class StreamEventType(str, Enum):
     HEARTBEAT = "heartbeat"
 
 
-@dataclass
 class StreamEvent:
-    """A single streaming event."""
-    type: StreamEventType
-    data: Dict[str, Any]
-    timestamp_ms: float = field(default_factory=lambda: time.time() * 1000)
+    """
+    A single streaming event.
     
-    def to_sse(self) -> str:
-        """Convert to Server-Sent Events format."""
+    raw holds payload fields that are already JSON-encoded; they are spliced
+    into the frame as-is instead of being serialized again.
+    """
+    __slots__ = ("type", "data", "timestamp_ms", "raw")
+    
+    def __init__(
+        self,
+        type: StreamEventType,
+        data: Dict[str, Any],
+        timestamp_ms: Optional[float] = None,
+        raw: Optional[Dict[str, bytes]] = None
+    ):
+        self.type = type
+        self.data = data
+        self.timestamp_ms = time.time_ns() // 1_000_000 if timestamp_ms is None else timestamp_ms
+        self.raw = raw
+    
+    def __repr__(self) -> str:
+        return f"StreamEvent(type={self.type.value!r}, data={self.data!r})"
+    
+    def to_sse_bytes(self) -> bytes:
+        """Convert to an encoded Server-Sent Events frame."""
         payload = {
             "type": self.type.value,
             "timestamp_ms": self.timestamp_ms,
             **self.data
         }
-        return f"data: {json.dumps(payload)}\n\n"
-
-
-@dataclass
-class SnapshotTask:
-    """A snapshot generation task with metadata."""
-    date: datetime
-    date_label: str
-    task: asyncio.Task
-    start_time: float = field(default_factory=time.time)
-    end_time: Optional[float] = None
-    result: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
+        body = json_dumps_bytes(payload)
+        if self.raw:
+            parts = [body[:-1]]  # Reopen the object before its closing brace
+            for key, value in self.raw.items():
+                parts.append(b"," + json_dumps_bytes(key) + b":" + value)
+            parts.append(b"}")
+            body = b"".join(parts)
+        return SSE_PREFIX + body + SSE_SUFFIX
+    
+    def to_sse(self) -> str:
+        """Convert to Server-Sent Events format."""
+        return self.to_sse_bytes().decode("utf-8")
 
 
 class StreamingTimeTravelService:
@@ -79,46 +147,41 @@ class StreamingTimeTravelService:
     Generates snapshots in parallel and yields results as they complete.
     """
     
-    COMPLEXITY_PATTERNS = [
-        'best', 'top', 'leading', 'compare', 'analysis', 'explain',
-        'comprehensive', 'detailed', 'evolution', 'history'
-    ]
-    
     def __init__(self):
         self.settings = get_settings()
-        self._http_client = httpx.AsyncClient(
-            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
-            timeout=httpx.Timeout(60.0, connect=10.0)
-        )
+        self._http_client = get_shared_http_client()
         self.client = AsyncOpenAI(
             api_key=self.settings.openai_api_key,
             http_client=self._http_client
         )
-        self._semaphore = asyncio.Semaphore(5)  # Limit concurrent API calls
     
-    async def close(self):
-        """Cleanup resources."""
-        await self._http_client.aclose()
+    def _get_client(self) -> AsyncOpenAI:
+        """Get the OpenAI client, rebuilding it if the shared pool was closed."""
+        if self._http_client.is_closed:
+            self._http_client = get_shared_http_client()
+            self.client = AsyncOpenAI(
+                api_key=self.settings.openai_api_key,
+                http_client=self._http_client
+            )
+        return self.client
     
-    def classify_complexity(self, question: str) -> Tuple[str, str]:
-        """Classify question complexity."""
-        question_lower = question.lower()
-        matches = [p for p in self.COMPLEXITY_PATTERNS if p in question_lower]
+    def classify(self, question: str) -> Tuple[str, str, bool]:
+        """
+        Classify a question in one scan.
         
-        if len(matches) >= 3:
-            return "complex", "gpt-4o"
-        elif len(matches) >= 1 or len(question.split()) > 10:
-            return "moderate", "gpt-4o"
-        else:
-            return "moderate", "gpt-4o"  # Default to moderate for temporal
+        Returns:
+            Tuple of (complexity, snapshot model, whether the question is about AI)
+        """
+        matches, is_ai = _scan_question(question)
+        complexity = COMPLEXITY_BY_MATCHES[min(len(matches), len(COMPLEXITY_BY_MATCHES) - 1)]
+        return complexity, SNAPSHOT_MODEL, is_ai
     
-    def get_time_points(self, question: str) -> List[Tuple[datetime, str]]:
+    def get_time_points(self, is_ai: bool) -> List[Tuple[datetime, str]]:
         """Get time points for snapshots."""
         today = datetime.now()
-        question_lower = question.lower()
         
         # AI-related questions use AI milestones
-        if any(kw in question_lower for kw in ['ai', 'gpt', 'llm', 'chatgpt', 'claude', 'model']):
+        if is_ai:
             return [
                 (datetime(2023, 1, 1), "Jan 2023 - Pre-GPT-4"),
                 (datetime(2023, 11, 1), "Nov 2023 - GPT-4 Turbo"),
@@ -134,16 +197,30 @@ class StreamingTimeTravelService:
             (datetime(today.year, today.month, today.day), f"Today ({today.strftime('%b %d, %Y')})"),
         ]
     
-    async def generate_single_snapshot(
+    async def stream_single_snapshot(
         self,
         question: str,
         date: datetime,
         date_label: str,
         model: str,
         max_tokens: int = 1000
-    ) -> Dict[str, Any]:
-        """Generate a single snapshot with timing."""
-        start_time = time.time()
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Stream a single snapshot from the API.
+        
+        Yields each answer text delta (str) as it arrives, then a final
+        result dict with the full answer, usage-based cost and timing.
+        Errors are reported in the final dict rather than raised. Cached
+        snapshots are yielded as the final dict alone.
+        """
+        start_time = _now_ms()
+        cache_key = (hashlib.sha1(question.encode()).digest(), date.date().isoformat(), model)
+        cached = _snapshot_cache.get(cache_key)
+        if cached is not None:
+            # Report the lookup, not the time the original generation took
+            yield {**cached, "duration_ms": round(_now_ms() - start_time, 2), "cached": True}
+            return
+        
         date_str = date.strftime("%B %d, %Y")
         
         system_prompt = f"""You are answering as if today is {date_str}.
@@ -154,33 +231,42 @@ Be comprehensive and include specific details, names, and dates."""
 
 Answer as if today is {date_str}. Include specific details from this time period."""
 
+        parts: List[str] = []
+        usage = None
         try:
-            async with self._semaphore:
-                response = await asyncio.wait_for(
-                    self.client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        max_tokens=max_tokens,
-                        temperature=0.5
-                    ),
-                    timeout=45.0
+            async with asyncio.timeout(45.0):
+                stream = await self._get_client().chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=0.5,
+                    stream=True,
+                    stream_options={"include_usage": True}
                 )
+                async for chunk in stream:
+                    # The terminal chunk carries usage and no choices
+                    if chunk.usage is not None:
+                        usage = chunk.usage
+                    if chunk.choices:
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            parts.append(delta)
+                            yield delta
             
-            end_time = time.time()
-            duration_ms = (end_time - start_time) * 1000
+            duration_ms = _now_ms() - start_time
             
-            answer = response.choices[0].message.content.strip()
-            tokens = response.usage.total_tokens if response.usage else 0
+            answer = "".join(parts).strip()
+            tokens = usage.total_tokens if usage else 0
             cost = ModelConfig.get_cost(
                 model,
-                response.usage.prompt_tokens if response.usage else 0,
-                response.usage.completion_tokens if response.usage else 0
+                usage.prompt_tokens if usage else 0,
+                usage.completion_tokens if usage else 0
             )
             
-            return {
+            result = {
                 "date": date.isoformat(),
                 "date_label": date_label,
                 "answer": answer,
@@ -190,13 +276,17 @@ Answer as if today is {date_str}. Include specific details from this time period
                 "duration_ms": round(duration_ms, 2),
                 "success": True
             }
+            ttl = SNAPSHOT_TTL_TODAY_S if date.date() >= datetime.now().date() else None
+            _snapshot_cache.set(cache_key, dict(result), ttl=ttl)
+            yield result
             
         except Exception as e:
-            end_time = time.time()
-            duration_ms = (end_time - start_time) * 1000
+            duration_ms = _now_ms() - start_time
+            if isinstance(e, TimeoutError):
+                e = TimeoutError("Snapshot timed out after 45s")
             logger.error(f"Snapshot error for {date_label}: {e}")
             
-            return {
+            yield {
                 "date": date.isoformat(),
                 "date_label": date_label,
                 "answer": f"Error generating snapshot: {str(e)}",
@@ -208,22 +298,35 @@ Answer as if today is {date_str}. Include specific details from this time period
                 "error": str(e)
             }
     
+    async def generate_single_snapshot(
+        self,
+        question: str,
+        date: datetime,
+        date_label: str,
+        model: str,
+        max_tokens: int = 1000
+    ) -> Dict[str, Any]:
+        """Generate a single snapshot with timing."""
+        async for item in self.stream_single_snapshot(question, date, date_label, model, max_tokens):
+            if isinstance(item, dict):
+                return item
+    
     async def generate_narrative(
         self,
         question: str,
         snapshots: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Generate evolution narrative from snapshots."""
-        start_time = time.time()
+        start_time = _now_ms()
         
         snapshot_summaries = "\n\n".join([
-            f"**{s['date_label']}**:\n{s['answer'][:500]}..."
+            f"**{s['date_label']}**:\n{s.get('answer_preview', s.get('answer', ''))[:NARRATIVE_ANSWER_CHARS]}..."
             for s in snapshots if s.get('success', True)
         ])
         
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4o",
+            response = await self._get_client().chat.completions.create(
+                model=self.settings.time_travel_narrative_model,
                 messages=[
                     {
                         "role": "system",
@@ -233,74 +336,41 @@ Answer as if today is {date_str}. Include specific details from this time period
 3. Change velocity (fast/moderate/slow)
 4. Future outlook (1 paragraph)
 
-Format as JSON with keys: narrative, insights, velocity, outlook"""
+Return a JSON object with keys: "narrative" (string), "insights" (array of
+strings), "velocity" ("fast", "moderate" or "slow") and "outlook" (string)."""
                     },
                     {
                         "role": "user",
                         "content": f"Question: {question}\n\nAnswers over time:\n{snapshot_summaries}"
                     }
                 ],
-                max_tokens=800,
-                temperature=0.5
+                max_tokens=500,
+                temperature=0.5,
+                response_format={"type": "json_object"}
             )
             
-            end_time = time.time()
-            duration_ms = (end_time - start_time) * 1000
+            duration_ms = _now_ms() - start_time
             
             content = response.choices[0].message.content.strip()
             
-            # Try to parse as JSON, fallback to raw text
+            # JSON mode guarantees an object; the fallback only covers truncation
             try:
-                # Remove markdown code blocks if present
-                clean_content = content
-                if "```" in clean_content:
-                    # Extract content between code blocks
-                    parts = clean_content.split("```")
-                    for part in parts:
-                        part = part.strip()
-                        if part.startswith("json"):
-                            part = part[4:].strip()
-                        if part.startswith("{") and part.endswith("}"):
-                            clean_content = part
-                            break
-                
-                # Also try to find JSON object in the content
-                if not clean_content.startswith("{"):
-                    start_idx = content.find("{")
-                    end_idx = content.rfind("}") + 1
-                    if start_idx != -1 and end_idx > start_idx:
-                        clean_content = content[start_idx:end_idx]
-                
-                parsed = json.loads(clean_content)
-                
-                # Ensure insights is a list of strings, not dicts
-                insights_list = parsed.get("insights", [])
-                if insights_list and isinstance(insights_list[0], dict):
-                    insights_list = [i.get("text", str(i)) for i in insights_list]
-                
-                return {
-                    "narrative": parsed.get("narrative", content),
-                    "insights": insights_list,
-                    "velocity": parsed.get("velocity", "moderate"),
-                    "outlook": parsed.get("outlook", ""),
-                    "duration_ms": round(duration_ms, 2),
-                    "success": True
-                }
-                
-            except (json.JSONDecodeError, Exception) as e:
+                parsed = json_loads(content)
+            except JSONDecodeError as e:
                 logger.warning(f"Failed to parse narrative JSON: {e}, using raw content")
-                return {
-                    "narrative": content,
-                    "insights": [],
-                    "velocity": "moderate",
-                    "outlook": "",
-                    "duration_ms": round(duration_ms, 2),
-                    "success": True
-                }
+                parsed = {}
+            
+            return {
+                "narrative": parsed.get("narrative", content),
+                "insights": parsed.get("insights", []),
+                "velocity": parsed.get("velocity", "moderate"),
+                "outlook": parsed.get("outlook", ""),
+                "duration_ms": round(duration_ms, 2),
+                "success": True
+            }
             
         except Exception as e:
-            end_time = time.time()
-            duration_ms = (end_time - start_time) * 1000
+            duration_ms = _now_ms() - start_time
             logger.error(f"Narrative generation error: {e}")
             
             return {
@@ -324,10 +394,13 @@ Format as JSON with keys: narrative, insights, velocity, outlook"""
         Yields events in this order:
         1. START - Initial metadata
         2. CLASSIFICATION - Complexity classification
-        3. SNAPSHOT (multiple) - Each snapshot as it completes
+        3. SNAPSHOT_DELTA (many) - Answer text as it streams in, tagged by slot
+           SNAPSHOT (multiple) - Each snapshot as it completes
         4. NARRATIVE - Evolution narrative
+           INSIGHT - All insights from the narrative, if any
         5. TIMING - Final timing breakdown
-        6. COMPLETE - Stream complete
+        6. COMPLETE - Aggregate stats only; snapshots, narrative and insights
+           were already sent by the events above and are not repeated
         
         Args:
             question: The user's question
@@ -336,7 +409,7 @@ Format as JSON with keys: narrative, insights, velocity, outlook"""
         Yields:
             StreamEvent objects that can be converted to SSE format
         """
-        total_start = time.time()
+        total_start = _now_ms()
         all_snapshots = []
         timing_steps = []
         
@@ -350,16 +423,17 @@ Format as JSON with keys: narrative, insights, velocity, outlook"""
         )
         
         # Event 2: CLASSIFICATION
-        classification_start = time.time()
-        complexity, model = self.classify_complexity(question)
-        time_points = self.get_time_points(question)
-        classification_ms = (time.time() - classification_start) * 1000
+        classification_start = _now_ms()
+        complexity, model, is_ai = self.classify(question)
+        time_points = self.get_time_points(is_ai)
+        classification_ms = _now_ms() - classification_start
         
         timing_steps.append({
             "step": "classification",
             "ms": round(classification_ms, 2),
             "provider": "system"
         })
+        slowest_step = timing_steps[0]
         
         yield StreamEvent(
             type=StreamEventType.CLASSIFICATION,
@@ -372,113 +446,161 @@ Format as JSON with keys: narrative, insights, velocity, outlook"""
             }
         )
         
-        # Create snapshot tasks (all start in parallel)
-        # Store task -> metadata mapping
-        pending_tasks = set()
-        task_metadata = {}
+        # Start all snapshots in parallel; each runner pushes its deltas and
+        # final result onto one queue, which is drained in arrival order.
+        # The bound applies backpressure to the API streams if the client is slow.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SNAPSHOT_QUEUE_SIZE)
         
-        for date, label in time_points:
-            task = asyncio.create_task(
-                self.generate_single_snapshot(question, date, label, model)
-            )
-            pending_tasks.add(task)
-            task_metadata[task] = (date, label)
+        async def run_snapshot(slot: int, date: datetime, label: str):
+            try:
+                async for item in self.stream_single_snapshot(question, date, label, model):
+                    await queue.put((slot, label, item))
+            except Exception as e:
+                await queue.put((slot, label, e))
+        
+        tasks = [
+            asyncio.create_task(run_snapshot(slot, date, label))
+            for slot, (date, label) in enumerate(time_points)
+        ]
         
-        # Event 3: SNAPSHOT (stream as each completes)
-        snapshots_start = time.time()
+        # Event 3: SNAPSHOT_DELTA while answers stream, SNAPSHOT as each completes
+        snapshots_start = _now_ms()
         completed_count = 0
+        # Running totals, so nothing has to rescan the snapshots at the end
+        snapshots_cost = 0.0
+        snapshots_tokens = 0
+        snapshots_sequential_ms = 0.0
         
-        # Use asyncio.wait with FIRST_COMPLETED to get actual task objects
-        while pending_tasks:
-            done, pending_tasks = await asyncio.wait(
-                pending_tasks, 
-                return_when=asyncio.FIRST_COMPLETED
-            )
-            
-            for completed_task in done:
-                try:
-                    result = await completed_task
-                    date, label = task_metadata[completed_task]
-                    completed_count += 1
-                    
-                    all_snapshots.append(result)
-                    
-                    timing_steps.append({
-                        "step": f"snapshot_{label.replace(' ', '_')}",
-                        "ms": result["duration_ms"],
-                        "provider": "openai",
-                        "model": result["model"]
-                    })
-                    
+        # Start the narrative once most snapshots are in, overlapping it with
+        # the slowest snapshot instead of waiting for all of them. Only freshly
+        # generated snapshots count: cache hits arrive at once, and counting them
+        # would start the narrative before any snapshot still being generated.
+        narrative_task: Optional[asyncio.Task] = None
+        speculative_at = math.ceil(len(time_points) * NARRATIVE_START_FRACTION)
+        generated_count = 0
+        
+        try:
+            while completed_count < len(time_points):
+                slot, label, item = await queue.get()
+                
+                if isinstance(item, str):
                     yield StreamEvent(
-                        type=StreamEventType.SNAPSHOT,
-                        data={
-                            "index": completed_count,
-                            "total": len(time_points),
-                            "snapshot": result,
-                            "remaining": len(time_points) - completed_count
-                        }
+                        type=StreamEventType.SNAPSHOT_DELTA,
+                        data={"slot": slot, "date_label": label, "delta": item}
                     )
-                    
-                except Exception as e:
-                    logger.error(f"Snapshot task error: {e}")
+                    continue
+                
+                completed_count += 1
+                
+                if isinstance(item, Exception):
+                    logger.error(f"Snapshot task error: {item}")
                     yield StreamEvent(
                         type=StreamEventType.ERROR,
                         data={
-                            "error": str(e),
+                            "error": str(item),
                             "step": "snapshot",
                             "recoverable": True
                         }
                     )
+                    continue
+                
+                result = item
+                all_snapshots.append(result)
+                snapshots_cost += result.get("cost", 0)
+                snapshots_tokens += result.get("tokens", 0)
+                if not result.get("cached"):
+                    generated_count += 1
+                    snapshots_sequential_ms += result["duration_ms"]
+                
+                if (
+                    narrative_task is None
+                    and self.settings.time_travel_speculative_narrative
+                    and generated_count >= speculative_at
+                    and completed_count < len(time_points)
+                ):
+                    narrative_task = asyncio.create_task(self.generate_narrative(
+                        question, sorted(all_snapshots, key=lambda x: x["date"])
+                    ))
+                
+                # Cache hits did no work, so they are not timing steps
+                if not result.get("cached"):
+                    step = {
+                        "step": f"snapshot_{label.replace(' ', '_')}",
+                        "ms": result["duration_ms"],
+                        "provider": "openai",
+                        "model": result["model"]
+                    }
+                    timing_steps.append(step)
+                    if step["ms"] > slowest_step["ms"]:
+                        slowest_step = step
+                
+                yield StreamEvent(
+                    type=StreamEventType.SNAPSHOT,
+                    data={
+                        "index": completed_count,
+                        "total": len(time_points),
+                        "remaining": len(time_points) - completed_count
+                    },
+                    raw={"snapshot": json_dumps_bytes(result)}
+                )
+                
+                # The client has the full answer now; keep only what the
+                # narrative reads so long answers are not held for the stream
+                result["answer_preview"] = result.pop("answer")[:NARRATIVE_ANSWER_CHARS]
+            
+            snapshots_total_ms = _now_ms() - snapshots_start
+            
+            # Sort snapshots by date for narrative
+            all_snapshots.sort(key=lambda x: x["date"])
+            
+            # Send heartbeat before narrative (can take a while)
+            yield StreamEvent(
+                type=StreamEventType.HEARTBEAT,
+                data={"message": "Generating evolution narrative..."}
+            )
+            
+            # Event 4: NARRATIVE
+            if narrative_task is not None:
+                narrative_result = await narrative_task
+            else:
+                narrative_result = await self.generate_narrative(question, all_snapshots)
+        finally:
+            # Only has an effect if the client went away mid-stream
+            for task in tasks:
+                task.cancel()
+            if narrative_task is not None:
+                narrative_task.cancel()
         
-        snapshots_total_ms = (time.time() - snapshots_start) * 1000
-        
-        # Sort snapshots by date for narrative
-        all_snapshots.sort(key=lambda x: x["date"])
-        
-        # Send heartbeat before narrative (can take a while)
-        yield StreamEvent(
-            type=StreamEventType.HEARTBEAT,
-            data={"message": "Generating evolution narrative..."}
-        )
-        
-        # Event 4: NARRATIVE
-        narrative_result = await self.generate_narrative(question, all_snapshots)
-        
-        timing_steps.append({
+        step = {
             "step": "narrative",
             "ms": narrative_result["duration_ms"],
             "provider": "openai",
-            "model": "gpt-4o"
-        })
+            "model": self.settings.time_travel_narrative_model
+        }
+        timing_steps.append(step)
+        if step["ms"] > slowest_step["ms"]:
+            slowest_step = step
         
         yield StreamEvent(
             type=StreamEventType.NARRATIVE,
             data=narrative_result
         )
         
-        # Event 5: INSIGHTS (send individually for progressive display)
-        for i, insight in enumerate(narrative_result.get("insights", [])):
+        # Event 5: INSIGHT (the whole list in one event)
+        insights = narrative_result.get("insights", [])
+        if insights:
             yield StreamEvent(
                 type=StreamEventType.INSIGHT,
-                data={
-                    "index": i + 1,
-                    "total": len(narrative_result.get("insights", [])),
-                    "insight": insight
-                }
+                data={"insights": insights, "total": len(insights)}
             )
         
         # Calculate final timing
-        total_ms = (time.time() - total_start) * 1000
+        total_ms = _now_ms() - total_start
         
         # Calculate what sequential would have taken
-        sequential_estimate = sum(s["duration_ms"] for s in all_snapshots) + narrative_result["duration_ms"]
+        sequential_estimate = snapshots_sequential_ms + narrative_result["duration_ms"]
         parallelization_savings = sequential_estimate - total_ms
         
-        # Find bottleneck
-        step_times = {s["step"]: s["ms"] for s in timing_steps}
-        slowest_step = max(timing_steps, key=lambda x: x["ms"])
-        
         # Event 6: TIMING
         yield StreamEvent(
             type=StreamEventType.TIMING,
@@ -495,20 +617,14 @@ Format as JSON with keys: narrative, insights, velocity, outlook"""
         )
         
         # Event 7: COMPLETE
-        total_cost = sum(s.get("cost", 0) for s in all_snapshots)
-        total_tokens = sum(s.get("tokens", 0) for s in all_snapshots)
-        
         yield StreamEvent(
             type=StreamEventType.COMPLETE,
             data={
                 "success": True,
                 "total_snapshots": len(all_snapshots),
-                "total_cost": round(total_cost, 6),
-                "total_tokens": total_tokens,
+                "total_cost": round(snapshots_cost, 6),
+                "total_tokens": snapshots_tokens,
                 "total_ms": round(total_ms, 2),
-                "snapshots": all_snapshots,
-                "narrative": narrative_result.get("narrative", ""),
-                "insights": narrative_result.get("insights", []),
                 "velocity": narrative_result.get("velocity", "moderate"),
                 "outlook": narrative_result.get("outlook", "")
             }
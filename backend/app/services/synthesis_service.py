@@ -13,6 +13,7 @@ from openai import AsyncOpenAI
 from ..config import get_settings, ModelConfig
 from ..schemas import ModelResponse, SynthesisResult, TokenUsage
 from ..utils.logging import get_logger
+from ._http import get_shared_http_client
 
 logger = get_logger(__name__)
 
@@ -52,20 +53,29 @@ Provide your synthesized answer:"""
         """Initialize the synthesis service."""
         self.settings = get_settings()
         self.client: Optional[AsyncOpenAI] = None
+        self._http_client = None
         self._initialize_client()
     
     def _initialize_client(self):
         """Initialize the OpenAI client."""
         if self.settings.validate_api_key():
+            self._http_client = get_shared_http_client()
             self.client = AsyncOpenAI(
                 api_key=self.settings.openai_api_key,
                 organization=self.settings.openai_org_id,
                 timeout=self.settings.request_timeout,
+                http_client=self._http_client,
             )
             logger.info("Synthesis service client initialized")
         else:
             logger.warning("Synthesis service: API key not configured")
     
+    def _get_client(self) -> Optional[AsyncOpenAI]:
+        """Get the OpenAI client, rebuilding it if the shared pool was closed."""
+        if self._http_client is not None and self._http_client.is_closed:
+            self._initialize_client()
+        return self.client
+    
     def _format_model_responses(self, responses: List[ModelResponse]) -> str:
         """Format model responses for the synthesis prompt."""
         formatted_parts = []
@@ -165,7 +175,8 @@ Provide your synthesized answer:"""
         )
         
         try:
-            if not self.client:
+            client = self._get_client()
+            if not client:
                 raise ValueError("OpenAI client not initialized. Check API key configuration.")
             
             logger.info(f"Synthesizing {len(successful_responses)} responses using {synthesis_model}")
@@ -196,7 +207,7 @@ Provide your synthesized answer:"""
                 completion_params["max_tokens"] = max_tokens
             
             response = await asyncio.wait_for(
-                self.client.chat.completions.create(**completion_params),
+                client.chat.completions.create(**completion_params),
                 timeout=self.settings.request_timeout
             )
             
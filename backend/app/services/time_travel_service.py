@@ -16,10 +16,15 @@ Key Features:
 import asyncio
 import hashlib
 import re
+import time
+import zlib
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Tuple
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import combinations, islice
 from openai import AsyncOpenAI
 
 from ..config import get_settings, ModelConfig
@@ -28,7 +33,18 @@ from ..schemas import (
     ModelResponse, TokenUsage, CacheStatus
 )
 from ..utils.logging import get_logger
-from ..utils.cache import cache_manager
+from ..utils.cache import TTLCache, cache_manager
+from ..utils.serialization import json_dumps_bytes, json_loads
+
+try:
+    import re2 as regex_engine  # optional - linear-time matching on user input
+except ImportError:
+    regex_engine = re
+
+try:
+    import xxhash  # optional - fast non-cryptographic cache keys
+except ImportError:
+    xxhash = None
 
 logger = get_logger(__name__)
 
@@ -48,7 +64,7 @@ class SnapshotComplexity(str, Enum):
     COMPLEX = "complex"    # Best model or ensemble (gpt-4-turbo)
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSnapshot:
     """A snapshot of the answer at a specific point in time."""
     date: datetime
@@ -60,9 +76,14 @@ class TimeSnapshot:
     tokens_used: int = 0
     cost_estimate: float = 0.0
     response_time_seconds: float = 0.0
+    # Lower-cased whitespace tokens of the answer, split once for the similarity checks
+    tokens: List[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.tokens = self.answer.lower().split()
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeTravelResult:
     """Complete result of a time-travel analysis."""
     question: str
@@ -79,6 +100,30 @@ class TimeTravelResult:
     is_eligible: bool = True  # Whether time-travel is applicable
     skip_reason: Optional[str] = None  # Reason if not eligible
     routing_validation_passed: bool = True  # Whether routing validation passed
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-compatible dictionary (dates as ISO strings)."""
+        data = asdict(self)
+        for snapshot in data["snapshots"]:
+            snapshot["date"] = snapshot["date"].isoformat()
+            del snapshot["tokens"]
+        return data
+    
+    def to_json(self) -> bytes:
+        """Encode as compact JSON bytes (orjson when installed)."""
+        return json_dumps_bytes(self.to_dict())
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TimeTravelResult":
+        """Rebuild a result produced by to_dict()."""
+        data = dict(data)
+        data["temporal_sensitivity"] = TemporalSensitivityLevel(data["temporal_sensitivity"])
+        data["base_complexity"] = SnapshotComplexity(data["base_complexity"])
+        data["snapshots"] = [
+            TimeSnapshot(**{**s, "date": datetime.fromisoformat(s["date"])})
+            for s in data.get("snapshots", [])
+        ]
+        return cls(**data)
 
 
 # Patterns for HIGH temporal sensitivity
@@ -117,9 +162,7 @@ HIGH_SENSITIVITY_PATTERNS = [
     r'\b(latest|recent|new)\s+(findings?|discoveries?|research|studies?|papers?)\b',
     r'\bbreakthrough\s+(in|for)\b',
     
-    # Explicit time markers after model cutoff
-    r'\b202[4-9]\b',
-    r'\b203\d\b',
+    # Explicit time markers (years after model cutoff are matched by _YEAR_RE)
     r'\b(this year|this month|this week|today|right now)\b',
 ]
 
@@ -142,6 +185,19 @@ MEDIUM_SENSITIVITY_PATTERNS = [
     r'\b(gdpr|ccpa|hipaa|data privacy)\s+(requirements?|updates?)\b',
 ]
 
+# Complexity patterns - HIGH indicators for COMPLEX routing
+COMPLEX_PATTERNS = [
+    r'\b(best|top|leading|most advanced|state of the art)\b',
+    r'\b(compare|comparison|versus|vs\.?|difference between)\b',
+    r'\b(architecture|design|implementation|strategy)\b',
+    r'\b(comprehensive|detailed|in-depth|thorough)\b',
+    r'\b(analysis|analyze|evaluate|assessment)\b',
+    r'\b(explain|how does|why does|mechanism)\b',
+    r'\b(future|prediction|forecast|outlook|trajectory)\b',
+    r'\b(evolution|history|development|progress)\b',
+    r'\b(implications|impact|consequences|effects)\b',
+]
+
 # Patterns for LOW/NO temporal sensitivity (should skip time-travel)
 TIMELESS_PATTERNS = [
     # Pure facts
@@ -166,15 +222,209 @@ TIMELESS_PATTERNS = [
 ]
 
 
-def compile_patterns(patterns: List[str]) -> List[re.Pattern]:
-    """Compile regex patterns for efficiency."""
-    return [re.compile(p, re.IGNORECASE) for p in patterns]
+def compile_alternation(patterns: List[str]) -> re.Pattern:
+    """
+    Fuse regex patterns into one case-insensitive alternation.
+    
+    Each pattern becomes a named group g<index>, so match.lastgroup tells
+    which pattern produced a match. Compiled with RE2 when google-re2 is
+    installed (none of the patterns use backreferences or lookaround),
+    otherwise with the stdlib re module. The flag is inline because the
+    two compile() signatures differ.
+    """
+    return regex_engine.compile(
+        "(?i)" + "|".join(f"(?P<g{i}>{p})" for i, p in enumerate(patterns))
+    )
+
+
+# Pre-compile one regex per category (a single scan instead of one per pattern)
+_high_re = compile_alternation(HIGH_SENSITIVITY_PATTERNS)
+_medium_re = compile_alternation(MEDIUM_SENSITIVITY_PATTERNS)
+_timeless_re = compile_alternation(TIMELESS_PATTERNS)
+_complex_re = compile_alternation(COMPLEX_PATTERNS)
+
+# Explicit year references after the model knowledge cutoff; checked before
+# the HIGH patterns since it settles the common "... in 2025" question alone
+_YEAR_RE = regex_engine.compile(r'\b(202[4-9]|203\d)\b')
+
+# Classifiers are pure functions of the normalized question, so repeat
+# questions are answered from an LRU cache
+CLASSIFIER_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+def _classify_question_complexity(question_lower: str) -> Tuple[SnapshotComplexity, str]:
+    """Cached body of TimeTravelService.classify_question_complexity."""
+    # Count complexity indicators (at most one per pattern)
+    complex_matches = []
+    matched_patterns = set()
+    for match in _complex_re.finditer(question_lower):
+        if match.lastgroup not in matched_patterns:
+            matched_patterns.add(match.lastgroup)
+            complex_matches.append(match.group())
+    
+    # Length-based heuristic
+    word_count = len(question_lower.split())
+    
+    # Determine complexity
+    if len(complex_matches) >= 3 or (len(complex_matches) >= 2 and word_count > 15):
+        return (
+            SnapshotComplexity.COMPLEX,
+            f"High complexity indicators found: {complex_matches[:3]}. Using best model for substantive analysis."
+        )
+    elif len(complex_matches) >= 1 or word_count > 10:
+        return (
+            SnapshotComplexity.MODERATE,
+            f"Moderate complexity: {complex_matches[:2] if complex_matches else 'multi-word question'}. Using balanced model."
+        )
+    else:
+        # For temporal queries, minimum is MODERATE to ensure quality
+        return (
+            SnapshotComplexity.MODERATE,
+            "Temporal queries default to moderate complexity for quality temporal synthesis."
+        )
+
+
+@lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+def _classify_temporal_sensitivity(question_lower: str) -> Tuple[TemporalSensitivityLevel, str]:
+    """Cached body of TimeTravelService.classify_temporal_sensitivity."""
+    # Check for timeless patterns first (these should skip time-travel)
+    if _timeless_re.search(question_lower):
+        return (
+            TemporalSensitivityLevel.NONE,
+            "Question asks about timeless facts or concepts that don't change over time."
+        )
+    
+    # Check for explicit year references after model cutoff
+    year_matches = _YEAR_RE.findall(question_lower)
+    if year_matches:
+        return (
+            TemporalSensitivityLevel.HIGH,
+            f"Question references years {year_matches} which are after model knowledge cutoff. Requires time-travel analysis."
+        )
+    
+    # Check for HIGH sensitivity patterns (only the first 3 are reported)
+    high_matches = [m.group() for m in islice(_high_re.finditer(question_lower), 3)]
+    
+    if high_matches:
+        return (
+            TemporalSensitivityLevel.HIGH,
+            f"Question contains high temporal sensitivity indicators: {', '.join(high_matches[:3])}. Answer likely changes significantly over time."
+        )
+    
+    # Check for MEDIUM sensitivity patterns
+    medium_matches = [m.group() for m in islice(_medium_re.finditer(question_lower), 3)]
+    
+    if medium_matches:
+        return (
+            TemporalSensitivityLevel.MEDIUM,
+            f"Question contains moderate temporal sensitivity indicators: {', '.join(medium_matches[:3])}. Answer may evolve over time."
+        )
+    
+    # Default to LOW sensitivity
+    return (
+        TemporalSensitivityLevel.LOW,
+        "No strong temporal indicators detected. Answer is relatively stable over time."
+    )
+
+
+# Keyword buckets for choosing time points (whole words or two-word phrases;
+# plurals are listed explicitly since matching is no longer by substring)
+_AI_KEYWORDS = frozenset({'ai', 'gpt', 'llm', 'llms', 'chatgpt', 'claude', 'gemini', 'model', 'models'})
+_POLITICS_KEYWORDS = frozenset({
+    'president', 'presidents', 'election', 'elections', 'government', 'governments',
+    'leader', 'leaders', 'prime minister'
+})
+_SPORTS_KEYWORDS = frozenset({
+    'super bowl', 'world cup', 'championship', 'championships', 'olympics', 'won',
+    'champion', 'champions'
+})
+_MARKET_KEYWORDS = frozenset({
+    'stock', 'stocks', 'market', 'markets', 'crypto', 'bitcoin', 'price', 'prices', 'trading'
+})
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Data points worth quoting from an answer, in reporting order
+DATA_POINT_KINDS = ("money", "percent", "year", "rank")
+_DATA_POINT_RE = re.compile(
+    r"(?P<money>\$[\d,]+(?:\.\d+)?(?:\s*(?:billion|million|trillion))?)"
+    r"|(?P<percent>\d+(?:\.\d+)?%)"
+    r"|(?P<year>\d{4})"
+    r"|(?P<rank>#\d+)"
+)
+# A sentence ends at a period followed by whitespace or the end of the text,
+# so decimals like "1.5" stay inside their sentence
+_SENTENCE_RE = re.compile(r"(?:[^.]|\.(?=\S))+")
+
+
+def _jaccard(a: set, b: set) -> float:
+    """Jaccard similarity of two non-empty sets, without materializing the union."""
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
 
 
-# Pre-compile all patterns
-_high_patterns = compile_patterns(HIGH_SENSITIVITY_PATTERNS)
-_medium_patterns = compile_patterns(MEDIUM_SENSITIVITY_PATTERNS)
-_timeless_patterns = compile_patterns(TIMELESS_PATTERNS)
+def _all_similar(word_sets: List[set], threshold: float) -> bool:
+    """True if every pair of word sets is more than threshold similar (empty sets count as similar)."""
+    if not all(word_sets):
+        return True
+    return all(_jaccard(a, b) > threshold for a, b in combinations(word_sets, 2))
+
+
+# Snapshot prompts; the user prompt is filled in per time point with str.format_map.
+# Everything before the date is identical across a request's snapshots, so
+# the date comes last and the shared prefix can be served from OpenAI's
+# automatic prompt cache.
+
+# Enhanced system prompt signaling TEMPORAL SYNTHESIS task
+SNAPSHOT_SYSTEM_PROMPT = """You are answering questions as if the current date is the answer date given at the end of the user's message.
+
+CRITICAL TEMPORAL SYNTHESIS RULES:
+1. Answer ONLY using information that would have been available on the answer date.
+2. Do NOT reference any events, releases, announcements, or data after the answer date.
+3. If something major happens after the answer date in real life, do NOT mention it.
+4. Provide specific numbers, names, dates, and metrics where available.
+5. Be COMPREHENSIVE and DETAILED - this is a temporal synthesis task requiring depth.
+
+IMPORTANT: This answer is part of a TEMPORAL SYNTHESIS task showing answer evolution.
+Provide detailed, substantive analysis that shows:
+- The state of the field/topic as of the answer date
+- Specific models, products, developments, or events available then
+- Context about what was significant at this time
+
+Remember: From your perspective, today is the answer date. You have NO knowledge of events after this date."""
+
+# Enhanced user prompt for temporal synthesis
+SNAPSHOT_USER_TEMPLATE = """Question: {question}
+
+REQUIRED ELEMENTS FOR TEMPORAL SYNTHESIS:
+1. A comprehensive answer based ONLY on knowledge available up to the answer date
+2. Specific data points, numbers, names, and dates from this time period
+3. The state of affairs as of this exact date
+4. Context about what was notable, new, or changing at this time
+
+If the question asks about something that doesn't exist yet as of the answer date, clearly state this.
+If something was just announced or released near the answer date, highlight that recency.
+
+Provide a thorough, well-structured response with concrete details.
+
+Answer date: {date_str}. Answer this question as if you are responding on {date_str}."""
+
+
+# Bound on cached TimeTravelResults (least recently used are evicted)
+TIME_TRAVEL_CACHE_MAX_SIZE = 1024
+
+
+def time_travel_cache_key(question: str) -> str:
+    """
+    Cache key for a question, ignoring case and surrounding whitespace.
+    
+    Used by TimeTravelService, whose keys also name Redis entries. The
+    optimized service's in-process cache keys on the normalized question.
+    """
+    data = question.strip().lower().encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
 class TimeTravelService:
@@ -187,33 +437,101 @@ class TimeTravelService:
         SnapshotComplexity.COMPLEX: "gpt-4-turbo",
     }
     
-    # Complexity patterns - HIGH indicators for COMPLEX routing
-    COMPLEX_PATTERNS = [
-        r'\b(best|top|leading|most advanced|state of the art)\b',
-        r'\b(compare|comparison|versus|vs\.?|difference between)\b',
-        r'\b(architecture|design|implementation|strategy)\b',
-        r'\b(comprehensive|detailed|in-depth|thorough)\b',
-        r'\b(analysis|analyze|evaluate|assessment)\b',
-        r'\b(explain|how does|why does|mechanism)\b',
-        r'\b(future|prediction|forecast|outlook|trajectory)\b',
-        r'\b(evolution|history|development|progress)\b',
-        r'\b(implications|impact|consequences|effects)\b',
-    ]
-    
-    # Compile patterns
-    _complex_patterns = None
+    # Snapshot answer length based on complexity
+    MAX_TOKENS_BY_COMPLEXITY = {
+        SnapshotComplexity.SIMPLE: 800,
+        SnapshotComplexity.MODERATE: 1200,
+        SnapshotComplexity.COMPLEX: 1500,
+    }
+    
+    # Redis key prefix for results shared across workers and restarts
+    REDIS_NAMESPACE = "tt"
+    # Seconds to wait before reconnecting after Redis could not be reached
+    REDIS_RETRY_INTERVAL_S = 30.0
     
     def __init__(self):
         self.settings = get_settings()
         self.client = AsyncOpenAI(api_key=self.settings.openai_api_key)
-        self._cache: Dict[str, Tuple[TimeTravelResult, datetime]] = {}
         self._cache_ttl = timedelta(hours=24)
+        self._cache = TTLCache(
+            maxsize=TIME_TRAVEL_CACHE_MAX_SIZE,
+            ttl=self._cache_ttl.total_seconds()
+        )
+        self._redis_client = None
+        self._redis_retry_at = 0.0
+    
+    async def _get_redis(self):
+        """Connect on first use; returns None when REDIS_URL is unset or unreachable.
         
-        # Compile complex patterns
-        if TimeTravelService._complex_patterns is None:
-            TimeTravelService._complex_patterns = [
-                re.compile(p, re.IGNORECASE) for p in self.COMPLEX_PATTERNS
-            ]
+        A failed connection is retried after REDIS_RETRY_INTERVAL_S, so a
+        transient outage does not leave the cache per-process for good.
+        """
+        if (
+            self._redis_client is None
+            and self.settings.redis_url
+            and time.monotonic() >= self._redis_retry_at
+        ):
+            # Push the next attempt out first so concurrent callers don't all connect
+            self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_INTERVAL_S
+            try:
+                import redis.asyncio as redis
+                client = redis.from_url(
+                    self.settings.redis_url, decode_responses=False, max_connections=10
+                )
+                await client.ping()
+                self._redis_client = client
+                logger.info("Time-travel cache connected to Redis")
+            except ImportError:
+                self._redis_retry_at = float("inf")
+                logger.warning("redis package not installed, time-travel cache is per-process")
+            except Exception as e:
+                logger.warning(
+                    "Failed to connect to Redis: %s, time-travel cache is per-process "
+                    "(retrying in %.0fs)", e, self.REDIS_RETRY_INTERVAL_S
+                )
+        return self._redis_client
+    
+    async def _cache_get(self, cache_key: str) -> Optional[TimeTravelResult]:
+        """Look a result up in the process cache, then in Redis."""
+        result = self._cache.get(cache_key)
+        if result is not None:
+            return result
+        client = await self._get_redis()
+        if client is None:
+            return None
+        try:
+            data = await client.get(f"{self.REDIS_NAMESPACE}:{cache_key}")
+            if data is None:
+                return None
+            result = TimeTravelResult.from_dict(json_loads(zlib.decompress(data)))
+        except Exception as e:
+            logger.error("Time-travel cache get error: %s", e)
+            return None
+        self._cache.set(cache_key, result)
+        return result
+    
+    async def _cache_set(self, cache_key: str, result: TimeTravelResult) -> None:
+        """Store a result in the process cache and, when configured, in Redis."""
+        self._cache.set(cache_key, result)
+        client = await self._get_redis()
+        if client is None:
+            return
+        data = zlib.compress(result.to_json())
+        try:
+            await client.setex(
+                f"{self.REDIS_NAMESPACE}:{cache_key}",
+                int(self._cache_ttl.total_seconds()),
+                data
+            )
+        except Exception as e:
+            logger.error("Time-travel cache set error: %s", e)
+    
+    async def aclose(self):
+        """Close the Redis connection pool."""
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+            self._redis_retry_at = 0.0
     
     def classify_question_complexity(self, question: str) -> Tuple[SnapshotComplexity, str]:
         """
@@ -228,35 +546,7 @@ class TimeTravelService:
         Returns:
             Tuple of (complexity_level, reasoning)
         """
-        question_lower = question.lower()
-        
-        # Count complexity indicators
-        complex_matches = []
-        for pattern in self._complex_patterns:
-            match = pattern.search(question_lower)
-            if match:
-                complex_matches.append(match.group())
-        
-        # Length-based heuristic
-        word_count = len(question.split())
-        
-        # Determine complexity
-        if len(complex_matches) >= 3 or (len(complex_matches) >= 2 and word_count > 15):
-            return (
-                SnapshotComplexity.COMPLEX,
-                f"High complexity indicators found: {complex_matches[:3]}. Using best model for substantive analysis."
-            )
-        elif len(complex_matches) >= 1 or word_count > 10:
-            return (
-                SnapshotComplexity.MODERATE,
-                f"Moderate complexity: {complex_matches[:2] if complex_matches else 'multi-word question'}. Using balanced model."
-            )
-        else:
-            # For temporal queries, minimum is MODERATE to ensure quality
-            return (
-                SnapshotComplexity.MODERATE,
-                "Temporal queries default to moderate complexity for quality temporal synthesis."
-            )
+        return _classify_question_complexity(question.strip().lower())
     
     def get_model_for_complexity(self, complexity: SnapshotComplexity) -> str:
         """
@@ -297,11 +587,11 @@ class TimeTravelService:
         
         # Check 3: Diversity check - snapshots should show distinct differences
         if len(snapshots) >= 2:
-            first_words = set(snapshots[0].answer.lower().split()[:50])
-            last_words = set(snapshots[-1].answer.lower().split()[:50])
+            first_words = set(snapshots[0].tokens[:50])
+            last_words = set(snapshots[-1].tokens[:50])
             
             if first_words and last_words:
-                overlap = len(first_words & last_words) / len(first_words | last_words)
+                overlap = _jaccard(first_words, last_words)
                 if overlap > 0.9:
                     logger.warning(f"High answer similarity ({overlap:.1%}) - temporal evolution may be weak")
         
@@ -314,58 +604,7 @@ class TimeTravelService:
         Returns:
             Tuple of (sensitivity_level, reasoning)
         """
-        question_lower = question.lower()
-        reasoning_parts = []
-        
-        # Check for timeless patterns first (these should skip time-travel)
-        for pattern in _timeless_patterns:
-            if pattern.search(question_lower):
-                return (
-                    TemporalSensitivityLevel.NONE,
-                    "Question asks about timeless facts or concepts that don't change over time."
-                )
-        
-        # Check for HIGH sensitivity patterns
-        high_matches = []
-        for pattern in _high_patterns:
-            match = pattern.search(question_lower)
-            if match:
-                high_matches.append(match.group())
-        
-        if high_matches:
-            reasoning_parts.append(f"High temporal indicators: {high_matches[:3]}")
-            return (
-                TemporalSensitivityLevel.HIGH,
-                f"Question contains high temporal sensitivity indicators: {', '.join(high_matches[:3])}. Answer likely changes significantly over time."
-            )
-        
-        # Check for MEDIUM sensitivity patterns
-        medium_matches = []
-        for pattern in _medium_patterns:
-            match = pattern.search(question_lower)
-            if match:
-                medium_matches.append(match.group())
-        
-        if medium_matches:
-            return (
-                TemporalSensitivityLevel.MEDIUM,
-                f"Question contains moderate temporal sensitivity indicators: {', '.join(medium_matches[:3])}. Answer may evolve over time."
-            )
-        
-        # Check for explicit year references after model cutoff
-        year_pattern = re.compile(r'\b(202[4-9]|203\d)\b')
-        year_matches = year_pattern.findall(question)
-        if year_matches:
-            return (
-                TemporalSensitivityLevel.HIGH,
-                f"Question references years {year_matches} which are after model knowledge cutoff. Requires time-travel analysis."
-            )
-        
-        # Default to LOW sensitivity
-        return (
-            TemporalSensitivityLevel.LOW,
-            "No strong temporal indicators detected. Answer is relatively stable over time."
-        )
+        return _classify_temporal_sensitivity(question.strip().lower())
     
     def identify_time_points(
         self,
@@ -385,11 +624,14 @@ class TimeTravelService:
         year_pattern = re.compile(r'\b(20\d{2})\b')
         mentioned_years = [int(y) for y in year_pattern.findall(question)]
         
-        # Determine time point strategy based on question content
-        question_lower = question.lower()
+        # Determine time point strategy based on question content: tokenize
+        # once into words and two-word phrases, then test each keyword bucket
+        words = _WORD_RE.findall(question.lower())
+        tokens = set(words)
+        tokens.update(map(" ".join, zip(words, words[1:])))
         
         # AI/Tech-related questions (use AI milestone dates)
-        if any(kw in question_lower for kw in ['ai', 'gpt', 'llm', 'chatgpt', 'claude', 'gemini', 'model']):
+        if not tokens.isdisjoint(_AI_KEYWORDS):
             return [
                 (datetime(2023, 1, 1), "Jan 2023 - Pre-GPT-4 Era"),
                 (datetime(2023, 3, 14), "Mar 2023 - GPT-4 Release"),
@@ -399,7 +641,7 @@ class TimeTravelService:
             ]
         
         # Politics/Leadership questions
-        if any(kw in question_lower for kw in ['president', 'election', 'government', 'leader', 'prime minister']):
+        if not tokens.isdisjoint(_POLITICS_KEYWORDS):
             return [
                 (datetime(2021, 1, 1), "Jan 2021 - Start of Biden Term"),
                 (datetime(2023, 1, 1), "Jan 2023 - Mid-term Period"),
@@ -409,7 +651,7 @@ class TimeTravelService:
             ]
         
         # Sports/Championships (annual cycle)
-        if any(kw in question_lower for kw in ['super bowl', 'world cup', 'championship', 'olympics', 'won', 'champion']):
+        if not tokens.isdisjoint(_SPORTS_KEYWORDS):
             return [
                 (datetime(2022, 1, 1), "2022 - Season Snapshot"),
                 (datetime(2023, 1, 1), "2023 - Season Snapshot"),
@@ -419,7 +661,7 @@ class TimeTravelService:
             ]
         
         # Market/Financial questions (quarterly snapshots)
-        if any(kw in question_lower for kw in ['stock', 'market', 'crypto', 'bitcoin', 'price', 'trading']):
+        if not tokens.isdisjoint(_MARKET_KEYWORDS):
             return [
                 (datetime(2023, 1, 1), "Q1 2023"),
                 (datetime(2023, 7, 1), "Q3 2023"),
@@ -460,65 +702,28 @@ class TimeTravelService:
             TimeSnapshot with the answer
         """
         date_str = date.strftime("%B %d, %Y")
+        user_prompt = SNAPSHOT_USER_TEMPLATE.format_map(
+            {"date_str": date_str, "question": question}
+        )
         
-        # Enhanced system prompt signaling TEMPORAL SYNTHESIS task
-        system_prompt = f"""You are answering questions as if the current date is {date_str}.
-
-CRITICAL TEMPORAL SYNTHESIS RULES:
-1. Answer ONLY using information that would have been available on {date_str}.
-2. Do NOT reference any events, releases, announcements, or data after {date_str}.
-3. If something major happens after {date_str} in real life, do NOT mention it.
-4. Provide specific numbers, names, dates, and metrics where available.
-5. Be COMPREHENSIVE and DETAILED - this is a temporal synthesis task requiring depth.
-
-IMPORTANT: This answer is part of a TEMPORAL SYNTHESIS task showing answer evolution.
-Provide detailed, substantive analysis that shows:
-- The state of the field/topic as of {date_str}
-- Specific models, products, developments, or events available then
-- Context about what was significant at this time
-
-Remember: From your perspective, today is {date_str}. You have NO knowledge of events after this date."""
-
-        # Enhanced user prompt for temporal synthesis
-        user_prompt = f"""Question: {question}
-
-Answer this question as if you are responding on {date_str}. 
-
-REQUIRED ELEMENTS FOR TEMPORAL SYNTHESIS:
-1. A comprehensive answer based ONLY on knowledge available up to {date_str}
-2. Specific data points, numbers, names, and dates from this time period
-3. The state of affairs as of this exact date
-4. Context about what was notable, new, or changing at this time
-
-If the question asks about something that doesn't exist yet as of {date_str}, clearly state this.
-If something was just announced or released near {date_str}, highlight that recency.
-
-Provide a thorough, well-structured response with concrete details."""
-
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
-            # Adjust max_tokens based on complexity
-            max_tokens_map = {
-                SnapshotComplexity.SIMPLE: 800,
-                SnapshotComplexity.MODERATE: 1200,
-                SnapshotComplexity.COMPLEX: 1500,
-            }
-            max_tokens = max_tokens_map.get(complexity, 1200)
+            max_tokens = self.MAX_TOKENS_BY_COMPLEXITY.get(complexity, 1200)
             
             logger.info(f"Generating snapshot for {date_label} using model={model}, complexity={complexity.value}")
             
             response = await self.client.chat.completions.create(
                 model=model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": SNAPSHOT_SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=max_tokens,
                 temperature=0.5,
             )
             
-            response_time = (datetime.now() - start_time).total_seconds()
+            response_time = time.perf_counter() - start_time
             answer = response.choices[0].message.content.strip()
             
             # Calculate cost
@@ -617,29 +822,88 @@ List 2-3 key changes or differences as bullet points (one line each). If no sign
             logger.error(f"Error extracting key changes: {e}")
             return []
     
+    async def _extract_all_key_changes(self, snapshots: List[TimeSnapshot]) -> List[List[str]]:
+        """
+        Extract key changes for every consecutive pair of snapshots in one request.
+        
+        Args:
+            snapshots: Snapshots in chronological order
+            
+        Returns:
+            One list of up to 3 changes per transition (len(snapshots) - 1 lists)
+        """
+        transitions = len(snapshots) - 1
+        if transitions < 1:
+            return []
+        
+        periods = "\n\n".join(
+            f"{i}. {snapshot.date_label}:\n{snapshot.answer[:500]}"
+            for i, snapshot in enumerate(snapshots, 1)
+        )
+        try:
+            response = await self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are analyzing differences between answers from consecutive time periods. List 2-3 key changes concisely for each transition."
+                    },
+                    {
+                        "role": "user",
+                        "content": f"""Compare these answers from different time periods, in chronological order:
+
+{periods}
+
+For each of the {transitions} transitions (1 to 2, 2 to 3, ...), list 2-3 key changes or differences, one short line each. If a transition has no significant changes, use ["No major changes"].
+
+Respond with JSON: {{"transitions": [{{"changes": ["..."]}}, ...]}} with exactly {transitions} entries in order."""
+                    }
+                ],
+                max_tokens=200 * transitions,
+                temperature=0.3,
+                response_format={"type": "json_object"},
+            )
+            
+            entries = json_loads(response.choices[0].message.content)["transitions"]
+            all_changes = [
+                [str(change).strip().lstrip('-•* ') for change in entry.get("changes", [])][:3]
+                for entry in entries[:transitions]
+            ]
+        except Exception as e:
+            logger.error(f"Error extracting key changes: {e}")
+            all_changes = []
+        
+        # Transitions the model skipped get no changes, as a failed extraction would
+        all_changes.extend([] for _ in range(transitions - len(all_changes)))
+        return all_changes
+    
     def _extract_data_points(self, answer: str) -> List[str]:
         """Extract key data points from an answer."""
-        data_points = []
-        
-        # Look for numbers with context
-        number_patterns = [
-            r'\$[\d,]+(?:\.\d+)?(?:\s*(?:billion|million|trillion))?',  # Money
-            r'\d+(?:\.\d+)?%',  # Percentages
-            r'\d{4}',  # Years
-            r'#\d+',  # Rankings
-        ]
+        # Look for numbers with context, in one pass over the answer
+        matches_by_kind: Dict[str, List[re.Match]] = {kind: [] for kind in DATA_POINT_KINDS}
+        for match in _DATA_POINT_RE.finditer(answer):
+            found = matches_by_kind[match.lastgroup]
+            if len(found) < 2:  # Limit to 2 per kind
+                found.append(match)
+        
+        if not any(matches_by_kind.values()):
+            return []
         
-        for pattern in number_patterns:
-            matches = re.findall(pattern, answer)
-            for match in matches[:2]:  # Limit to 2 per pattern
-                # Find the sentence containing this match
-                sentences = answer.split('.')
-                for sentence in sentences:
-                    if match in sentence and len(sentence) < 150:
-                        data_points.append(sentence.strip())
-                        break
+        # Find the sentence containing each match
+        sentences = list(_SENTENCE_RE.finditer(answer))
+        sentence_starts = [sentence.start() for sentence in sentences]
         
-        return data_points[:3]  # Limit to 3 data points
+        data_points = []
+        for kind in DATA_POINT_KINDS:
+            for match in matches_by_kind[kind]:
+                sentence = sentences[bisect_right(sentence_starts, match.start()) - 1]
+                text = sentence.group().strip()
+                if sentence.end() >= match.end() and len(sentence.group()) < 150 and text not in data_points:
+                    data_points.append(text)
+                    if len(data_points) == 3:  # Limit to 3 data points
+                        return data_points
+        
+        return data_points
     
     async def generate_evolution_narrative(
         self,
@@ -746,25 +1010,10 @@ Analyze how the answer to this question evolved over time."""
         if len(snapshots) < 2:
             return True
         
-        # Compare first and last answers for significant differences
-        first = snapshots[0].answer.lower()
-        last = snapshots[-1].answer.lower()
-        
-        # Simple similarity check - if very similar, consider identical
-        # Count common words
-        first_words = set(first.split())
-        last_words = set(last.split())
-        
-        if not first_words or not last_words:
-            return True
-        
-        intersection = first_words.intersection(last_words)
-        union = first_words.union(last_words)
-        
-        similarity = len(intersection) / len(union) if union else 1.0
-        
-        # If more than 85% similar, consider identical
-        return similarity > 0.85
+        # Compare every pair of answers, so drift that returns to the starting
+        # point by the last snapshot still counts as a change.
+        # If all are more than 85% similar, consider identical
+        return _all_similar([set(s.tokens) for s in snapshots], 0.85)
     
     async def generate_time_travel_answer(
         self,
@@ -781,15 +1030,14 @@ Analyze how the answer to this question evolved over time."""
         Returns:
             TimeTravelResult with complete time-travel analysis
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Check cache first
-        cache_key = hashlib.md5(f"time_travel:{question}".encode()).hexdigest()
-        if cache_key in self._cache:
-            cached_result, cached_at = self._cache[cache_key]
-            if datetime.now() - cached_at < self._cache_ttl:
-                logger.info(f"Time-travel cache hit for question: {question[:50]}...")
-                return cached_result
+        cache_key = time_travel_cache_key(question)
+        cached_result = await self._cache_get(cache_key)
+        if cached_result is not None:
+            logger.info(f"Time-travel cache hit for question: {question[:50]}...")
+            return cached_result
         
         # Step 1: Classify temporal sensitivity
         sensitivity, sensitivity_reasoning = self.classify_temporal_sensitivity(question)
@@ -836,23 +1084,26 @@ Analyze how the answer to this question evolved over time."""
         
         # Step 5: Generate snapshots with PRESERVED complexity routing
         # CRITICAL: All snapshots use the same model based on original complexity
-        snapshots = []
-        previous_snapshot = None
-        
-        # Generate snapshots sequentially to allow comparison
-        for date, label in time_points:
-            snapshot = await self.generate_snapshot(
+        # Snapshots are independent, so they are generated concurrently
+        snapshots = list(await asyncio.gather(*(
+            self.generate_snapshot(
                 question=question,
                 date=date,
                 date_label=label,
-                previous_snapshot=previous_snapshot,
                 model=model_for_snapshots,  # FIXED: Use complexity-based model, NOT hardcoded
                 complexity=base_complexity   # Pass complexity for max_tokens adjustment
             )
-            snapshots.append(snapshot)
-            previous_snapshot = snapshot
-            
-            logger.debug(f"Generated snapshot for {label}: model={model_for_snapshots}, length={len(snapshot.answer)}")
+            for date, label in time_points
+        )))
+        
+        # Key changes compare consecutive snapshots, so they need every snapshot first;
+        # all transitions are extracted in a single request
+        all_key_changes = await self._extract_all_key_changes(snapshots)
+        for snapshot, key_changes in zip(snapshots[1:], all_key_changes):
+            snapshot.key_changes = key_changes
+        
+        for snapshot in snapshots:
+            logger.debug(f"Generated snapshot for {snapshot.date_label}: model={model_for_snapshots}, length={len(snapshot.answer)}")
         
         # Step 6: Validate routing quality
         routing_valid, validation_reason = self.validate_temporal_routing(snapshots)
@@ -878,7 +1129,7 @@ Analyze how the answer to this question evolved over time."""
         
         # Calculate totals
         total_cost = sum(s.cost_estimate for s in snapshots)
-        total_time = (datetime.now() - start_time).total_seconds()
+        total_time = time.perf_counter() - start_time
         
         result = TimeTravelResult(
             question=question,
@@ -897,7 +1148,7 @@ Analyze how the answer to this question evolved over time."""
         )
         
         # Cache the result
-        self._cache[cache_key] = (result, datetime.now())
+        await self._cache_set(cache_key, result)
         
         logger.info(
             f"Time-travel answer generated: {len(snapshots)} snapshots, "
@@ -6,8 +6,9 @@ Implements in-memory caching with TTL and request rate limiting.
 import hashlib
 import json
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, Optional
 from threading import Lock
 from dataclasses import dataclass, field
 
@@ -151,6 +152,80 @@ class CacheManager:
             }
 
 
+class TTLCache:
+    """
+    Bounded in-memory LRU cache with per-entry expiry.
+    
+    Expiry uses time.monotonic() deadlines, so wall-clock jumps do not
+    affect it. Not thread-safe: intended for state owned by the event loop.
+    """
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Default time-to-live in seconds (None means entries never expire)
+        """
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a live value and mark it as recently used.
+        
+        Args:
+            key: The cache key
+            default: Returned when the key is missing or expired
+            
+        Returns:
+            The cached value or default
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, deadline = entry
+        if deadline is not None and time.monotonic() >= deadline:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key: The cache key
+            value: The value to cache
+            ttl: Time-to-live in seconds (uses the cache default if not specified)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        deadline = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (value, deadline)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key and return its value (expired or not)."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+    
+    def clear(self) -> None:
+        """Clear all entries from the cache."""
+        self._data.clear()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and (entry[1] is None or time.monotonic() < entry[1])
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 @dataclass
 class RateLimitEntry:
     """Track rate limit for a client."""
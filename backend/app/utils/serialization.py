@@ -0,0 +1,41 @@
+"""
+Fast JSON helpers.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise, so callers get the same API either way.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional - falls back to stdlib json
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except
+# clause covers both implementations.
+JSONDecodeError = json.JSONDecodeError
+
+HAS_ORJSON = orjson is not None
+
+
+def json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Decode a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(
+        obj, default=default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode obj as a compact JSON string."""
+    return json_dumps_bytes(obj, default=default).decode("utf-8")
@@ -0,0 +1,64 @@
+"""
+Request coalescing for async call sites.
+
+Concurrent calls that share a key await one underlying coroutine instead of
+each starting their own (the "singleflight" pattern).
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent async work by key.
+
+    The shared work runs in its own task, so a cancelled caller does not
+    cancel it for the others. Keys are forgotten as soon as the work
+    finishes; results are not cached.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() unless a call with the same key is already in flight.
+
+        Args:
+            key: Identity of the work; equal keys share one execution
+            fn: Zero-argument coroutine factory, only called by the first caller
+
+        Returns:
+            The result of the shared execution (exceptions propagate to every caller)
+        """
+        return await asyncio.shield(self.start(key, fn))
+
+    def start(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> "asyncio.Task[T]":
+        """
+        Start fn() in the background unless a call with the same key is in flight.
+
+        Args:
+            key: Identity of the work; equal keys share one execution
+            fn: Zero-argument coroutine factory, only called if nothing is in flight
+
+        Returns:
+            The task running the shared execution
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        return task
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved even if every caller went away
+
+    def __len__(self) -> int:
+        return len(self._inflight)
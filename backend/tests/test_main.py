@@ -14,9 +14,32 @@ from app.schemas import (
     TokenUsage,
     CacheStatus,
 )
-from app.utils.cache import CacheManager, RateLimiter
+from app.utils.cache import CacheManager, RateLimiter, TTLCache
 from app.services.llm_service import LLMService
 from app.services.synthesis_service import SynthesisService
+from app.services.streaming_time_travel import (
+    StreamingTimeTravelService,
+    StreamEvent,
+    StreamEventType,
+    _snapshot_cache,
+)
+from app.services.search_service import (
+    RedisSearchCache,
+    SearchService,
+    SearchResponse,
+    SearchResult,
+    _search_cache,
+)
+from app.services.time_travel_service import (
+    TimeTravelService,
+    TimeTravelResult,
+    TimeSnapshot,
+    TemporalSensitivityLevel,
+    SnapshotComplexity,
+)
+from app.services._http import aclose_shared_http_client, get_shared_http_client
+from app.routes import streaming as streaming_routes
+from app.utils.serialization import json_loads
 
 
 class TestModelConfig:
@@ -158,6 +181,28 @@ class TestCacheManager:
         assert cache.get("key2") is None
 
 
+class TestTTLCache:
+    """Tests for TTLCache."""
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+    
+    def test_expired_entry(self):
+        """Test that expired entries are dropped on read."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key1", "value1", ttl=0)
+        assert cache.get("key1") is None
+        assert len(cache) == 0
+
+
 class TestRateLimiter:
     """Tests for RateLimiter."""
     
@@ -269,6 +314,569 @@ class TestLLMServiceAsync:
         
         assert len(responses) == 2
 
+    
+    async def test_call_models_with_tail_cutoff_cancels_straggler(self):
+        """Test the slowest model is dropped once enough responses are in."""
+        service = LLMService()
+        
+        async def fake_call_model(model, question, max_tokens, temperature, use_cache):
+            await asyncio.sleep(5.0 if model == "gpt-4-turbo" else 0.0)
+            return ModelResponse(
+                model_name=model,
+                response_text=f"answer from {model}",
+                tokens_used=TokenUsage(),
+                cost_estimate=0.0,
+                response_time_seconds=0.01,
+                timestamp=datetime.utcnow(),
+                cache_status=CacheStatus.MISS,
+            )
+        
+        service.call_model = fake_call_model
+        responses = await service.call_models_with_tail_cutoff(
+            models=["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"],
+            question="Test question",
+            min_responses=2,
+            min_tail_seconds=0.05,
+        )
+        
+        assert [r.model_name for r in responses] == ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
+        assert [r.success for r in responses] == [False, True, True]
+        assert "tail deadline" in responses[0].error
+
+
+class TestSearchService:
+    """Tests for the search service cache and provider fallback."""
+    
+    @pytest.fixture
+    async def service(self):
+        """Create a search service with an empty cache."""
+        service = SearchService()
+        await service.clear_cache()
+        yield service
+        await service.clear_cache()
+    
+    @staticmethod
+    def _response(query, provider="tavily"):
+        return SearchResponse(
+            success=True,
+            results=[SearchResult(title="t", url="https://example.com", snippet="s", source="example.com")],
+            query=query,
+            provider=provider,
+        )
+    
+    async def test_cache_hit_uses_normalized_query(self, service):
+        """Test cached results are found regardless of case and whitespace."""
+        await service._cache_result("Latest AI News", self._response("Latest AI News"))
+        
+        cached = await service._get_cached_result("  latest ai news ")
+        
+        assert cached is not None
+        assert cached.cached is True
+        assert cached.cache_timestamp is not None
+        assert await service._get_cached_result("other query") is None
+    
+    def test_cache_key_normalization(self, service):
+        """Test whitespace, case, width and trailing punctuation do not split keys."""
+        key = service._get_cache_key("Latest AI news")
+        
+        assert service._get_cache_key("  latest\tAI   NEWS?! ") == key
+        assert service._get_cache_key("Ｌａｔｅｓｔ AI news.") == key
+        assert service._get_cache_key("news AI latest") != key
+    
+    async def test_cache_expires_after_ttl(self, service):
+        """Test entries are not served once their TTL has passed."""
+        service.settings = Settings(search_result_cache_ttl_hours=0, search_swr_window_hours=0)
+        await service._cache_result("query", self._response("query"))
+        
+        assert await service._get_cached_result("query") is None
+    
+    def test_ttl_adapts_to_query_volatility(self, service):
+        """Test news-like queries expire sooner than reference questions."""
+        base = service.settings.search_result_cache_ttl_hours * 3600
+        
+        assert service._classify_ttl("Breaking news on the election") == base * 0.1
+        assert service._classify_ttl("What is photosynthesis?") == base * 3.0
+        assert service._classify_ttl("What is new in Python 2025?") == base
+    
+    async def test_stale_result_is_served_while_revalidating(self, service):
+        """Test an expired entry within the SWR window is returned and refreshed."""
+        service.settings = Settings(search_result_cache_ttl_hours=0, search_swr_window_hours=1)
+        stale = self._response("query")
+        await service._cache_result("query", stale)
+        fresh = self._response("query", provider="serper")
+        
+        async def refresh(query, num_results):
+            return fresh
+        
+        service._provider_searches = lambda: [refresh]
+        response = await service.search_web("query", num_results=5)
+        
+        assert response is stale
+        assert response.cached is True
+        await asyncio.sleep(0.05)
+        assert _search_cache.get("query")[0] is fresh
+    
+    def test_response_round_trips_through_dict(self):
+        """Test the serialized form used by the Redis backend rebuilds the response."""
+        response = self._response("query")
+        response.cache_timestamp = datetime(2025, 1, 1, 12, 0)
+        
+        assert SearchResponse.from_dict(response.to_dict()) == response
+    
+    async def test_extract_domain(self, service):
+        """Test domains are extracted without scheme, www prefix, port or path."""
+        assert service._extract_domain("https://www.Example.com/news?id=1") == "example.com"
+        assert service._extract_domain("http://api.example.org:8080/x") == "api.example.org"
+        assert service._extract_domain("not a url") == "not a url"
+    
+    async def test_concurrent_identical_searches_are_coalesced(self, service):
+        """Test concurrent cache misses for one query make a single provider call."""
+        calls = []
+        
+        async def slow_search(query, num_results):
+            calls.append(query)
+            await asyncio.sleep(0.05)
+            return self._response(query)
+        
+        service._provider_searches = lambda: [slow_search]
+        responses = await asyncio.gather(
+            service.search_web("Latest AI news", num_results=5),
+            service.search_web("latest ai news ", num_results=5),
+        )
+        
+        assert len(calls) == 1
+        assert responses[0] is responses[1]
+    
+    async def test_failed_primary_falls_back_to_secondary(self, service):
+        """Test a failing primary provider is hedged with the other one."""
+        async def failing(query, num_results):
+            return SearchResponse(success=False, query=query, provider="tavily", error_message="boom")
+        
+        async def working(query, num_results):
+            return self._response(query, provider="serper")
+        
+        response = await service._search_hedged([failing, working], "query", 5)
+        
+        assert response.success is True
+        assert response.provider == "serper"
+    
+    async def test_healthy_primary_skips_secondary(self, service):
+        """Test the backup provider is not called when the primary answers quickly."""
+        backup = AsyncMock()
+        
+        async def working(query, num_results):
+            return self._response(query)
+        
+        response = await service._search_hedged([working, backup], "query", 5)
+        
+        assert response.provider == "tavily"
+        backup.assert_not_called()
+    
+    async def test_hedge_delay_comes_from_settings(self, service):
+        """Test the backup starts only once the configured hedge delay has passed."""
+        backup = AsyncMock(return_value=self._response("query", provider="serper"))
+        
+        async def slow(query, num_results):
+            await asyncio.sleep(0.05)
+            return self._response(query)
+        
+        response = await service._search_hedged([slow, backup], "query", 5)
+        assert response.provider == "tavily"
+        backup.assert_not_called()
+        
+        service.settings = service.settings.model_copy(update={"search_hedge_delay_seconds": 0.01})
+        response = await service._search_hedged([slow, backup], "query", 5)
+        assert response.provider == "serper"
+    
+    async def test_redis_cache_corrupt_entry_is_a_miss(self):
+        """Test an undecodable Redis entry is logged and treated as a miss."""
+        cache = RedisSearchCache("redis://localhost")
+        cache._redis_client = Mock()
+        cache._redis_client.get = AsyncMock(return_value=b"not json")
+        
+        assert await cache.get("key") is None
+    
+    async def test_redis_cache_clear_deletes_each_page_at_once(self):
+        """Test clear issues one DELETE per SCAN page."""
+        cache = RedisSearchCache("redis://localhost")
+        cache._redis_client = Mock()
+        cache._redis_client.scan = AsyncMock(side_effect=[
+            (7, [b"search:a", b"search:b"]),
+            (0, [b"search:c"]),
+        ])
+        cache._redis_client.delete = AsyncMock()
+        
+        await cache.clear()
+        
+        assert cache._redis_client.delete.await_args_list == [
+            ((b"search:a", b"search:b"),),
+            ((b"search:c",),),
+        ]
+    
+    async def test_redis_cache_reconnects_after_failure(self):
+        """Test a failed Redis connection is retried once the interval passes."""
+        cache = RedisSearchCache("redis://localhost")
+        down = Mock(ping=AsyncMock(side_effect=ConnectionError("down")))
+        up = Mock(ping=AsyncMock())
+        
+        with patch("redis.asyncio.from_url", side_effect=[down, up]) as from_url:
+            assert await cache._get_redis() is None
+            assert await cache._get_redis() is None
+            cache._retry_at = 0.0
+            assert await cache._get_redis() is up
+        
+        assert from_url.call_count == 2
+
+
+class TestStreamingTimeTravel:
+    """Tests for the streaming time-travel service."""
+    
+    async def test_snapshot_deltas_stream_before_each_snapshot(self):
+        """Test answer deltas are forwarded, then one SNAPSHOT per time point."""
+        service = StreamingTimeTravelService()
+        
+        async def fake_stream(question, date, label, model, max_tokens=1000):
+            for delta in ("Hello", " world"):
+                yield delta
+            yield {
+                "date": date.isoformat(), "date_label": label, "answer": "Hello world",
+                "model": model, "tokens": 3, "cost": 0.001, "duration_ms": 5.0, "success": True,
+            }
+        
+        service.stream_single_snapshot = fake_stream
+        service.generate_narrative = AsyncMock(return_value={
+            "narrative": "n", "insights": ["i"], "velocity": "fast", "outlook": "",
+            "duration_ms": 1.0, "success": True,
+        })
+        
+        events = [e async for e in service.stream_time_travel("How has AI changed?")]
+        types = [e.type for e in events]
+        
+        assert types.count(StreamEventType.SNAPSHOT_DELTA) == 8
+        assert types.count(StreamEventType.SNAPSHOT) == 4
+        assert types.index(StreamEventType.SNAPSHOT_DELTA) < types.index(StreamEventType.SNAPSHOT)
+        assert types[-1] == StreamEventType.COMPLETE
+    
+    async def test_narrative_starts_before_last_snapshot(self):
+        """Test the narrative is started once most snapshots are done."""
+        service = StreamingTimeTravelService()
+        narrative_started = asyncio.Event()
+        calls = []
+        
+        async def fake_stream(question, date, label, model, max_tokens=1000):
+            calls.append(label)
+            if len(calls) == 1:
+                # Hold one snapshot back until the narrative has started
+                await narrative_started.wait()
+            yield {
+                "date": date.isoformat(), "date_label": label, "answer": "a",
+                "model": model, "tokens": 1, "cost": 0.0, "duration_ms": 1.0, "success": True,
+            }
+        
+        async def fake_narrative(question, snapshots):
+            narrative_started.set()
+            return {
+                "narrative": "n", "insights": [], "velocity": "fast", "outlook": "",
+                "duration_ms": 1.0, "success": True,
+            }
+        
+        service.stream_single_snapshot = fake_stream
+        service.generate_narrative = AsyncMock(side_effect=fake_narrative)
+        
+        events = [e async for e in service.stream_time_travel("How has AI changed?")]
+        
+        service.generate_narrative.assert_awaited_once()
+        assert len(service.generate_narrative.await_args.args[1]) == 3
+        assert events[-1].type == StreamEventType.COMPLETE
+    
+    async def test_cached_snapshots_do_not_start_narrative_early(self):
+        """Test the narrative waits for a generated snapshot when the others are cached."""
+        service = StreamingTimeTravelService()
+        today = asyncio.Event()
+        
+        async def fake_stream(question, date, label, model, max_tokens=1000):
+            cached = label != "Today"
+            if not cached:
+                await today.wait()
+            yield {
+                "date": date.isoformat(), "date_label": label, "answer": "a",
+                "model": model, "tokens": 1, "cost": 0.0, "duration_ms": 1.0,
+                "success": True, "cached": cached,
+            }
+        
+        async def fake_narrative(question, snapshots):
+            return {
+                "narrative": "n", "insights": [], "velocity": "fast", "outlook": "",
+                "duration_ms": 1.0, "success": True,
+            }
+        
+        service.stream_single_snapshot = fake_stream
+        service.generate_narrative = AsyncMock(side_effect=fake_narrative)
+        service.get_time_points = Mock(return_value=[
+            (datetime(2023, 1, 1), "Jan 2023"),
+            (datetime(2024, 1, 1), "Jan 2024"),
+            (datetime(2025, 1, 1), "Jan 2025"),
+            (datetime(2026, 1, 1), "Today"),
+        ])
+        
+        events = []
+        async for event in service.stream_time_travel("How has AI changed?"):
+            events.append(event)
+            if event.type == StreamEventType.SNAPSHOT and event.data["index"] == 3:
+                today.set()
+        
+        service.generate_narrative.assert_awaited_once()
+        labels = [s["date_label"] for s in service.generate_narrative.await_args.args[1]]
+        assert labels == ["Jan 2023", "Jan 2024", "Jan 2025", "Today"]
+        
+        # Cached snapshots are not reported as work in the timing breakdown
+        timing = next(e for e in events if e.type == StreamEventType.TIMING).data
+        assert [s["step"] for s in timing["steps"] if s["step"].startswith("snapshot")] == ["snapshot_Today"]
+        assert timing["bottleneck"] != "snapshot_Jan_2023"
+        assert timing["sequential_estimate_ms"] == 2.0
+    
+    def test_to_sse_bytes_splices_preencoded_fields(self):
+        """Test raw fields are emitted alongside the regular payload."""
+        event = StreamEvent(
+            type=StreamEventType.COMPLETE,
+            data={"success": True},
+            timestamp_ms=1.0,
+            raw={"snapshots": b'[{"answer":"a"}]'},
+        )
+        frame = event.to_sse_bytes()
+        
+        assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+        assert json_loads(frame[len(b"data: "):-2]) == {
+            "type": "complete",
+            "timestamp_ms": 1.0,
+            "success": True,
+            "snapshots": [{"answer": "a"}],
+        }
+    
+    async def test_completed_snapshots_are_cached(self):
+        """Test a repeated (question, date, model) snapshot skips the API."""
+        _snapshot_cache.clear()
+        service = StreamingTimeTravelService()
+        
+        async def fake_chunks():
+            yield Mock(usage=None, choices=[Mock(delta=Mock(content="Answer"))])
+            yield Mock(usage=Mock(total_tokens=3, prompt_tokens=2, completion_tokens=1), choices=[])
+        
+        create = AsyncMock(side_effect=lambda **kwargs: fake_chunks())
+        service.client = Mock()
+        service.client.chat.completions.create = create
+        
+        date = datetime(2023, 1, 1)
+        first = [i async for i in service.stream_single_snapshot("Q?", date, "Jan 2023", "gpt-4o")]
+        second = [i async for i in service.stream_single_snapshot("Q?", date, "Jan 2023", "gpt-4o")]
+        
+        assert create.await_count == 1
+        assert first == ["Answer", first[-1]]
+        assert len(second) == 1
+        assert second[0]["answer"] == "Answer"
+        assert second[0]["cached"] is True
+        assert second[0]["duration_ms"] <= first[-1]["duration_ms"]
+        _snapshot_cache.clear()
+    
+    async def test_event_generator_batches_bursts(self):
+        """Test bursts of events share one write while START is flushed alone."""
+        async def fake_stream(question, force=False):
+            yield StreamEvent(type=StreamEventType.START, data={})
+            for i in range(5):
+                yield StreamEvent(type=StreamEventType.INSIGHT, data={"insight": i})
+            yield StreamEvent(type=StreamEventType.COMPLETE, data={})
+        
+        with patch.object(
+            streaming_routes.streaming_time_travel_service, "stream_time_travel", fake_stream
+        ):
+            chunks = [c async for c in streaming_routes.event_generator("q")]
+        
+        assert len(chunks) == 2
+        assert chunks[0].count(b"data: ") == 1
+        assert chunks[1].count(b"data: ") == 6
+        assert b'"type":"complete"' in chunks[1]
+    
+    async def test_event_generator_sends_heartbeats_while_idle(self):
+        """Test a heartbeat is written when the service is quiet."""
+        async def slow_stream(question, force=False):
+            yield StreamEvent(type=StreamEventType.START, data={})
+            await asyncio.sleep(0.05)
+            yield StreamEvent(type=StreamEventType.COMPLETE, data={})
+        
+        with patch.object(
+            streaming_routes.streaming_time_travel_service, "stream_time_travel", slow_stream
+        ), patch.object(streaming_routes, "HEARTBEAT_INTERVAL_S", 0.01):
+            chunks = [c async for c in streaming_routes.event_generator("q")]
+        
+        assert any(b'"type":"heartbeat"' in c for c in chunks)
+        assert b'"type":"complete"' in chunks[-1]
+    
+    async def test_disconnect_with_full_queue_stops_producer(self):
+        """Test the producer task ends when the client leaves mid-stream."""
+        async def long_stream(question, force=False):
+            for i in range(1000):
+                yield StreamEvent(type=StreamEventType.SNAPSHOT_DELTA, data={"delta": str(i)})
+        
+        with patch.object(
+            streaming_routes.streaming_time_travel_service, "stream_time_travel", long_stream
+        ):
+            gen = streaming_routes.event_generator("q")
+            await gen.__anext__()
+            await asyncio.sleep(0.01)  # let the producer fill the queue
+            await gen.aclose()
+            await asyncio.sleep(0)
+        
+        producers = [
+            t for t in asyncio.all_tasks() if t.get_coro().__name__ == "produce"
+        ]
+        assert all(t.done() for t in producers)
+    
+    async def test_client_rebuilt_after_shared_pool_closed(self):
+        """Test a closed shared pool (app shutdown) is replaced on next use."""
+        service = StreamingTimeTravelService()
+        old_client = service._get_client()
+        
+        await aclose_shared_http_client()
+        
+        client = service._get_client()
+        assert client is not old_client
+        assert not service._http_client.is_closed
+        assert service._http_client is get_shared_http_client()
+
+
+class TestTimeTravelService:
+    """Tests for the time-travel service."""
+    
+    @pytest.fixture
+    def service(self):
+        return TimeTravelService()
+    
+    def test_sensitivity_levels(self, service):
+        """Test each sensitivity category is detected."""
+        assert service.classify_temporal_sensitivity("What is photosynthesis?")[0] == TemporalSensitivityLevel.NONE
+        assert service.classify_temporal_sensitivity("What are the latest AI breakthroughs?")[0] == TemporalSensitivityLevel.HIGH
+        assert service.classify_temporal_sensitivity("How has Python evolved?")[0] == TemporalSensitivityLevel.MEDIUM
+        assert service.classify_temporal_sensitivity("Why is the sky blue?")[0] == TemporalSensitivityLevel.LOW
+        assert service.classify_temporal_sensitivity("Who led the polls in 2025?")[0] == TemporalSensitivityLevel.HIGH
+    
+    def test_complexity_counts_each_pattern_once(self, service):
+        """Test several words from one pattern count as a single indicator."""
+        same_pattern = service.classify_question_complexity("compare comparison versus")
+        distinct = service.classify_question_complexity("compare the best architecture")
+        
+        assert same_pattern[0] == SnapshotComplexity.MODERATE
+        assert distinct[0] == SnapshotComplexity.COMPLEX
+    
+    def test_extract_data_points_quotes_containing_sentences(self, service):
+        """Test each data point is the sentence it occurs in, without duplicates."""
+        answer = (
+            "OpenAI raised $6.6 billion in 2024. Usage grew 45% year over year. "
+            "It ranks #1 in chatbots. Unrelated text here."
+        )
+        
+        assert service._extract_data_points(answer) == [
+            "OpenAI raised $6.6 billion in 2024",
+            "Usage grew 45% year over year",
+            "It ranks #1 in chatbots",
+        ]
+        assert service._extract_data_points("No numbers at all.") == []
+    
+    async def test_snapshots_run_concurrently_then_key_changes(self, service):
+        """Test snapshots overlap and each later one gets changes vs its predecessor."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_snapshot(question, date, date_label, previous_snapshot=None, model="", complexity=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return TimeSnapshot(date=date, date_label=date_label, answer=f"answer {date_label} " * 100)
+        
+        service.generate_snapshot = fake_snapshot
+        service._extract_all_key_changes = AsyncMock(
+            side_effect=lambda snapshots: [
+                [f"{previous.date_label} -> {current.date_label}"]
+                for previous, current in zip(snapshots, snapshots[1:])
+            ]
+        )
+        service.generate_evolution_narrative = AsyncMock(return_value=("n", [], "fast", ""))
+        
+        result = await service.generate_time_travel_answer("What are the latest AI breakthroughs?")
+        
+        assert peak == len(result.snapshots) > 1
+        assert result.snapshots[0].key_changes == []
+        for previous, current in zip(result.snapshots, result.snapshots[1:]):
+            assert current.key_changes == [f"{previous.date_label} -> {current.date_label}"]
+    
+    def test_identical_check_sees_middle_drift(self, service):
+        """Test a changed middle snapshot is not hidden by matching endpoints."""
+        def snap(answer):
+            return TimeSnapshot(date=datetime(2024, 1, 1), date_label="Jan 2024", answer=answer)
+        same = "the model leads every benchmark this year by a wide margin"
+        
+        assert service._check_answers_identical([snap(same), snap(same), snap(same)])
+        assert not service._check_answers_identical([snap(same), snap("a new rival overtook it"), snap(same)])
+    
+    async def test_key_changes_extracted_in_one_request(self, service):
+        """Test all transitions come from a single call, padded if the model skips some."""
+        snapshots = [
+            TimeSnapshot(date=datetime(2020 + i, 1, 1), date_label=f"Jan {2020 + i}", answer="a")
+            for i in range(4)
+        ]
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=(
+            '{"transitions": [{"changes": ["- GPT-4 released", "b", "c", "d"]}, {"changes": []}]}'
+        )))]
+        service.client = Mock()
+        service.client.chat.completions.create = AsyncMock(return_value=response)
+        
+        changes = await service._extract_all_key_changes(snapshots)
+        
+        assert service.client.chat.completions.create.await_count == 1
+        assert changes == [["GPT-4 released", "b", "c"], [], []]
+    
+    async def test_snapshot_error_returns_fallback(self, service):
+        """Test a failed model call yields a placeholder snapshot instead of raising."""
+        service.client = Mock()
+        service.client.chat.completions.create = AsyncMock(side_effect=RuntimeError("boom"))
+        
+        snapshot = await service.generate_snapshot("q", datetime(2024, 1, 1), "Jan 2024")
+        
+        assert snapshot.answer == "Unable to generate snapshot for January 01, 2024: boom"
+        assert snapshot.tokens_used == 0
+    
+    async def test_redis_reconnects_after_failure(self, service):
+        """Test a transient Redis failure is retried once the interval passes."""
+        service.settings = Mock(redis_url="redis://localhost")
+        down = Mock(ping=AsyncMock(side_effect=ConnectionError("down")))
+        up = Mock(ping=AsyncMock())
+        
+        with patch("redis.asyncio.from_url", side_effect=[down, up]) as from_url:
+            assert await service._get_redis() is None
+            assert await service._get_redis() is None
+            service._redis_retry_at = 0.0
+            assert await service._get_redis() is up
+        
+        assert from_url.call_count == 2
+    
+    def test_result_round_trips_through_json(self):
+        """Test a result survives the serialized form used by the Redis cache."""
+        result = TimeTravelResult(
+            question="What are the latest AI breakthroughs?",
+            temporal_sensitivity=TemporalSensitivityLevel.HIGH,
+            sensitivity_reasoning="news",
+            base_complexity=SnapshotComplexity.COMPLEX,
+            snapshots=[TimeSnapshot(date=datetime(2024, 1, 1), date_label="Jan 2024", answer="a", key_changes=["x"])],
+            insights=["i"],
+        )
+        
+        restored = TimeTravelResult.from_dict(json_loads(result.to_json()))
+        
+        assert restored == result
+        assert restored.snapshots[0].date == datetime(2024, 1, 1)
+
 
 # Run tests with: pytest tests/test_main.py -v
 if __name__ == "__main__":
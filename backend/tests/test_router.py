@@ -3,11 +3,16 @@ Tests for the Query Router Service.
 Tests classification, routing decisions, and cost calculations.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
-from app.services.router_service import RouterService, router_service
+from app.services.router_service import (
+    RouterService, router_service, detect_temporal_query, detect_temporal_query_cached,
+    _answer_cache
+)
+from app.routes import router as router_routes
 from app.schemas import (
     QueryClassification, RoutingDecision, CostBreakdown,
     ComplexityLevel, QueryIntent, QueryDomain,
@@ -15,6 +20,21 @@ from app.schemas import (
 )
 
 
+def _model_response(model_name, response_text=None, **fields):
+    """Build a successful ModelResponse; fields override the defaults."""
+    values = dict(
+        model_name=model_name,
+        response_text=response_text or f"answer from {model_name}",
+        tokens_used=TokenUsage(),
+        cost_estimate=0.0,
+        response_time_seconds=1.0,
+        timestamp=datetime.utcnow(),
+        cache_status=CacheStatus.MISS
+    )
+    values.update(fields)
+    return ModelResponse(**values)
+
+
 class TestQueryClassification:
     """Test query classification functionality."""
     
@@ -50,6 +70,54 @@ class TestQueryClassification:
         
         assert key1 != key2
 
+    def test_cache_key_is_temporal_aware(self, router):
+        """Test temporal variants of the same wording get distinct cache keys."""
+        question = "What changed in Python?"
+        key_2024 = router._get_cache_key(question, detect_temporal_query("Python 2024"))
+        key_2025 = router._get_cache_key(question, detect_temporal_query("Python 2025"))
+
+        assert key_2024 != key_2025
+        assert key_2024[0] == key_2025[0]  # Same normalized question digest
+
+    @pytest.mark.asyncio
+    async def test_strong_temporal_query_skips_llm(self, router):
+        """Test high-confidence temporal queries are classified without OpenAI."""
+        router.client = MagicMock()
+        router.client.chat.completions.create = AsyncMock()
+
+        classification, cost, usage = await router.classify_query(
+            "What are the latest AI model releases in 2025?"
+        )
+
+        router.client.chat.completions.create.assert_not_called()
+        assert cost == 0.0
+        assert usage.total_tokens == 0
+        assert classification.requires_search is True
+        assert classification.complexity != ComplexityLevel.SIMPLE
+        assert classification.domain == QueryDomain.TECHNICAL
+
+
+class TestTemporalDetection:
+    """Test rule-based temporal detection."""
+
+    def test_current_data_requires_whole_word(self):
+        """Test current-data markers only match whole words."""
+        assert detect_temporal_query("What is the latest Python release?").requires_current_data
+        assert not detect_temporal_query("What do you know about Python?").requires_current_data
+
+    def test_cached_detection_matches_uncached(self):
+        """Test memoized detection returns equal but independent results."""
+        question = "What happened this year in AI?"
+        first = detect_temporal_query_cached(question)
+        second = detect_temporal_query_cached(question)
+
+        assert first == detect_temporal_query(question)
+        assert first == second
+        assert first is not second
+
+        first.detected_keywords.append("mutated")
+        assert "mutated" not in detect_temporal_query_cached(question).detected_keywords
+
 
 class TestRoutingDecision:
     """Test routing decision logic."""
@@ -113,6 +181,23 @@ class TestRoutingDecision:
         assert decision.use_synthesis == True
         assert decision.synthesis_model is not None
     
+    def test_estimated_time_uses_model_profiles(self, router):
+        """Test time estimates come from the slowest model plus synthesis."""
+        classification = QueryClassification(
+            complexity=ComplexityLevel.COMPLEX,
+            intent=QueryIntent.ANALYTICAL,
+            domain=QueryDomain.RESEARCH,
+            requires_search=False,
+            recommended_models=["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"],
+            reasoning="Complex research question",
+            confidence=0.92
+        )
+
+        decision = router.determine_execution_path(classification)
+
+        synthesis_latency = router._model_latency(decision.synthesis_model, 4.0)
+        assert decision.estimated_time_seconds == 5.0 + synthesis_latency
+
     def test_override_models(self, router):
         """Test model override functionality."""
         classification = QueryClassification(
@@ -189,6 +274,21 @@ class TestCostCalculation:
         cost = router._calculate_cost("unknown-model", token_usage)
         assert cost == 0.0
     
+    def test_estimate_cost_batch_matches_single(self, router):
+        """Test batch estimates match per-route estimates."""
+        routes = [
+            ["gpt-4o-mini"],
+            ["gpt-4o-mini", "gpt-4o"],
+            ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini", "unknown-model"],
+        ]
+
+        batch = router._estimate_cost_batch(routes, use_synthesis=True)
+
+        assert batch == [router._estimate_cost(r, True) for r in routes]
+        # gpt-4o-mini: 500 input + 1000 output tokens
+        expected = (500 * 0.00015 / 1000) + (1000 * 0.0006 / 1000)
+        assert router._estimate_cost(["gpt-4o-mini"], False) == round(expected, 6)
+
     def test_cost_breakdown_calculation(self, router):
         """Test cost breakdown calculation."""
         model_responses = [
@@ -228,6 +328,20 @@ class TestCostCalculation:
         assert "gpt-4o" in breakdown.model_costs
 
 
+class TestFinalAnswerSelection:
+    """Test choosing the final answer without synthesis."""
+
+    def test_highest_priority_model_wins(self):
+        """Test gpt-4o is preferred over gpt-4o-mini regardless of order."""
+        responses = [_model_response("gpt-4o-mini"), _model_response("gpt-4o")]
+        assert RouterService._pick_best_response(responses).model_name == "gpt-4o"
+
+    def test_unknown_models_fall_back_to_first(self):
+        """Test the first response is used when no priority model answered."""
+        responses = [_model_response("gpt-5.2"), _model_response("other")]
+        assert RouterService._pick_best_response(responses).model_name == "gpt-5.2"
+
+
 class TestRoutingStats:
     """Test routing statistics functionality."""
     
@@ -247,6 +361,23 @@ class TestRoutingStats:
         assert stats["total_cost"] == 0.0
         assert stats["total_savings"] == 0.0
 
+    def test_update_stats_counts_complexity_and_models(self, router):
+        """Test stats tally complexity levels and per-model usage."""
+        breakdown = CostBreakdown(
+            model_costs={}, total_cost=0.01, full_ensemble_cost=0.1,
+            savings=0.09, savings_percentage=90.0
+        )
+        responses = [_model_response(name) for name in ("gpt-4o-mini", "gpt-4o")]
+
+        router._update_stats(ComplexityLevel.MODERATE, breakdown, responses)
+        router._update_stats(ComplexityLevel.SIMPLE, breakdown, responses[:1])
+        stats = router.get_stats()
+
+        assert stats["total_queries"] == 2
+        assert stats["simple_queries"] == 1
+        assert stats["moderate_queries"] == 1
+        assert stats["model_usage_distribution"] == {"gpt-4o-mini": 2, "gpt-4o": 1}
+
 
 class TestClassificationExamples:
     """Test classification with example queries."""
@@ -293,6 +424,166 @@ class TestRouterIntegration:
         # Skipping for now as it requires more complex setup
         pass
 
+    @pytest.mark.asyncio
+    async def test_full_override_skips_classification(self):
+        """Test fixed models plus fixed synthesis bypass the classifier."""
+        router = RouterService()
+        router.clear_answer_cache()
+        router.classify_query = AsyncMock()
+        response = _model_response("gpt-4o-mini", "Python is a programming language.", cost_estimate=0.0001)
+
+        with patch("app.services.router_service.llm_service") as mock_llm:
+            mock_llm.call_models_parallel = AsyncMock(return_value=[response])
+            result = await router.route_and_answer(
+                "What is Python?",
+                override_models=["gpt-4o-mini"],
+                force_synthesis=False
+            )
+
+        router.classify_query.assert_not_called()
+        assert result.final_answer == response.response_text
+        assert result.cost_breakdown.classification_cost == 0.0
+        assert result.classification_skipped is True
+        stats = router.get_stats()
+        assert stats["total_queries"] == 1
+        assert stats["moderate_queries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_are_coalesced(self):
+        """Test duplicate in-flight requests share one execution."""
+        router = RouterService()
+        calls = 0
+
+        async def fake_route(*args):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "response"
+
+        router._route_and_answer = fake_route
+        # Current-data questions bypass the answer cache
+        results = await asyncio.gather(
+            router.route_and_answer("What is the latest Python release?"),
+            router.route_and_answer("What is the latest Python release?"),
+            router.route_and_answer("What is the latest Rust release?"),
+        )
+
+        assert results == ["response"] * 3
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_evergreen_question_served_from_answer_cache(self):
+        """Test a repeated non-temporal question does not re-run the ensemble."""
+        router = RouterService()
+        router.clear_answer_cache()
+        router.classify_query = AsyncMock()
+        response = _model_response("gpt-4o-mini", "Paris.", cost_estimate=0.0001)
+
+        with patch("app.services.router_service.llm_service") as mock_llm:
+            mock_llm.call_models_parallel = AsyncMock(return_value=[response])
+            kwargs = dict(override_models=["gpt-4o-mini"], force_synthesis=False)
+            first = await router.route_and_answer("What is the capital of France?", **kwargs)
+            second = await router.route_and_answer("What is the capital of France?", **kwargs)
+
+        assert mock_llm.call_models_parallel.await_count == 1
+        assert second.final_answer == first.final_answer
+        assert second.cost_breakdown.total_cost == 0.0
+        stats = router.get_stats()
+        assert stats["total_queries"] == 2
+        assert stats["answer_cache_hits"] == 1
+        # The hit is free, but not a routing saving
+        assert stats["total_savings"] == round(first.cost_breakdown.savings, 4)
+        
+        # Hits are independent copies of the cached entry
+        second.individual_responses[0].response_text = "changed"
+        with patch("app.services.router_service.llm_service"):
+            third = await router.route_and_answer("What is the capital of France?", **kwargs)
+        assert third.individual_responses[0].response_text == "Paris."
+        router.clear_answer_cache()
+    
+    @pytest.mark.asyncio
+    async def test_clear_answer_cache_endpoint(self):
+        """Test the endpoint empties the answer cache."""
+        _answer_cache.set("key", "cached answer")
+        
+        result = await router_routes.clear_answer_cache()
+        
+        assert len(_answer_cache) == 0
+        assert result["message"] == "Answer cache cleared"
+
+    @pytest.mark.asyncio
+    async def test_model_failure_falls_back_to_full_ensemble(self):
+        """Test a failed model call retries with the full ensemble."""
+        router = RouterService()
+        router.clear_answer_cache()
+        responses = [_model_response(name) for name in ("gpt-4-turbo", "gpt-4o", "gpt-4o-mini")]
+
+        with patch("app.services.router_service.llm_service") as mock_llm, \
+             patch("app.services.router_service.synthesis_service") as mock_synthesis:
+            mock_llm.call_models_parallel = AsyncMock(side_effect=[RuntimeError("boom"), responses])
+            mock_synthesis.synthesize = AsyncMock(side_effect=RuntimeError("no synthesis"))
+            result = await router.route_and_answer(
+                "Explain recursion", override_models=["gpt-4o-mini"], force_synthesis=False
+            )
+
+        fallback_call = mock_llm.call_models_parallel.await_args_list[1]
+        assert fallback_call.kwargs["models"] == ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
+        assert result.fallback_used is True
+        assert result.models_used == ["gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
+        assert result.final_answer == "answer from gpt-4-turbo"
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_replaces_only_the_failed_model(self):
+        """Test a failed routed model is swapped for one cheap untried model."""
+        router = RouterService()
+        router.clear_answer_cache()
+        classification = QueryClassification(
+            complexity=ComplexityLevel.SIMPLE,
+            intent=QueryIntent.FACTUAL,
+            domain=QueryDomain.GENERAL,
+            requires_search=False,
+            recommended_models=["gpt-4o-mini"],
+            reasoning="Simple factual question",
+            confidence=0.95
+        )
+        router.classify_query = AsyncMock(return_value=(classification, 0.0, TokenUsage()))
+        first_pass = [_model_response("gpt-4o-mini", success=False)]
+        replacement = [_model_response("gpt-4o")]
+        
+        with patch("app.services.router_service.llm_service") as mock_llm, \
+             patch("app.services.router_service.synthesis_service") as mock_synthesis:
+            mock_llm.call_models_parallel = AsyncMock(side_effect=[first_pass, replacement])
+            mock_synthesis.synthesize = AsyncMock()
+            result = await router.route_and_answer("Explain recursion")
+        
+        fallback_call = mock_llm.call_models_parallel.await_args_list[1]
+        assert fallback_call.kwargs["models"] == ["gpt-4o"]
+        assert fallback_call.kwargs["question"] == "Explain recursion"
+        assert result.fallback_used is True
+        assert result.models_used == ["gpt-4o"]
+        assert result.routing_decision.use_synthesis is False
+        mock_synthesis.synthesize.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_partial_failure_keeps_override_models(self):
+        """Test caller-chosen models are not topped up when one of them fails."""
+        router = RouterService()
+        router.clear_answer_cache()
+        first_pass = [_model_response("gpt-4o-mini"), _model_response("gpt-4o", success=False)]
+        
+        with patch("app.services.router_service.llm_service") as mock_llm, \
+             patch("app.services.router_service.synthesis_service") as mock_synthesis:
+            mock_llm.call_models_parallel = AsyncMock(return_value=first_pass)
+            mock_synthesis.synthesize = AsyncMock()
+            result = await router.route_and_answer(
+                "Explain recursion", override_models=["gpt-4o-mini", "gpt-4o"], force_synthesis=True
+            )
+        
+        assert mock_llm.call_models_parallel.await_count == 1
+        assert result.fallback_used is False
+        assert result.routing_decision.use_synthesis is False
+        mock_synthesis.synthesize.assert_not_called()
+        assert result.final_answer == "answer from gpt-4o-mini"
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -14,6 +14,7 @@ export type StreamEventType =
   | 'start'
   | 'classification'
   | 'snapshot'
+  | 'snapshot_delta'
   | 'key_changes'
   | 'narrative'
   | 'insight'
@@ -69,6 +70,7 @@ export interface ClassificationResult {
 export interface StreamingTimeTravelResult {
   // Progressive data
   snapshots: Snapshot[];
+  draftAnswers: Record<string, string>; // date_label -> answer text streamed so far
   narrative: string | null;
   keyChanges: KeyChange[];
   insights: string[];
@@ -105,6 +107,7 @@ export interface UseTimeTravelStreamReturn {
 
 const initialResult: StreamingTimeTravelResult = {
   snapshots: [],
+  draftAnswers: {},
   narrative: null,
   keyChanges: [],
   insights: [],
@@ -184,10 +187,14 @@ export function useTimeTravelStream(
           snapshot: Snapshot;
         };
         
-        setResult(prev => ({
-          ...prev,
-          snapshots: [...prev.snapshots, snapshotData.snapshot],
-        }));
+        setResult(prev => {
+          const { [snapshotData.snapshot.date_label ?? '']: _done, ...draftAnswers } = prev.draftAnswers;
+          return {
+            ...prev,
+            snapshots: [...prev.snapshots, snapshotData.snapshot],
+            draftAnswers,
+          };
+        });
         
         // Progress: snapshots are 10-70%
         const snapshotProgress = 10 + (snapshotData.index / snapshotData.total) * 60;
@@ -197,6 +204,18 @@ export function useTimeTravelStream(
         break;
       }
         
+      case 'snapshot_delta': {
+        const deltaData = eventData as { slot: number; date_label: string; delta: string };
+        setResult(prev => ({
+          ...prev,
+          draftAnswers: {
+            ...prev.draftAnswers,
+            [deltaData.date_label]: (prev.draftAnswers[deltaData.date_label] ?? '') + deltaData.delta,
+          },
+        }));
+        break;
+      }
+        
       case 'key_changes': {
         const changes = eventData as { changes: KeyChange[] };
         setResult(prev => ({
@@ -242,10 +261,10 @@ export function useTimeTravelStream(
       }
         
       case 'insight': {
-        const insightData = eventData as { index: number; insight: string; total: number };
+        const insightData = eventData as { insights: string[]; total: number };
         setResult(prev => ({
           ...prev,
-          insights: [...prev.insights, insightData.insight],
+          insights: insightData.insights || [],
         }));
         break;
       }
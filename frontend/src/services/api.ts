@@ -191,6 +191,7 @@ export interface RouteAndAnswerResponse {
   timestamp: string;
   fallback_used: boolean;
   fallback_reason: string | null;
+  classification_skipped?: boolean;
   // Temporal/Search fields
   temporal_detection?: TemporalDetectionResult;
   was_search_used?: boolean;
@@ -263,6 +264,7 @@ export interface RoutingStats {
   average_savings_percentage: number;
   model_usage_distribution: Record<string, number>;
   fallback_count: number;
+  answer_cache_hits: number;
 }
 
 // Create axios instance with default config